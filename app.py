@@ -1,21 +1,27 @@
 import streamlit as st
 import streamlit.components.v1 as components
-import plotly.graph_objects as go
-import pandas as pd
-import base64
+import hashlib
+import json
 import os
-from io import BytesIO
-from PIL import Image
-from utils.scoring import compute_scores
-from data.dimensions import DIMENSIONS, BRIGHT_PALETTE, get_all_questions
-from utils.pdf_generator import generate_pdf_report
-from utils.html_report_generator import generate_html_report
+from datetime import datetime
+from html import escape as html_escape
+from utils.scoring import ScoreTracker
+from data.dimensions import DIMENSIONS, BRIGHT_PALETTE, ALL_QUESTIONS, QUESTIONS_BY_DIMENSION
 from data.benchmarks import get_benchmark_comparison, get_all_benchmarks, get_benchmark_data
 from db.operations import (ensure_tables_exist, save_assessment)
-from utils.gmail_sender import send_assistance_request_email, send_feedback_email, send_user_registration_email, send_verification_code_email, send_pdf_download_notification, generate_verification_code, send_assessment_completion_email
+from utils.gmail_sender import send_assistance_request_email, send_feedback_email, send_user_registration_email, send_pdf_download_notification, send_assessment_completion_email
 from utils.scoring import generate_executive_summary
+from utils.email_outbox import start_outbox_worker
+from utils.verification import send_verification_code, check_verification_code
+from utils.logo_assets import register_upload, register_logo_file, get_logo_base64
+from utils.report_jobs import submit_report_job, get_report_job
 from utils.ai_chat import get_chat_response, get_assessment_insights
 
+# Heavy dependencies (plotly, pandas, ReportLab, Google API client, OpenAI) are
+# imported where they are first used so app start-up stays fast.
+
+DEFAULT_LOGO_PATH = 'static/TLogic_Logo4.png'
+
 def scroll_to_top():
     """Inject JS snippet that scrolls the window to the top."""
     components.html(
@@ -217,29 +223,44 @@ button.continue-home-btn p {
             unsafe_allow_html=True)
 
 
-def image_to_base64(image, max_height=None):
-    """Convert PIL Image to base64 string, optionally resizing to max height"""
-    if max_height:
-        # Calculate new dimensions maintaining aspect ratio
-        aspect_ratio = image.width / image.height
-        new_height = max_height
-        new_width = int(new_height * aspect_ratio)
-        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-    buffered = BytesIO()
-    image.save(buffered, format="PNG")
-    img_str = base64.b64encode(buffered.getvalue()).decode()
-    return img_str
+def logo_base64(max_height=None):
+    """
+    Get the current company logo as a cached base64 PNG, optionally sized to max height.
+    Falls back to the default logo if the session's logo can no longer be loaded.
+    """
+    if st.session_state.company_logo is None:
+        return None
+    b64 = get_logo_base64(st.session_state.company_logo, height=max_height)
+    if b64 is None:
+        print(f"Logo {st.session_state.company_logo} is unavailable, using the default logo")
+        st.session_state.company_logo = register_logo_file(DEFAULT_LOGO_PATH)
+        b64 = get_logo_base64(st.session_state.company_logo, height=max_height)
+    return b64
+
+
+@st.cache_resource(show_spinner=False)
+def bootstrap_database():
+    """Bootstrap the database schema once per server process, not per browser session"""
+    ready = ensure_tables_exist()
+    if ready:
+        # Deliver emails left in the outbox by earlier processes
+        start_outbox_worker()
+    return ready
 
 
 def initialize_session_state():
     """Initialize session state variables"""
     # Initialize database
     if 'db_initialized' not in st.session_state:
-        st.session_state.db_initialized = ensure_tables_exist()
+        st.session_state.db_initialized = bootstrap_database()
+        if not st.session_state.db_initialized:
+            # Don't cache a failed bootstrap; retry on the next new session
+            bootstrap_database.clear()
 
     if 'answers' not in st.session_state:
         st.session_state.answers = {}
+    if 'score_tracker' not in st.session_state:
+        st.session_state.score_tracker = ScoreTracker(st.session_state.answers)
     if 'current_dimension' not in st.session_state:
         st.session_state.current_dimension = 0
     if 'assessment_complete' not in st.session_state:
@@ -247,12 +268,8 @@ def initialize_session_state():
     if 'current_assessment_id' not in st.session_state:
         st.session_state.current_assessment_id = None
     if 'company_logo' not in st.session_state:
-        # Load default T-Logic logo
-        try:
-            default_logo = Image.open('static/TLogic_Logo4.png')
-            st.session_state.company_logo = default_logo
-        except:
-            st.session_state.company_logo = None
+        # Default T-Logic logo, decoded once per process (stored as a logo asset id)
+        st.session_state.company_logo = register_logo_file(DEFAULT_LOGO_PATH)
     if 'company_name' not in st.session_state:
         st.session_state.company_name = "T-Logic"
     if 'primary_color' not in st.session_state:
@@ -291,6 +308,34 @@ def initialize_session_state():
         st.session_state.show_stage_modal = False
 
 
+def record_answer(question_id, rating):
+    """Store an answer and update the running scores"""
+    st.session_state.answers[question_id] = rating
+    st.session_state.score_tracker.set_answer(question_id, rating)
+
+
+def reset_answers():
+    """Clear all answers, the running scores and any report built from them"""
+    st.session_state.answers = {}
+    st.session_state.score_tracker = ScoreTracker()
+    st.session_state.report_download = None
+
+
+def get_score_tracker():
+    """Get the running score tracker, rebuilding it if answers were changed without record_answer"""
+    tracker = st.session_state.score_tracker
+    # Compares the (at most 18) ratings themselves, so edited answers are caught, not just added ones
+    if tracker.answers != st.session_state.answers:
+        tracker = ScoreTracker(st.session_state.answers)
+        st.session_state.score_tracker = tracker
+    return tracker
+
+
+def get_current_scores():
+    """Get scores for the current answers without re-aggregating them"""
+    return get_score_tracker().snapshot()
+
+
 def render_header():
     """Render the main header with logo and branding"""
     col1, col2 = st.columns([4, 1])
@@ -304,11 +349,12 @@ def render_header():
             unsafe_allow_html=True)
 
     with col2:
-        if st.session_state.company_logo is not None:
+        header_logo = logo_base64(max_height=105)
+        if header_logo is not None:
             # Logo sized at 105px (same as Results page)
             st.markdown(f"""
                 <div style="text-align: right; height: 105px; overflow: visible; margin-left: auto; display: flex; align-items: center; justify-content: flex-end;">
-                    <img src="data:image/png;base64,{image_to_base64(st.session_state.company_logo, max_height=105)}" 
+                    <img src="data:image/png;base64,{header_logo}" 
                          style="height: 105px; width: auto; display: block; border: none; background: transparent;" />
                 </div>
                 """,
@@ -356,8 +402,8 @@ def render_branding_sidebar():
 
         if uploaded_file is not None:
             try:
-                image = Image.open(uploaded_file)
-                st.session_state.company_logo = image
+                # Only decodes the upload the first time these bytes are seen
+                st.session_state.company_logo = register_upload(uploaded_file.getvalue())
                 st.success("Logo uploaded successfully!")
             except Exception as e:
                 st.error(f"Error uploading logo: {str(e)}")
@@ -487,6 +533,7 @@ def render_dimension_questions(dimension_idx):
     scroll_to_top()
     
     dimension = DIMENSIONS[dimension_idx]
+    questions = QUESTIONS_BY_DIMENSION[dimension_idx]
 
     # --- Dimension page helper: ALWAYS scroll to top when entering dimension page ---
     components.html("""
@@ -590,11 +637,13 @@ def render_dimension_questions(dimension_idx):
 
     def on_answer_change(question_id, question_idx):
         """Callback when a question is answered"""
+        record_answer(question_id, st.session_state[f"q_{question_id}"])
+
         # Only trigger scroll if not the last question
-        if question_idx < len(dimension['questions']) - 1:
+        if question_idx < len(questions) - 1:
             st.session_state.scroll_to_question = question_idx + 1
 
-    for i, question in enumerate(dimension['questions']):
+    for i, question in enumerate(questions):
         question_id = f"q_{question['id']}"
 
         # Create unique anchor for each question
@@ -628,7 +677,9 @@ def render_dimension_questions(dimension_idx):
             args=(question['id'], i),
             label_visibility="collapsed")
 
-        st.session_state.answers[question['id']] = rating
+        # Radio changes are recorded by on_answer_change; this only records first-shown defaults
+        if st.session_state.answers.get(question['id']) != rating:
+            record_answer(question['id'], rating)
         st.markdown('<div style="margin: -0.4rem 0 -0.3rem 0;"><hr style="margin: 0.15rem 0;"></hr></div>', unsafe_allow_html=True)
 
     # Execute auto-scroll script only if scroll is triggered for a specific question
@@ -688,7 +739,7 @@ def render_navigation_buttons():
 
     with col2:
         if st.button("Reset Assessment", type="secondary"):
-            st.session_state.answers = {}
+            reset_answers()
             st.session_state.current_dimension = 0
             st.session_state.assessment_complete = False
             st.session_state.user_info_collected = False
@@ -710,7 +761,7 @@ def render_navigation_buttons():
         else:
             if st.button("Complete Assessment", type="primary"):
                 # Calculate scores
-                scores_data = compute_scores(st.session_state.answers)
+                scores_data = get_current_scores()
 
                 # Save to database
                 try:
@@ -748,6 +799,7 @@ def render_navigation_buttons():
 
 def create_dimension_breakdown_chart(raw_scores, dimension_titles, dimension_colors):
     """Create spider/radar chart for dimension scores"""
+    import plotly.graph_objects as go
     
     # Calculate percentages (raw score out of 15)
     percentages = [(score / 15) * 100 for score in raw_scores]
@@ -801,18 +853,253 @@ def create_dimension_breakdown_chart(raw_scores, dimension_titles, dimension_col
     return fig
 
 
-def render_results_dashboard():
-    """Render the results dashboard"""
-    # Calculate scores
-    scores_data = compute_scores(st.session_state.answers)
-    dimension_scores_raw = scores_data['dimension_scores']
-    total_score = scores_data['total']
-    percentage = scores_data['percentage']
-    readiness_band = scores_data['readiness_band']
+def build_scoring_table_html(total_score, primary_color):
+    """Build the scoring model table HTML, highlighting the row for the total score"""
+    # Define scoring model data
+    scoring_model = [{
+        "range": "0-41",
+        "level": "🟥 Not Ready",
+        "meaning": "High risk; focus on business fundamentals first. Significant foundational work required before AI deployment.",
+        "min": 0,
+        "max": 41
+    }, {
+        "range": "42-55",
+        "level": "🟨 Foundational Gaps",
+        "meaning": "Significant work needed; start with process and data basics. Address foundational gaps before scaling.",
+        "min": 42,
+        "max": 55
+    }, {
+        "range": "56-69",
+        "level": "🟦 Building Blocks",
+        "meaning": "Address 1-2 weak dimensions before scaling. You have a foundation to build upon with focused improvements.",
+        "min": 56,
+        "max": 69
+    }, {
+        "range": "70-90",
+        "level": "🟩 AI-Ready",
+        "meaning": "Strong foundation; focus on strategic pilots. Your organization is well-positioned for AI implementation.",
+        "min": 70,
+        "max": 90
+    }]
+
+    # Create table with clean, properly aligned cells
+    # Map emoji colors to their hex equivalents for CSS squares
+    color_map = {
+        "🟥 Not Ready": ("#DC2626", "Not Ready"),
+        "🟨 Foundational Gaps": ("#EAB308", "Foundational Gaps"),
+        "🟦 Building Blocks": ("#42A5F5", "Building Blocks"),
+        "🟩 AI-Ready": ("#16A34A", "AI-Ready")
+    }
+
+    # Build table rows
+    table_rows = ""
+    for row in scoring_model:
+        is_current = row['min'] <= total_score <= row['max']
+        bg_color = '#1F2937' if is_current else '#111827'
+        box_shadow = f'box-shadow: inset 0 0 0 2px {primary_color};' if is_current else ''
+        font_weight = 'bold' if is_current else 'normal'
+
+        color_hex, level_text = color_map[row["level"]]
+
+        table_rows += f'<tr style="background-color: {bg_color};"><td style="padding: 1rem; text-align: center; border: 1px solid #4B5563; {box_shadow} font-weight: {font_weight}; vertical-align: middle;">{row["range"]}</td><td style="padding: 1rem; text-align: center; border: 1px solid #4B5563; {box_shadow} font-weight: {font_weight}; vertical-align: middle;"><span style="display: inline-block; width: 10px; height: 10px; margin-right: 6px; vertical-align: baseline; position: relative; top: 1px; background-color: {color_hex};"></span>{level_text}</td><td style="padding: 1rem; text-align: left; border: 1px solid #4B5563; {box_shadow} font-weight: {font_weight}; vertical-align: middle;">{row["meaning"]}</td></tr>'
+
+    # Complete table HTML
+    table_html = f'<table style="width: 100%; border-collapse: collapse; margin-bottom: 2rem;"><thead><tr style="background-color: #374151;"><th style="padding: 1rem; text-align: center; border: 1px solid #4B5563; vertical-align: middle;">Score Range</th><th style="padding: 1rem; text-align: center; border: 1px solid #4B5563; vertical-align: middle;">Readiness Level</th><th style="padding: 1rem; text-align: left; border: 1px solid #4B5563; vertical-align: middle;">Meaning</th></tr></thead><tbody>{table_rows}</tbody></table>'
+
+    return table_html
+
+
+def build_recommendation_cards(answers):
+    """Build the per-dimension insight and recommendation cards (HTML) for the given answers"""
+    # Analyze each dimension holistically
+    dimension_analyses = []
+
+    for dim_idx, dimension in enumerate(DIMENSIONS):
+        # Calculate dimension average score
+        dim_scores = []
+        for question in QUESTIONS_BY_DIMENSION[dim_idx]:
+            score = answers.get(question['id'], 3)
+            dim_scores.append(score)
+
+        avg_score = sum(dim_scores) / len(dim_scores) if dim_scores else 0
+
+        # Count strengths (4-5) and weaknesses (1-3)
+        strengths = [s for s in dim_scores if s >= 4]
+        weaknesses = [s for s in dim_scores if s <= 3]
+
+        dimension_analyses.append({
+            'dimension': dimension,
+            'avg_score': avg_score,
+            'strengths_count': len(strengths),
+            'weaknesses_count': len(weaknesses),
+            'total_questions': len(dim_scores)
+        })
+
+    # Generate holistic recommendations for each dimension
+    cards = []
+    for analysis in dimension_analyses:
+        dimension = analysis['dimension']
+        avg_score = analysis['avg_score']
+        strengths_count = analysis['strengths_count']
+        weaknesses_count = analysis['weaknesses_count']
+        total = analysis['total_questions']
+
+        # Determine insight based on score distribution
+        if avg_score >= 4.0:
+            insight = f"🌟 **Strong Foundation:** Your {dimension['title'].lower()} shows excellent maturity with {strengths_count}/{total} areas rated highly. This dimension is a key strength that can serve as a foundation for AI implementation."
+        elif avg_score >= 3.0:
+            insight = f"✅ **Solid Progress:** Your {dimension['title'].lower()} demonstrates good progress with {strengths_count} strong area(s) and {weaknesses_count} area(s) needing attention. Building on your strengths while addressing gaps will accelerate readiness."
+        else:
+            insight = f"📈 **Growth Opportunity:** Your {dimension['title'].lower()} presents a significant opportunity for improvement. With focused attention on {weaknesses_count} key area(s), you can build the foundation needed for successful AI adoption."
+
+        # Dimension-specific recommendations
+        recommendations_map = {
+            'process': [
+                "Document and standardize critical business processes with clear workflows and performance metrics",
+                "Implement regular process monitoring and variation analysis to identify optimization opportunities",
+                "Establish a continuous improvement culture with data-driven decision making",
+                "Create process maps that highlight where AI could deliver the most impact"
+            ],
+            'data': [
+                "Digitize manual data collection processes and eliminate paper-based workflows",
+                "Implement data quality frameworks including cleaning, validation, and integration protocols",
+                "Build historical data repositories with proper governance and accessibility controls",
+                "Ensure data is structured and labeled appropriately for AI model training",
+                "Address any data silos by creating unified data access layers"
+            ],
+            'tech': [
+                "Develop API-first infrastructure to enable seamless AI integration",
+                "Invest in secure cloud or hybrid systems with scalability in mind",
+                "Establish AI experimentation platforms or sandboxes for safe testing",
+                "Ensure robust cybersecurity measures are in place before AI deployment",
+                "Evaluate and select AI/ML platforms aligned with your use cases"
+            ],
+            'people': [
+                "Launch AI literacy and awareness programs across all organizational levels",
+                "Provide hands-on training in data-driven decision making and AI tools",
+                "Identify and empower AI champions who can drive adoption within teams",
+                "Create cross-functional teams to bridge technical and business expertise",
+                "Develop clear career paths that reward AI skill development"
+            ],
+            'leadership': [
+                "Integrate AI into strategic planning with clear business objectives and ROI expectations",
+                "Secure executive sponsorship and dedicated funding for AI pilots and initiatives",
+                "Align AI goals with measurable business outcomes and KPIs",
+                "Establish governance frameworks for ethical AI use and risk management",
+                "Communicate a compelling AI vision that connects to organizational mission"
+            ],
+            'change': [
+                "Foster a culture of experimentation where failure is treated as a learning opportunity",
+                "Encourage cross-functional collaboration to break down departmental barriers",
+                "Develop frameworks for scaling successful AI pilots across the organization",
+                "Create feedback loops to continuously refine AI initiatives based on results",
+                "Build change management capacity to support AI-driven transformations"
+            ]
+        }
+
+        recommendations = recommendations_map.get(
+            dimension['id'],
+            ["Focus on building foundational capabilities in this area."])
+
+        # Display dimension analysis card with recommendations inside
+        recommendations_html = "".join([
+            f'<p style="color: #D1D5DB; line-height: 1.5; margin-left: 1rem; margin-top: 0.5rem; margin-bottom: 0.5rem;">• {rec}</p>'
+            for rec in recommendations
+        ])
+
+        cards.append(f"""
+        <div style="background-color: #374151; border-left: 4px solid {dimension['color']}; padding: 1.5rem; margin: 1rem 0; border-radius: 0.5rem;">
+            <h4 style="color: {dimension['color']}; margin-bottom: 1rem;">📌 {dimension['title']}</h4>
+            <p style="color: #E5E7EB; line-height: 1.6; margin-bottom: 1rem;">{insight}</p>
+            <p style="color: #D1D5DB; margin-bottom: 0.5rem;"><strong>Specific Recommendations:</strong></p>
+            {recommendations_html}
+        </div>
+        """)
+
+    return cards
+
+
+def create_benchmark_comparison_chart(comparison, primary_color):
+    """Create grouped bar chart comparing dimension scores with a benchmark"""
+    import plotly.graph_objects as go
+
+    # Create comparison chart
+    dimension_names = [d['title'] for d in comparison['dimensions']]
+    your_scores_list = [d['your_score'] for d in comparison['dimensions']]
+    benchmark_scores_list = [
+        d['benchmark_score'] for d in comparison['dimensions']
+    ]
+
+    fig_comparison = go.Figure()
+
+    # Add your scores with text labels
+    fig_comparison.add_trace(
+        go.Bar(name='Your Scores',
+               x=dimension_names,
+               y=your_scores_list,
+               marker_color=primary_color,
+               text=[f'{score:.1f}' for score in your_scores_list],
+               textposition='outside'))
+
+    # Add benchmark scores with text labels
+    fig_comparison.add_trace(
+        go.Bar(name='Average of All Submissions',
+               x=dimension_names,
+               y=benchmark_scores_list,
+               marker_color='#6B7280',
+               text=[f'{score:.1f}' for score in benchmark_scores_list],
+               textposition='outside'))
+
+    fig_comparison.update_layout(barmode='group',
+                                 plot_bgcolor='rgba(0,0,0,0)',
+                                 paper_bgcolor='rgba(0,0,0,0)',
+                                 font=dict(color='white'),
+                                 yaxis=dict(title='Score',
+                                            range=[0, 15.5],
+                                            gridcolor='rgba(255,255,255,0.2)'),
+                                 xaxis=dict(gridcolor='rgba(255,255,255,0.2)'),
+                                 legend=dict(orientation="h",
+                                             yanchor="bottom",
+                                             y=1.02,
+                                             xanchor="right",
+                                             x=1),
+                                 height=400)
+
+    return fig_comparison
+
+
+def answers_fingerprint(answers):
+    """Stable hash of an answers dictionary"""
+    return hashlib.sha256(json.dumps(sorted(answers.items())).encode()).hexdigest()
+
+
+def get_results_view():
+    """
+    Get the results dashboard view model for the current answers.
+    
+    Scores, executive summary, scoring table, radar chart and recommendation
+    cards depend only on the answers (and the brand color), so they are built
+    once per answers fingerprint and reused across reruns.
+    
+    Returns:
+        Dictionary with scores_data, executive_summary, scoring_table_html,
+        radar_figure, recommendation_cards and a per-benchmark cache
+    """
+    from utils.figure_cache import get_cached_figure
+
+    answers = st.session_state.answers
+    primary_color = st.session_state.primary_color
+    key = (answers_fingerprint(answers), primary_color)
+
+    view = st.session_state.get('results_view')
+    if view is not None and view['key'] == key:
+        return view
+
+    scores_data = get_current_scores()
 
     # Format dimension scores for display (combine with dimension info)
     dimension_scores = []
-    for i, score in enumerate(dimension_scores_raw):
+    for i, score in enumerate(scores_data['dimension_scores']):
         dimension_scores.append({
             'id': DIMENSIONS[i]['id'],
             'title': DIMENSIONS[i]['title'],
@@ -824,6 +1111,165 @@ def render_results_dashboard():
     # Update scores_data with formatted dimension scores for benchmark comparison
     scores_data['dimension_scores'] = dimension_scores
 
+    dimension_titles = [d['title'] for d in DIMENSIONS]
+    view = {
+        'key': key,
+        'scores_data': scores_data,
+        'executive_summary': generate_executive_summary(scores_data),
+        'scoring_table_html': build_scoring_table_html(scores_data['total'], primary_color),
+        'radar_figure': get_cached_figure(
+            ('radar', tuple(scores_data['raw_dimension_scores']), tuple(dimension_titles)),
+            lambda: create_dimension_breakdown_chart(
+                scores_data['raw_dimension_scores'], dimension_titles, BRIGHT_PALETTE)),
+        'recommendation_cards': build_recommendation_cards(answers),
+        'benchmarks': {}
+    }
+    st.session_state.results_view = view
+    return view
+
+
+def get_benchmark_view(view, benchmark_name):
+    """
+    Get the benchmark comparison for a results view. The table and figure are
+    reused until the comparison changes (the moving average benchmark moves
+    as other assessments are submitted).
+    
+    Returns:
+        Dictionary with comparison, figure and table (DataFrame)
+    """
+    # Get comparison data; cheap, and the moving average is cached per process
+    from data.benchmarks import get_benchmark_comparison as get_comp
+    comparison = get_comp(view['scores_data'], benchmark_name)
+
+    benchmark_view = view['benchmarks'].get(benchmark_name)
+    if benchmark_view is not None and benchmark_view['comparison'] == comparison:
+        return benchmark_view
+
+    import pandas as pd
+    from utils.figure_cache import get_cached_figure
+
+    comparison_data = []
+    for dim in comparison['dimensions']:
+        diff = dim['difference']
+        status = '✅' if diff >= 0 else '⚠️'
+        diff_color = '🟢' if diff >= 0 else '🔴'
+        comparison_data.append({
+            'Dimension': dim['title'],
+            'Your Score': f"{dim['your_score']}/15",
+            'Benchmark': f"{dim['benchmark_score']:.1f}/15",
+            'Difference': f"{diff_color} {diff:+.1f}",
+            'Status': status
+        })
+
+    primary_color = view['key'][1]
+    figure_key = (
+        'benchmark_comparison',
+        tuple(d['your_score'] for d in comparison['dimensions']),
+        tuple(d['benchmark_score'] for d in comparison['dimensions']),
+        primary_color,
+        tuple(d['title'] for d in comparison['dimensions'])
+    )
+    benchmark_view = {
+        'comparison': comparison,
+        'figure': get_cached_figure(
+            figure_key, lambda: create_benchmark_comparison_chart(comparison, primary_color)),
+        'table': pd.DataFrame(comparison_data)
+    }
+    view['benchmarks'][benchmark_name] = benchmark_view
+    return benchmark_view
+
+
+def html_report_kwargs(assessment_date):
+    """Arguments for the session's HTML report, rebuilt from its answers and branding"""
+    return {
+        'scores_data': get_results_view()['scores_data'],
+        'company_name': st.session_state.user_company,
+        'company_logo_b64': logo_base64(),
+        'primary_color': st.session_state.primary_color,
+        'assessment_date': assessment_date
+    }
+
+
+# Report kind -> builder of its generator arguments from the session
+REPORT_KWARGS_BUILDERS = {
+    'html': html_report_kwargs,
+}
+
+
+def submit_report_download(kind, filename, mime, assessment_date):
+    """
+    Queue a report for background rendering and remember it for this session's download.
+    The session keeps only the job reference; the report arguments are rebuilt from
+    its answers if the job has to be submitted again.
+    """
+    st.session_state.report_download = {
+        'job_id': submit_report_job(kind, **REPORT_KWARGS_BUILDERS[kind](assessment_date)),
+        'kind': kind,
+        'filename': filename,
+        'mime': mime,
+        'assessment_date': assessment_date
+    }
+
+
+@st.fragment(run_every=1)
+def render_report_progress():
+    """Poll the pending report job without rerunning the whole page"""
+    job = get_report_job(st.session_state.report_download['job_id'])
+    if job['status'] == 'pending':
+        st.info("⏳ Email verified! Preparing your report...")
+    else:
+        st.rerun()
+
+
+def render_report_download():
+    """Show the progress or download button for the session's queued report"""
+    download = st.session_state.report_download
+    job = get_report_job(download['job_id'])
+
+    if job['status'] == 'unknown':
+        # Evicted or lost with a worker restart - render it again
+        download['job_id'] = submit_report_job(
+            download['kind'], **REPORT_KWARGS_BUILDERS[download['kind']](download['assessment_date']))
+        job = get_report_job(download['job_id'])
+
+    if job['status'] == 'pending':
+        render_report_progress()
+    elif job['status'] == 'failed':
+        st.error(f"Error generating report: {job['error']}")
+        st.session_state.report_download = None
+    else:
+        st.success("✅ Email verified! Your report is ready.")
+
+        if st.get_option("server.enableStaticServing"):
+            # Served from disk in chunks by Streamlit's static endpoint; nothing is kept per session
+            st.markdown(
+                f'<a href="{job["url"]}" download="{html_escape(download["filename"])}" '
+                f'style="display: block; text-align: center; padding: 0.5rem 1rem; border-radius: 0.5rem; '
+                f'background-color: {st.session_state.primary_color}; color: white; text-decoration: none; '
+                f'font-weight: 600;">📥 Download Report Now</a>',
+                unsafe_allow_html=True
+            )
+        else:
+            # Static serving disabled: fall back to Streamlit's native download button
+            with open(job['path'], 'rb') as f:
+                st.download_button(
+                    label="📥 Download Report Now",
+                    data=f.read(),
+                    file_name=download['filename'],
+                    mime=download['mime'],
+                    use_container_width=True
+                )
+
+
+def render_results_dashboard():
+    """Render the results dashboard"""
+    # Answers are frozen on the results page; heavy work is cached per answers fingerprint
+    view = get_results_view()
+    scores_data = view['scores_data']
+    total_score = scores_data['total']
+    percentage = scores_data['percentage']
+    readiness_band = scores_data['readiness_band']
+
     primary_color = st.session_state.primary_color
 
     # Header with logo (same layout as home page)
@@ -835,11 +1281,12 @@ def render_results_dashboard():
             unsafe_allow_html=True)
 
     with col2:
-        if st.session_state.company_logo is not None:
+        header_logo = logo_base64(max_height=105)
+        if header_logo is not None:
             # Logo sized at 105px (50% larger than previous 70px)
             st.markdown(f"""
                 <div style="text-align: right; height: 105px; overflow: visible; margin-left: auto; display: flex; align-items: center; justify-content: flex-end;">
-                    <img src="data:image/png;base64,{image_to_base64(st.session_state.company_logo, max_height=105)}" 
+                    <img src="data:image/png;base64,{header_logo}" 
                          style="height: 105px; width: auto; display: block; border: none; background: transparent;" />
                 </div>
                 """,
@@ -1051,58 +1498,7 @@ def render_results_dashboard():
         f'<h3 style="color: {primary_color}; text-align: center; margin-bottom: 1rem;">📊 Scoring Model</h3>',
         unsafe_allow_html=True)
 
-    # Define scoring model data
-    scoring_model = [{
-        "range": "0-41",
-        "level": "🟥 Not Ready",
-        "meaning": "High risk; focus on business fundamentals first. Significant foundational work required before AI deployment.",
-        "min": 0,
-        "max": 41
-    }, {
-        "range": "42-55",
-        "level": "🟨 Foundational Gaps",
-        "meaning": "Significant work needed; start with process and data basics. Address foundational gaps before scaling.",
-        "min": 42,
-        "max": 55
-    }, {
-        "range": "56-69",
-        "level": "🟦 Building Blocks",
-        "meaning": "Address 1-2 weak dimensions before scaling. You have a foundation to build upon with focused improvements.",
-        "min": 56,
-        "max": 69
-    }, {
-        "range": "70-90",
-        "level": "🟩 AI-Ready",
-        "meaning": "Strong foundation; focus on strategic pilots. Your organization is well-positioned for AI implementation.",
-        "min": 70,
-        "max": 90
-    }]
-
-    # Create table with clean, properly aligned cells
-    # Map emoji colors to their hex equivalents for CSS squares
-    color_map = {
-        "🟥 Not Ready": ("#DC2626", "Not Ready"),
-        "🟨 Foundational Gaps": ("#EAB308", "Foundational Gaps"),
-        "🟦 Building Blocks": ("#42A5F5", "Building Blocks"),
-        "🟩 AI-Ready": ("#16A34A", "AI-Ready")
-    }
-
-    # Build table rows
-    table_rows = ""
-    for row in scoring_model:
-        is_current = row['min'] <= total_score <= row['max']
-        bg_color = '#1F2937' if is_current else '#111827'
-        box_shadow = f'box-shadow: inset 0 0 0 2px {primary_color};' if is_current else ''
-        font_weight = 'bold' if is_current else 'normal'
-
-        color_hex, level_text = color_map[row["level"]]
-
-        table_rows += f'<tr style="background-color: {bg_color};"><td style="padding: 1rem; text-align: center; border: 1px solid #4B5563; {box_shadow} font-weight: {font_weight}; vertical-align: middle;">{row["range"]}</td><td style="padding: 1rem; text-align: center; border: 1px solid #4B5563; {box_shadow} font-weight: {font_weight}; vertical-align: middle;"><span style="display: inline-block; width: 10px; height: 10px; margin-right: 6px; vertical-align: baseline; position: relative; top: 1px; background-color: {color_hex};"></span>{level_text}</td><td style="padding: 1rem; text-align: left; border: 1px solid #4B5563; {box_shadow} font-weight: {font_weight}; vertical-align: middle;">{row["meaning"]}</td></tr>'
-
-    # Complete table HTML
-    table_html = f'<table style="width: 100%; border-collapse: collapse; margin-bottom: 2rem;"><thead><tr style="background-color: #374151;"><th style="padding: 1rem; text-align: center; border: 1px solid #4B5563; vertical-align: middle;">Score Range</th><th style="padding: 1rem; text-align: center; border: 1px solid #4B5563; vertical-align: middle;">Readiness Level</th><th style="padding: 1rem; text-align: left; border: 1px solid #4B5563; vertical-align: middle;">Meaning</th></tr></thead><tbody>{table_rows}</tbody></table>'
-
-    st.markdown(table_html, unsafe_allow_html=True)
+    st.markdown(view['scoring_table_html'], unsafe_allow_html=True)
 
     # Executive Summary Section
     st.markdown("<br>", unsafe_allow_html=True)
@@ -1110,7 +1506,7 @@ def render_results_dashboard():
         f'<h3 style="color: {primary_color}; text-align: center; margin-bottom: 1rem;">📋 Executive Summary</h3>',
         unsafe_allow_html=True)
     
-    executive_summary = generate_executive_summary(scores_data)
+    executive_summary = view['executive_summary']
     
     st.markdown(f"""
     <div style="background-color: #1F2937; border-left: 4px solid {primary_color}; padding: 1.5rem; margin: 1rem 0; border-radius: 0.5rem; line-height: 1.8;">
@@ -1136,11 +1532,7 @@ def render_results_dashboard():
 
     # Dimension Breakdown Chart (Spider/Radar)
     st.markdown(f'<h3 style="font-size: 18px; color: {primary_color}; font-weight: bold;">Dimension Breakdown</h3>', unsafe_allow_html=True)
-    raw_scores_list = scores_data['raw_dimension_scores']
-    dimension_titles = [d['title'] for d in DIMENSIONS]
-    dimension_colors = BRIGHT_PALETTE
-    fig = create_dimension_breakdown_chart(raw_scores_list, dimension_titles, dimension_colors)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(view['radar_figure'], use_container_width=True)
 
     # Benchmark Comparison Section
     st.markdown("---")
@@ -1162,9 +1554,8 @@ def render_results_dashboard():
             benchmark_info = get_benchmark_data(benchmark_name)
             st.info(benchmark_info['description'])
 
-        # Get comparison data
-        from data.benchmarks import get_benchmark_comparison as get_comp
-        comparison = get_comp(scores_data, benchmark_name)
+        benchmark_view = get_benchmark_view(view, benchmark_name)
+        comparison = benchmark_view['comparison']
 
         # Comparison summary
         col1, col2, col3 = st.columns(3)
@@ -1206,68 +1597,12 @@ def render_results_dashboard():
         # Dimension-by-dimension comparison
         st.markdown("#### Dimension Comparison")
 
-        # Create comparison chart
-        dimension_names = [d['title'] for d in comparison['dimensions']]
-        your_scores_list = [d['your_score'] for d in comparison['dimensions']]
-        benchmark_scores_list = [
-            d['benchmark_score'] for d in comparison['dimensions']
-        ]
-
-        fig_comparison = go.Figure()
-
-        # Add your scores with text labels
-        fig_comparison.add_trace(
-            go.Bar(name='Your Scores',
-                   x=dimension_names,
-                   y=your_scores_list,
-                   marker_color=primary_color,
-                   text=[f'{score:.1f}' for score in your_scores_list],
-                   textposition='outside'))
-
-        # Add benchmark scores with text labels
-        fig_comparison.add_trace(
-            go.Bar(name='Average of All Submissions',
-                   x=dimension_names,
-                   y=benchmark_scores_list,
-                   marker_color='#6B7280',
-                   text=[f'{score:.1f}' for score in benchmark_scores_list],
-                   textposition='outside'))
-
-        fig_comparison.update_layout(barmode='group',
-                                     plot_bgcolor='rgba(0,0,0,0)',
-                                     paper_bgcolor='rgba(0,0,0,0)',
-                                     font=dict(color='white'),
-                                     yaxis=dict(title='Score',
-                                                range=[0, 15.5],
-                                                gridcolor='rgba(255,255,255,0.2)'),
-                                     xaxis=dict(gridcolor='rgba(255,255,255,0.2)'),
-                                     legend=dict(orientation="h",
-                                                 yanchor="bottom",
-                                                 y=1.02,
-                                                 xanchor="right",
-                                                 x=1),
-                                     height=400)
-
-        st.plotly_chart(fig_comparison, use_container_width=True)
+        st.plotly_chart(benchmark_view['figure'], use_container_width=True)
 
         # Detailed comparison table
         st.markdown("#### Detailed Comparison")
 
-        comparison_data = []
-        for dim in comparison['dimensions']:
-            diff = dim['difference']
-            status = '✅' if diff >= 0 else '⚠️'
-            diff_color = '🟢' if diff >= 0 else '🔴'
-            comparison_data.append({
-                'Dimension': dim['title'],
-                'Your Score': f"{dim['your_score']}/15",
-                'Benchmark': f"{dim['benchmark_score']:.1f}/15",
-                'Difference': f"{diff_color} {diff:+.1f}",
-                'Status': status
-            })
-
-        df_comparison = pd.DataFrame(comparison_data)
-        st.dataframe(df_comparison, use_container_width=True, hide_index=True)
+        st.dataframe(benchmark_view['table'], use_container_width=True, hide_index=True)
     except Exception as e:
         st.error(f"Unable to load benchmark comparison: {str(e)}")
 
@@ -1280,110 +1615,8 @@ def render_results_dashboard():
         '<p style="text-align: center; color: #9CA3AF; margin-bottom: 1.5rem; font-size: 1.1rem;">*Based on your assessment, here are holistic insights and specific recommendations to accelerate your AI readiness journey. This assessment provides a high-level representation based on subjective inputs and should not be interpreted as definitive readiness without a thorough professional evaluation.</p>',
         unsafe_allow_html=True)
 
-    # Analyze each dimension holistically
-    dimension_analyses = []
-
-    for dim_idx, dimension in enumerate(DIMENSIONS):
-        # Calculate dimension average score
-        dim_scores = []
-        for question in dimension['questions']:
-            score = st.session_state.answers.get(question['id'], 3)
-            dim_scores.append(score)
-
-        avg_score = sum(dim_scores) / len(dim_scores) if dim_scores else 0
-
-        # Count strengths (4-5) and weaknesses (1-3)
-        strengths = [s for s in dim_scores if s >= 4]
-        weaknesses = [s for s in dim_scores if s <= 3]
-
-        dimension_analyses.append({
-            'dimension': dimension,
-            'avg_score': avg_score,
-            'strengths_count': len(strengths),
-            'weaknesses_count': len(weaknesses),
-            'total_questions': len(dim_scores)
-        })
-
-    # Generate holistic recommendations for each dimension
-    for analysis in dimension_analyses:
-        dimension = analysis['dimension']
-        avg_score = analysis['avg_score']
-        strengths_count = analysis['strengths_count']
-        weaknesses_count = analysis['weaknesses_count']
-        total = analysis['total_questions']
-
-        # Determine insight based on score distribution
-        if avg_score >= 4.0:
-            insight = f"🌟 **Strong Foundation:** Your {dimension['title'].lower()} shows excellent maturity with {strengths_count}/{total} areas rated highly. This dimension is a key strength that can serve as a foundation for AI implementation."
-        elif avg_score >= 3.0:
-            insight = f"✅ **Solid Progress:** Your {dimension['title'].lower()} demonstrates good progress with {strengths_count} strong area(s) and {weaknesses_count} area(s) needing attention. Building on your strengths while addressing gaps will accelerate readiness."
-        else:
-            insight = f"📈 **Growth Opportunity:** Your {dimension['title'].lower()} presents a significant opportunity for improvement. With focused attention on {weaknesses_count} key area(s), you can build the foundation needed for successful AI adoption."
-
-        # Dimension-specific recommendations
-        recommendations_map = {
-            'process': [
-                "Document and standardize critical business processes with clear workflows and performance metrics",
-                "Implement regular process monitoring and variation analysis to identify optimization opportunities",
-                "Establish a continuous improvement culture with data-driven decision making",
-                "Create process maps that highlight where AI could deliver the most impact"
-            ],
-            'data': [
-                "Digitize manual data collection processes and eliminate paper-based workflows",
-                "Implement data quality frameworks including cleaning, validation, and integration protocols",
-                "Build historical data repositories with proper governance and accessibility controls",
-                "Ensure data is structured and labeled appropriately for AI model training",
-                "Address any data silos by creating unified data access layers"
-            ],
-            'tech': [
-                "Develop API-first infrastructure to enable seamless AI integration",
-                "Invest in secure cloud or hybrid systems with scalability in mind",
-                "Establish AI experimentation platforms or sandboxes for safe testing",
-                "Ensure robust cybersecurity measures are in place before AI deployment",
-                "Evaluate and select AI/ML platforms aligned with your use cases"
-            ],
-            'people': [
-                "Launch AI literacy and awareness programs across all organizational levels",
-                "Provide hands-on training in data-driven decision making and AI tools",
-                "Identify and empower AI champions who can drive adoption within teams",
-                "Create cross-functional teams to bridge technical and business expertise",
-                "Develop clear career paths that reward AI skill development"
-            ],
-            'leadership': [
-                "Integrate AI into strategic planning with clear business objectives and ROI expectations",
-                "Secure executive sponsorship and dedicated funding for AI pilots and initiatives",
-                "Align AI goals with measurable business outcomes and KPIs",
-                "Establish governance frameworks for ethical AI use and risk management",
-                "Communicate a compelling AI vision that connects to organizational mission"
-            ],
-            'change': [
-                "Foster a culture of experimentation where failure is treated as a learning opportunity",
-                "Encourage cross-functional collaboration to break down departmental barriers",
-                "Develop frameworks for scaling successful AI pilots across the organization",
-                "Create feedback loops to continuously refine AI initiatives based on results",
-                "Build change management capacity to support AI-driven transformations"
-            ]
-        }
-
-        recommendations = recommendations_map.get(
-            dimension['id'],
-            ["Focus on building foundational capabilities in this area."])
-
-        # Display dimension analysis card with recommendations inside
-        recommendations_html = "".join([
-            f'<p style="color: #D1D5DB; line-height: 1.5; margin-left: 1rem; margin-top: 0.5rem; margin-bottom: 0.5rem;">• {rec}</p>'
-            for rec in recommendations
-        ])
-
-        st.markdown(f"""
-        <div style="background-color: #374151; border-left: 4px solid {dimension['color']}; padding: 1.5rem; margin: 1rem 0; border-radius: 0.5rem;">
-            <h4 style="color: {dimension['color']}; margin-bottom: 1rem;">📌 {dimension['title']}</h4>
-            <p style="color: #E5E7EB; line-height: 1.6; margin-bottom: 1rem;">{insight}</p>
-            <p style="color: #D1D5DB; margin-bottom: 0.5rem;"><strong>Specific Recommendations:</strong></p>
-            {recommendations_html}
-        </div>
-        """,
-                    unsafe_allow_html=True)
+    for card_html in view['recommendation_cards']:
+        st.markdown(card_html, unsafe_allow_html=True)
 
         st.markdown("<br>", unsafe_allow_html=True)
 
@@ -1538,7 +1771,7 @@ def render_results_dashboard():
 
     with col1:
         if st.button("Retake Assessment", type="primary", use_container_width=True):
-            st.session_state.answers = {}
+            reset_answers()
             st.session_state.current_dimension = 0
             st.session_state.assessment_complete = False
             st.session_state.user_info_collected = False
@@ -1569,8 +1802,6 @@ def render_results_dashboard():
             st.session_state.verification_email = st.session_state.user_email or ""
         if 'verification_code_sent' not in st.session_state:
             st.session_state.verification_code_sent = False
-        if 'verification_code_expected' not in st.session_state:
-            st.session_state.verification_code_expected = ""
         if 'verification_step' not in st.session_state:
             st.session_state.verification_step = "email"  # email or code
         if 'download_type' not in st.session_state:
@@ -1594,15 +1825,10 @@ def render_results_dashboard():
                     if not st.session_state.verification_email.strip():
                         st.error("Please enter your email address.")
                     else:
-                        # Generate and send verification code
-                        verification_code = generate_verification_code()
-                        success, message = send_verification_code_email(
-                            st.session_state.verification_email,
-                            verification_code
-                        )
+                        # Generate, store (hashed, server-side) and send the verification code
+                        success, message = send_verification_code(st.session_state.verification_email)
                         
                         if success:
-                            st.session_state.verification_code_expected = verification_code
                             st.session_state.verification_step = "code"
                             st.success(f"✅ Verification code sent to {st.session_state.verification_email}")
                             st.rerun()
@@ -1631,72 +1857,47 @@ def render_results_dashboard():
                 if st.button("Verify & Download", type="primary", use_container_width=True):
                     if not verification_code_entered:
                         st.error("Please enter the verification code.")
-                    elif verification_code_entered != st.session_state.verification_code_expected:
-                        st.error("Invalid verification code. Please try again.")
                     else:
-                        # Code is correct - generate HTML report and send to T-Logic
-                        try:
-                            import base64
-                            
-                            # Generate HTML report
-                            logo_b64 = None
-                            if st.session_state.company_logo is not None:
-                                from io import BytesIO
-                                buffered = BytesIO()
-                                st.session_state.company_logo.save(buffered, format="PNG")
-                                logo_b64 = base64.b64encode(buffered.getvalue()).decode()
-                            
-                            html_content = generate_html_report(
-                                scores_data,
-                                company_name=st.session_state.user_company,
-                                company_logo_b64=logo_b64,
-                                primary_color=st.session_state.primary_color
-                            )
-                            
-                            # Create download button for HTML
-                            filename = f"{st.session_state.user_company or 'Your Company'}_AI_Readiness_Report.html"
-                            
-                            st.success("✅ Email verified! Your report is ready.")
-                            
-                            # Use Streamlit's native download button
-                            st.download_button(
-                                label="📥 Download Report Now",
-                                data=html_content,
-                                file_name=filename,
-                                mime="text/html",
-                                use_container_width=True
-                            )
-                            
-                            # Send assessment results email to T-Logic
+                        verified, message = check_verification_code(
+                            st.session_state.verification_email, verification_code_entered)
+                        if not verified:
+                            st.error(message)
+                        else:
+                            # Code is correct - queue the HTML report and send results to T-Logic
                             try:
-                                send_assessment_completion_email(
-                                    user_name=st.session_state.user_name or "Anonymous",
-                                    user_email=st.session_state.verification_email,
-                                    user_title=st.session_state.user_title or "",
-                                    user_company=st.session_state.user_company or "",
-                                    user_phone=st.session_state.user_phone or "",
-                                    user_location=st.session_state.user_location or "",
-                                    ai_stage=st.session_state.ai_implementation_stage or "Not provided",
-                                    assessment_results=scores_data
+                                submit_report_download(
+                                    'html',
+                                    filename=f"{st.session_state.user_company or 'Your Company'}_AI_Readiness_Report.html",
+                                    mime="text/html",
+                                    assessment_date=datetime.now().strftime("%B %d, %Y")
                                 )
+                                
+                                # Send assessment results email to T-Logic
+                                try:
+                                    send_assessment_completion_email(
+                                        user_name=st.session_state.user_name or "Anonymous",
+                                        user_email=st.session_state.verification_email,
+                                        user_title=st.session_state.user_title or "",
+                                        user_company=st.session_state.user_company or "",
+                                        user_phone=st.session_state.user_phone or "",
+                                        user_location=st.session_state.user_location or "",
+                                        ai_stage=st.session_state.ai_implementation_stage or "Not provided",
+                                        assessment_results=scores_data
+                                    )
+                                except Exception as e:
+                                    print(f"Error sending assessment email: {e}")
+                                
+                                # Reset state after successful submission
+                                st.session_state.show_email_verification = False
+                                st.session_state.verification_step = "email"
+                                st.rerun()
                             except Exception as e:
-                                print(f"Error sending assessment email: {e}")
-                            
-                            # Reset state after successful generation
-                            st.session_state.show_email_verification = False
-                            st.session_state.verification_step = "email"
-                        except Exception as e:
-                            st.error(f"Error generating report: {str(e)}")
+                                st.error(f"Error generating report: {str(e)}")
             
             with col_resend:
                 if st.button("Resend Code", use_container_width=True):
-                    verification_code = generate_verification_code()
-                    success, message = send_verification_code_email(
-                        st.session_state.verification_email,
-                        verification_code
-                    )
+                    success, message = send_verification_code(st.session_state.verification_email)
                     if success:
-                        st.session_state.verification_code_expected = verification_code
                         st.info("✅ New verification code sent!")
                     else:
                         st.error(f"Failed to resend code: {message}")
@@ -1707,6 +1908,10 @@ def render_results_dashboard():
                     st.session_state.verification_step = "email"
                     st.rerun()
 
+    # Report generated in the background after email verification
+    if st.session_state.get("report_download"):
+        render_report_download()
+
     # Feedback Section
     st.markdown("---")
     st.markdown(
@@ -1780,10 +1985,11 @@ def render_chatgpt_assistant():
             unsafe_allow_html=True)
 
     with col2:
-        if st.session_state.company_logo is not None:
+        header_logo = logo_base64(max_height=40)
+        if header_logo is not None:
             st.markdown(f"""
                 <div style="text-align: right; width: 139px; height: 40px; overflow: hidden; margin-left: auto;">
-                    <img src="data:image/png;base64,{image_to_base64(st.session_state.company_logo, max_height=40)}" 
+                    <img src="data:image/png;base64,{header_logo}" 
                          style="width: 100%; height: auto; display: block;" />
                 </div>
                 """,
@@ -2195,26 +2401,17 @@ def main():
         # Show current answers summary in sidebar
         with st.sidebar:
             st.markdown("### 📊 Current Progress")
-            completed_questions = len([
-                q for q in get_all_questions()
-                if q['id'] in st.session_state.answers
-            ])
-            total_questions = len(get_all_questions())
+            tracker = get_score_tracker()
+            completed_questions = tracker.answered_count
+            total_questions = len(ALL_QUESTIONS)
             st.write(
                 f"Questions completed: {completed_questions}/{total_questions}"
             )
 
             if st.session_state.answers:
                 st.markdown("### Your Current Answers")
-                for dim_idx, dimension in enumerate(DIMENSIONS):
-                    dim_answers = []
-                    for q in dimension['questions']:
-                        if q['id'] in st.session_state.answers:
-                            dim_answers.append(
-                                st.session_state.answers[q['id']])
-
-                    if dim_answers:
-                        avg_score = sum(dim_answers) / len(dim_answers)
+                for dimension, avg_score in zip(DIMENSIONS, tracker.dimension_averages()):
+                    if avg_score is not None:
                         st.write(
                             f"**{dimension['title']}**: {avg_score:.1f}/5")
 
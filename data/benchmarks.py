@@ -1,8 +1,23 @@
 """
 Industry Benchmarks for AI Process Readiness Assessment
 """
+import copy
+import os
+import threading
+import time
 from db.models import DEFAULT_BASELINE
 
+# Seconds a fetched moving average benchmark is reused before hitting the database again
+BENCHMARK_CACHE_TTL = float(os.environ.get('BENCHMARK_CACHE_TTL', '300'))
+# Set to true to also invalidate the cache when other processes update the benchmark (Postgres LISTEN/NOTIFY)
+BENCHMARK_CACHE_NOTIFY = os.environ.get('BENCHMARK_CACHE_NOTIFY', 'false').lower() in ('1', 'true', 'yes')
+
+# Process-level cache for the moving average benchmark. 'generation' is bumped on every
+# invalidation so a fetch that started before it is not stored afterwards.
+_moving_average_cache = {'value': None, 'expires_at': 0.0, 'generation': 0}
+_cache_lock = threading.Lock()
+_listener_started = False
+
 # Industry benchmark scores (average scores across different maturity levels)
 INDUSTRY_BENCHMARKS = {
     'Small Business (< 50 employees)': {
@@ -68,10 +83,10 @@ def get_benchmark_comparison(your_scores, benchmark_name='Industry Average'):
     Returns:
         Dictionary with comparison data
     """
-    if benchmark_name not in INDUSTRY_BENCHMARKS:
+    if benchmark_name != 'Moving Average Benchmark' and benchmark_name not in INDUSTRY_BENCHMARKS:
         benchmark_name = 'Industry Average'
     
-    benchmark = INDUSTRY_BENCHMARKS[benchmark_name]
+    benchmark = get_benchmark_data(benchmark_name)
     dimension_scores = your_scores['dimension_scores']
     
     comparison = {
@@ -119,27 +134,80 @@ def get_benchmark_data(benchmark_name):
         return get_moving_average_benchmark()
     return INDUSTRY_BENCHMARKS.get(benchmark_name, INDUSTRY_BENCHMARKS['Industry Average'])
 
+def invalidate_moving_average_benchmark():
+    """Clear the cached moving average benchmark so the next read refetches it"""
+    with _cache_lock:
+        _moving_average_cache['value'] = None
+        _moving_average_cache['expires_at'] = 0.0
+        _moving_average_cache['generation'] += 1
+
+def _ensure_benchmark_listener():
+    """Start the cross-process invalidation listener once, if enabled"""
+    global _listener_started
+    if not BENCHMARK_CACHE_NOTIFY or _listener_started:
+        return
+    with _cache_lock:
+        if _listener_started:
+            return
+        _listener_started = True
+    try:
+        from db.operations import start_benchmark_listener
+        start_benchmark_listener(invalidate_moving_average_benchmark)
+    except Exception as e:
+        print(f"Error starting benchmark listener: {e}")
+
 def get_moving_average_benchmark():
+    """
+    Get the current moving average benchmark, cached per process for
+    BENCHMARK_CACHE_TTL seconds and invalidated when the benchmark is updated.
+    
+    Returns:
+        Dictionary with dimension scores and metadata similar to INDUSTRY_BENCHMARKS format
+    """
+    _ensure_benchmark_listener()
+    
+    with _cache_lock:
+        cached = _moving_average_cache['value']
+        if cached is not None and time.monotonic() < _moving_average_cache['expires_at']:
+            return copy.deepcopy(cached)
+        generation = _moving_average_cache['generation']
+    
+    benchmark, from_db = _fetch_moving_average_benchmark()
+    if from_db:
+        with _cache_lock:
+            if _moving_average_cache['generation'] != generation:
+                # Invalidated while fetching: the value may predate the update
+                return copy.deepcopy(benchmark)
+            _moving_average_cache['value'] = benchmark
+            _moving_average_cache['expires_at'] = time.monotonic() + BENCHMARK_CACHE_TTL
+    return copy.deepcopy(benchmark)
+
+def _fetch_moving_average_benchmark():
     """
     Get the current moving average benchmark from the database.
     This is updated as users complete assessments (excluding outliers).
     
     Returns:
-        Dictionary with dimension scores and metadata similar to INDUSTRY_BENCHMARKS format
+        Tuple of (benchmark dictionary, True if it came from the database)
     """
     try:
-        from db.operations import get_current_benchmark
+        from db.operations import get_benchmark_statistics
         
-        benchmark_scores = get_current_benchmark()
+        stats = get_benchmark_statistics()
+        benchmark_scores = [dim['average'] for dim in stats['dimensions']]
         
         # Map dimension IDs to benchmark scores
         dimension_ids = ['process', 'tech', 'data', 'people', 'leadership', 'change']
         
         benchmark_dict = {}
+        std_devs = {}
         total = 0
         for i, dim_id in enumerate(dimension_ids):
             score = benchmark_scores[i] if i < len(benchmark_scores) else 9.1
             benchmark_dict[dim_id] = round(score, 1)
+            # None until enough assessments with dispersion data have been recorded
+            std_dev = stats['dimensions'][i]['std_dev'] if i < len(stats['dimensions']) else None
+            std_devs[dim_id] = round(std_dev, 2) if std_dev is not None else None
             total += score
         
         return {
@@ -150,8 +218,10 @@ def get_moving_average_benchmark():
             'leadership': benchmark_dict.get('leadership', 9.6),
             'change': benchmark_dict.get('change', 9.2),
             'total': round(total, 1),
-            'description': 'Moving average benchmark from all valid assessments'
-        }
+            'description': 'Moving average benchmark from all valid assessments',
+            'std_dev': std_devs,
+            'assessment_count': stats['assessment_count']
+        }, True
     except Exception as e:
         print(f"Error fetching moving average benchmark: {e}")
         # Return default baseline on error
@@ -164,4 +234,4 @@ def get_moving_average_benchmark():
             'change': 9.2,
             'total': 61.4,
             'description': 'Default baseline (moving average unavailable)'
-        }
+        }, False
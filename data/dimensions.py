@@ -1,6 +1,7 @@
 """
 Dimension and question definitions for AI Process Readiness Assessment
 """
+from types import MappingProxyType
 
 # Pastel color palette for dimensions - Distinct pastel colors
 PALETTE = [
@@ -327,17 +328,48 @@ DIMENSIONS = [
     }
 ]
 
+# ------------------------
+# Precompiled question registry
+# ------------------------
+# Built once at import and read-only, so scoring, rendering and reporting
+# share the same lookups instead of re-walking DIMENSIONS.
+
+# Dimension ids in DIMENSIONS order
+DIMENSION_IDS = tuple(d['id'] for d in DIMENSIONS)
+
+# Dimension id -> dimension index
+DIMENSION_INDEX = MappingProxyType({dim_id: i for i, dim_id in enumerate(DIMENSION_IDS)})
+
+# Questions per dimension, in DIMENSIONS order
+QUESTIONS_BY_DIMENSION = tuple(tuple(d['questions']) for d in DIMENSIONS)
+
+# All questions as one flat array; each dimension's questions are contiguous
+ALL_QUESTIONS = tuple(q for questions in QUESTIONS_BY_DIMENSION for q in questions)
+QUESTION_IDS = tuple(q['id'] for q in ALL_QUESTIONS)
+
+# Question id -> (dimension index, position within the dimension)
+QUESTION_INDEX = MappingProxyType({
+    q['id']: (dim_idx, pos)
+    for dim_idx, questions in enumerate(QUESTIONS_BY_DIMENSION)
+    for pos, q in enumerate(questions)
+})
+
+# Question id -> column in ALL_QUESTIONS / QUESTION_IDS
+QUESTION_COLUMNS = MappingProxyType({question_id: col for col, question_id in enumerate(QUESTION_IDS)})
+
+# Column in ALL_QUESTIONS where each dimension's questions start
+DIMENSION_QUESTION_STARTS = tuple(
+    sum(len(questions) for questions in QUESTIONS_BY_DIMENSION[:i]) for i in range(len(DIMENSIONS))
+)
+
 def get_all_questions():
     """
     Get all questions from all dimensions as a flat list
     
     Returns:
-        List of all question dictionaries
+        Tuple of all question dictionaries
     """
-    questions = []
-    for dimension in DIMENSIONS:
-        questions.extend(dimension['questions'])
-    return questions
+    return ALL_QUESTIONS
 
 def get_dimension_by_id(dimension_id: str):
     """
@@ -349,7 +381,8 @@ def get_dimension_by_id(dimension_id: str):
     Returns:
         Dimension dictionary or None if not found
     """
-    return next((d for d in DIMENSIONS if d['id'] == dimension_id), None)
+    dim_idx = DIMENSION_INDEX.get(dimension_id)
+    return DIMENSIONS[dim_idx] if dim_idx is not None else None
 
 def get_questions_by_dimension(dimension_id: str):
     """
@@ -359,7 +392,7 @@ def get_questions_by_dimension(dimension_id: str):
         dimension_id: The dimension ID
         
     Returns:
-        List of question dictionaries for that dimension
+        Tuple of question dictionaries for that dimension
     """
-    dimension = get_dimension_by_id(dimension_id)
-    return dimension['questions'] if dimension else []
+    dim_idx = DIMENSION_INDEX.get(dimension_id)
+    return QUESTIONS_BY_DIMENSION[dim_idx] if dim_idx is not None else ()
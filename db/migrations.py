@@ -0,0 +1,275 @@
+"""
+Versioned schema migrations for AI Process Readiness Assessment
+
+Each migration runs once, in order, inside its own transaction and is
+recorded in the schema_migrations table. Migrations are written to be
+idempotent so a fresh database created by create_all() passes through
+them without changes.
+
+Run pending migrations manually with:  python -m db.migrations
+"""
+from sqlalchemy import inspect, text
+from datetime import datetime
+import json
+
+from db.models import Base, DIMENSION_IDS, OutboxEmail, VerificationCode, get_db_engine
+
+# Arbitrary constant key for the Postgres advisory lock held while migrating
+MIGRATION_LOCK_ID = 72613001
+
+CREATE_SCHEMA_MIGRATIONS_SQL = text("""
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        description VARCHAR(255) NOT NULL,
+        applied_at TIMESTAMP NOT NULL
+    )
+""")
+
+def _column_names(conn, table_name: str) -> set:
+    """Get the column names currently present on a table"""
+    return {col['name'] for col in inspect(conn).get_columns(table_name)}
+
+def _dimension_score_value(dim_score):
+    """Read one raw dimension score from a JSON element (number or {'score': ...})"""
+    if isinstance(dim_score, dict):
+        dim_score = dim_score.get('score')
+    try:
+        return float(dim_score)
+    except (TypeError, ValueError):
+        return None
+
+def _backfill_batch(conn, last_id: int, batch_size: int):
+    """
+    Backfill one batch of assessments with NULL typed dimension scores.
+
+    Returns:
+        Tuple of (rows updated, last processed id)
+    """
+    rows = conn.execute(
+        text(
+            'SELECT id, dimension_scores FROM assessments '
+            'WHERE process_score IS NULL AND id > :last_id ORDER BY id LIMIT :batch_size'
+        ),
+        {'last_id': last_id, 'batch_size': batch_size}
+    ).fetchall()
+    if not rows:
+        return 0, last_id
+
+    params = []
+    for row in rows:
+        scores = row.dimension_scores
+        if isinstance(scores, str):
+            scores = json.loads(scores)
+        scores = scores or []
+        values = {'id': row.id}
+        for i, dim_id in enumerate(DIMENSION_IDS):
+            values[f'{dim_id}_score'] = _dimension_score_value(scores[i]) if i < len(scores) else None
+        params.append(values)
+
+    assignments = ', '.join(f'{dim_id}_score = :{dim_id}_score' for dim_id in DIMENSION_IDS)
+    conn.execute(text(f'UPDATE assessments SET {assignments} WHERE id = :id'), params)
+    return len(params), rows[-1].id
+
+def backfill_assessment_dimension_scores(engine=None, batch_size: int = 500) -> int:
+    """
+    Populate the typed per-dimension score columns from the dimension_scores
+    JSON for rows that have not been backfilled yet. Each batch commits on
+    its own, so this can be re-run safely on a live database.
+
+    Returns:
+        Number of rows updated
+    """
+    engine = engine or get_db_engine()
+    updated = 0
+    last_id = 0
+    while True:
+        with engine.begin() as conn:
+            count, last_id = _backfill_batch(conn, last_id, batch_size)
+        if not count:
+            return updated
+        updated += count
+
+# ------------------------
+# Migrations
+# ------------------------
+def _migration_benchmark_running_sums(conn):
+    """
+    Add per-dimension running sums to benchmarks, backfilled from the rounded averages.
+
+    Only the sums can be recovered from an average; the individual scores
+    behind it are gone, so sums of squares start at 0 and variance is only
+    reported for assessments added afterwards (see migration 6).
+    """
+    existing = _column_names(conn, 'benchmarks')
+    missing = [
+        name for dim_id in DIMENSION_IDS
+        for name in (f'{dim_id}_sum', f'{dim_id}_sum_sq')
+        if name not in existing
+    ]
+    if not missing:
+        return
+
+    for name in missing:
+        conn.execute(text(f'ALTER TABLE benchmarks ADD COLUMN {name} FLOAT NOT NULL DEFAULT 0'))
+
+    rows = conn.execute(text('SELECT id, dimension_scores, assessment_count FROM benchmarks')).fetchall()
+    for row in rows:
+        scores = row.dimension_scores
+        if isinstance(scores, str):
+            scores = json.loads(scores)
+        count = row.assessment_count or 0
+        values = {'id': row.id}
+        for i, dim_id in enumerate(DIMENSION_IDS):
+            avg = float(scores[i]) if scores and i < len(scores) else 0.0
+            values[f'{dim_id}_sum'] = avg * count
+            values[f'{dim_id}_sum_sq'] = 0.0
+        assignments = ', '.join(f'{key} = :{key}' for key in values if key != 'id')
+        conn.execute(text(f'UPDATE benchmarks SET {assignments} WHERE id = :id'), values)
+
+def _migration_assessment_dimension_columns(conn):
+    """Add typed per-dimension score columns to assessments and backfill them"""
+    existing = _column_names(conn, 'assessments')
+    for dim_id in DIMENSION_IDS:
+        if f'{dim_id}_score' not in existing:
+            conn.execute(text(f'ALTER TABLE assessments ADD COLUMN {dim_id}_score FLOAT'))
+
+    last_id = 0
+    while True:
+        count, last_id = _backfill_batch(conn, last_id, 500)
+        if not count:
+            break
+
+def _migration_hot_path_indexes(conn):
+    """Merge duplicate organizations, make names unique and index the hot lookups"""
+    # Point assessments and users at the lowest id sharing their organization's name
+    for table in ('assessments', 'users'):
+        conn.execute(text(f"""
+            UPDATE {table} SET organization_id = (
+                SELECT MIN(o2.id)
+                FROM organizations o1
+                JOIN organizations o2 ON o2.name = o1.name
+                WHERE o1.id = {table}.organization_id
+            )
+            WHERE organization_id IS NOT NULL
+        """))
+    conn.execute(text(
+        'DELETE FROM organizations WHERE id NOT IN (SELECT MIN(id) FROM organizations GROUP BY name)'
+    ))
+
+    conn.execute(text('CREATE UNIQUE INDEX IF NOT EXISTS uq_organizations_name ON organizations (name)'))
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_users_email_organization_id ON users (email, organization_id)'
+    ))
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_assessments_organization_id_completed_at '
+        'ON assessments (organization_id, completed_at)'
+    ))
+    conn.execute(text('CREATE INDEX IF NOT EXISTS ix_assessments_user_id ON assessments (user_id)'))
+    conn.execute(text('CREATE INDEX IF NOT EXISTS ix_benchmarks_updated_at ON benchmarks (updated_at)'))
+
+def _migration_email_outbox(conn):
+    """Create the outbound email queue drained by the background outbox worker"""
+    OutboxEmail.__table__.create(conn, checkfirst=True)
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_email_outbox_status_next_attempt_at '
+        'ON email_outbox (status, next_attempt_at)'
+    ))
+
+def _migration_verification_codes(conn):
+    """Create the server-side verification code store with its expiry index"""
+    VerificationCode.__table__.create(conn, checkfirst=True)
+    conn.execute(text(
+        'CREATE UNIQUE INDEX IF NOT EXISTS uq_verification_codes_email ON verification_codes (email)'
+    ))
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_verification_codes_expires_at ON verification_codes (expires_at)'
+    ))
+
+def _migration_benchmark_dispersion_samples(conn):
+    """
+    Track which benchmark samples carry dispersion data.
+
+    Migration 1 used to backfill sums of squares as avg * avg * count, as if
+    every legacy assessment had scored exactly the average, which made the
+    reported spread of historical data 0. Those fabricated squares cannot be
+    told apart from the real ones added since, so sums of squares are reset
+    and variance is computed only from dispersion_count samples added from
+    now on (std_dev is None until there are enough of them).
+    """
+    existing = _column_names(conn, 'benchmarks')
+    if 'dispersion_count' in existing:
+        return
+
+    conn.execute(text('ALTER TABLE benchmarks ADD COLUMN dispersion_count INTEGER NOT NULL DEFAULT 0'))
+    for dim_id in DIMENSION_IDS:
+        if f'{dim_id}_dispersion_sum' not in existing:
+            conn.execute(text(f'ALTER TABLE benchmarks ADD COLUMN {dim_id}_dispersion_sum FLOAT NOT NULL DEFAULT 0'))
+    assignments = ', '.join(f'{dim_id}_sum_sq = 0' for dim_id in DIMENSION_IDS)
+    conn.execute(text(f'UPDATE benchmarks SET {assignments}'))
+
+# Ordered list of (version, description, migration function). Append only.
+MIGRATIONS = [
+    (1, 'Benchmark running sums and sums of squares', _migration_benchmark_running_sums),
+    (2, 'Typed per-dimension assessment score columns', _migration_assessment_dimension_columns),
+    (3, 'Unique organization names and hot path indexes', _migration_hot_path_indexes),
+    (4, 'Email outbox queue', _migration_email_outbox),
+    (5, 'Verification code store', _migration_verification_codes),
+    (6, 'Benchmark dispersion samples', _migration_benchmark_dispersion_samples),
+]
+
+# Schema version expected by this code
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def get_schema_version(conn) -> int:
+    """Get the highest applied migration version (0 if none)"""
+    if not inspect(conn).has_table('schema_migrations'):
+        return 0
+    version = conn.execute(text('SELECT MAX(version) FROM schema_migrations')).scalar()
+    return version or 0
+
+def is_schema_current(engine=None) -> bool:
+    """Check whether every migration has already been applied"""
+    engine = engine or get_db_engine()
+    with engine.connect() as conn:
+        return get_schema_version(conn) >= SCHEMA_VERSION
+
+def _lock_migrations(conn):
+    """Take the migration advisory lock on Postgres until the transaction ends"""
+    if conn.dialect.name == 'postgresql':
+        conn.execute(text('SELECT pg_advisory_xact_lock(:lock_id)'), {'lock_id': MIGRATION_LOCK_ID})
+
+def run_migrations(engine=None) -> int:
+    """
+    Create missing tables and apply all pending migrations in order.
+    On Postgres an advisory lock serializes concurrent workers, including
+    the initial table creation on a fresh database.
+
+    Returns:
+        The schema version after migrating
+    """
+    engine = engine or get_db_engine()
+
+    with engine.begin() as conn:
+        _lock_migrations(conn)
+        Base.metadata.create_all(conn)
+        conn.execute(CREATE_SCHEMA_MIGRATIONS_SQL)
+
+    for version, description, migrate in MIGRATIONS:
+        with engine.begin() as conn:
+            _lock_migrations(conn)
+            # Re-check under the lock in case another worker already applied it
+            if get_schema_version(conn) >= version:
+                continue
+            migrate(conn)
+            conn.execute(
+                text('INSERT INTO schema_migrations (version, description, applied_at) '
+                     'VALUES (:version, :description, :applied_at)'),
+                {'version': version, 'description': description, 'applied_at': datetime.utcnow()}
+            )
+            print(f"Applied migration {version}: {description}")
+
+    with engine.connect() as conn:
+        return get_schema_version(conn)
+
+if __name__ == '__main__':
+    print(f"Schema version: {run_migrations()}")
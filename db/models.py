@@ -1,20 +1,27 @@
 """
 Database models for AI Process Readiness Assessment
 """
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, JSON, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, JSON, ForeignKey, Index, Text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, scoped_session, relationship
 from datetime import datetime
 import os
+import threading
 
 Base = declarative_base()
 
 # Default industry baseline for moving average benchmark
 DEFAULT_BASELINE = [3.2, 3.4, 3.1, 3.8, 3.7, 3.3]
 
+# Dimension order used by the typed per-dimension columns (assessment scores and benchmark sums)
+DIMENSION_IDS = ['process', 'tech', 'data', 'people', 'leadership', 'governance']
+
 class Organization(Base):
     """Organization/Company table"""
     __tablename__ = 'organizations'
+    __table_args__ = (
+        Index('uq_organizations_name', 'name', unique=True),
+    )
     
     id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False)
@@ -27,6 +34,10 @@ class Organization(Base):
 class Assessment(Base):
     """Assessment results table"""
     __tablename__ = 'assessments'
+    __table_args__ = (
+        Index('ix_assessments_organization_id_completed_at', 'organization_id', 'completed_at'),
+        Index('ix_assessments_user_id', 'user_id'),
+    )
     
     id = Column(Integer, primary_key=True)
     organization_id = Column(Integer, ForeignKey('organizations.id'), nullable=False)
@@ -39,6 +50,15 @@ class Assessment(Base):
     # Dimension scores (stored as JSON)
     dimension_scores = Column(JSON, nullable=False)
     
+    # Typed per-dimension raw scores (3-15), for SQL aggregates without JSON parsing.
+    # NULL only for legacy rows not yet backfilled from dimension_scores.
+    process_score = Column(Float, nullable=True)
+    tech_score = Column(Float, nullable=True)
+    data_score = Column(Float, nullable=True)
+    people_score = Column(Float, nullable=True)
+    leadership_score = Column(Float, nullable=True)
+    governance_score = Column(Float, nullable=True)
+    
     # Individual question answers (stored as JSON)
     answers = Column(JSON, nullable=False)
     
@@ -55,6 +75,9 @@ class Assessment(Base):
 class User(Base):
     """User table for multi-user support"""
     __tablename__ = 'users'
+    __table_args__ = (
+        Index('ix_users_email_organization_id', 'email', 'organization_id'),
+    )
     
     id = Column(Integer, primary_key=True)
     organization_id = Column(Integer, ForeignKey('organizations.id'), nullable=True)
@@ -67,32 +90,143 @@ class User(Base):
 class Benchmark(Base):
     """Moving average benchmark tracker for industry baseline"""
     __tablename__ = 'benchmarks'
+    __table_args__ = (
+        Index('ix_benchmarks_updated_at', 'updated_at'),
+    )
     
     id = Column(Integer, primary_key=True)
-    # Store dimension scores as JSON array [process, tech, data, people, leadership, governance]
+    # Legacy rounded averages as JSON array [process, tech, data, people, leadership, governance].
+    # No longer updated; only read to backfill the running sums below.
     dimension_scores = Column(JSON, nullable=False, default=lambda: DEFAULT_BASELINE.copy())
     # Count of valid (non-outlier) assessments used to calculate this benchmark
     assessment_count = Column(Integer, default=0)
+    # Exact running sums per dimension over all assessment_count assessments; averages derive from these.
+    # The *_sum_sq and *_dispersion_sum columns only cover the dispersion_count assessments
+    # added one by one since dispersion tracking started (not the legacy rounded averages),
+    # and variance / standard deviation are derived from those on read.
+    process_sum = Column(Float, nullable=False, default=0.0)
+    process_sum_sq = Column(Float, nullable=False, default=0.0)
+    tech_sum = Column(Float, nullable=False, default=0.0)
+    tech_sum_sq = Column(Float, nullable=False, default=0.0)
+    data_sum = Column(Float, nullable=False, default=0.0)
+    data_sum_sq = Column(Float, nullable=False, default=0.0)
+    people_sum = Column(Float, nullable=False, default=0.0)
+    people_sum_sq = Column(Float, nullable=False, default=0.0)
+    leadership_sum = Column(Float, nullable=False, default=0.0)
+    leadership_sum_sq = Column(Float, nullable=False, default=0.0)
+    governance_sum = Column(Float, nullable=False, default=0.0)
+    governance_sum_sq = Column(Float, nullable=False, default=0.0)
+    dispersion_count = Column(Integer, nullable=False, default=0)
+    process_dispersion_sum = Column(Float, nullable=False, default=0.0)
+    tech_dispersion_sum = Column(Float, nullable=False, default=0.0)
+    data_dispersion_sum = Column(Float, nullable=False, default=0.0)
+    people_dispersion_sum = Column(Float, nullable=False, default=0.0)
+    leadership_dispersion_sum = Column(Float, nullable=False, default=0.0)
+    governance_dispersion_sum = Column(Float, nullable=False, default=0.0)
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+class OutboxEmail(Base):
+    """Outbound email waiting to be delivered by the background outbox worker"""
+    __tablename__ = 'email_outbox'
+    __table_args__ = (
+        Index('ix_email_outbox_status_next_attempt_at', 'status', 'next_attempt_at'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    to_email = Column(String(255), nullable=False)
+    from_email = Column(String(255), nullable=False, default='me')
+    subject = Column(Text, nullable=False)
+    body_text = Column(Text, nullable=False)
+    body_html = Column(Text, nullable=True)
+    # pending -> sending -> sent, or dead after too many failed attempts.
+    # Admin notifications in digest mode wait as 'digest' until they are
+    # summarized into one pending email, then become 'digested'.
+    status = Column(String(20), nullable=False, default='pending')
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    # When a pending email may next be tried; for 'sending' rows, when the claim lease expires
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    # When the email was delivered, or summarized into a digest
+    sent_at = Column(DateTime, nullable=True)
+
+class VerificationCode(Base):
+    """Pending email verification code (hashed), with send throttling and attempt counters"""
+    __tablename__ = 'verification_codes'
+    __table_args__ = (
+        Index('uq_verification_codes_email', 'email', unique=True),
+        Index('ix_verification_codes_expires_at', 'expires_at'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    # Normalized (lower-case, trimmed) address; one active code per email
+    email = Column(String(255), nullable=False)
+    # SHA-256 of salt + email + code; the code itself is never stored
+    code_hash = Column(String(64), nullable=False)
+    salt = Column(String(32), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    # Failed verification attempts for the current code
+    attempts = Column(Integer, nullable=False, default=0)
+    # Codes sent in the current throttling window, which started at window_started_at
+    sent_count = Column(Integer, nullable=False, default=0)
+    window_started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_sent_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
 # Database connection and session management
+# Connection pool settings (overridable via environment variables)
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', '10'))
+DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', '30'))
+DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', '1800'))
+DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes')
+
+# Process-wide engine and session factory, created lazily on first use
+_engine = None
+_session_factory = None
+_engine_lock = threading.Lock()
+
 def get_db_engine():
-    """Get database engine"""
-    database_url = os.environ.get('DATABASE_URL')
-    if not database_url:
-        raise ValueError("DATABASE_URL environment variable not set")
-    return create_engine(database_url)
+    """Get the shared, pooled database engine (created once per process)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                database_url = os.environ.get('DATABASE_URL')
+                if not database_url:
+                    raise ValueError("DATABASE_URL environment variable not set")
+                _engine = create_engine(
+                    database_url,
+                    pool_size=DB_POOL_SIZE,
+                    max_overflow=DB_MAX_OVERFLOW,
+                    pool_timeout=DB_POOL_TIMEOUT,
+                    pool_recycle=DB_POOL_RECYCLE,
+                    pool_pre_ping=DB_POOL_PRE_PING
+                )
+    return _engine
+
+def get_session_factory():
+    """Get the shared thread-scoped session factory bound to the pooled engine"""
+    global _session_factory
+    if _session_factory is None:
+        engine = get_db_engine()
+        with _engine_lock:
+            if _session_factory is None:
+                # expire_on_commit=False keeps returned objects readable after the session closes
+                _session_factory = scoped_session(
+                    sessionmaker(bind=engine, expire_on_commit=False)
+                )
+    return _session_factory
 
 def get_db_session():
-    """Get database session"""
-    engine = get_db_engine()
-    Session = sessionmaker(bind=engine)
-    return Session()
+    """Get database session for the current thread from the shared factory"""
+    return get_session_factory()()
 
 def init_db():
-    """Initialize database - create all tables"""
+    """Initialize database - create all tables and apply pending schema migrations"""
+    from db.migrations import run_migrations
+    
     engine = get_db_engine()
-    Base.metadata.create_all(engine)
+    run_migrations(engine)
     return engine
@@ -1,15 +1,34 @@
 """
 Database operations for AI Process Readiness Assessment
 """
-from db.models import Organization, Assessment, User, Benchmark, get_db_session, init_db, DEFAULT_BASELINE
-from datetime import datetime
-from sqlalchemy import desc, func
-from typing import List, Dict, Optional
+from db.models import (Organization, Assessment, User, Benchmark, OutboxEmail, VerificationCode, get_db_session,
+                       init_db, DEFAULT_BASELINE, DIMENSION_IDS)
+from data.dimensions import DIMENSIONS
+from datetime import datetime, timedelta
+from sqlalchemy import desc, func, update, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import List, Dict, Optional, Callable
+import math
+import select
+import threading
+import time
+
+# Postgres NOTIFY channel used to tell other processes the benchmark changed
+BENCHMARK_NOTIFY_CHANNEL = 'benchmark_updated'
+# Fixed id of the benchmark row created on first use, so concurrent first writers share one row
+BENCHMARK_ROW_ID = 1
+# Dispersion samples needed before a benchmark variance / standard deviation is reported
+MIN_DISPERSION_SAMPLES = 2
 
 def ensure_tables_exist():
-    """Ensure database tables are created"""
+    """Ensure database tables are created, skipping DDL when the schema is already current"""
     try:
-        init_db()
+        from db.migrations import is_schema_current
+        
+        if not is_schema_current():
+            init_db()
         return True
     except Exception as e:
         print(f"Error initializing database: {e}")
@@ -47,6 +66,51 @@ def get_or_create_user(name: str, email: str, organization_id: int) -> User:
     finally:
         session.close()
 
+def _dialect_insert(session, table):
+    """Build a dialect-specific INSERT that supports ON CONFLICT clauses"""
+    if session.get_bind().dialect.name == 'sqlite':
+        return sqlite_insert(table)
+    return pg_insert(table)
+
+def _get_or_create_organization_id(session, company_name: str) -> int:
+    """Insert or touch an organization by its unique name in a single statement and return its id"""
+    stmt = _dialect_insert(session, Organization.__table__).values(
+        name=company_name,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Organization.name],
+        set_={'updated_at': stmt.excluded.updated_at}
+    ).returning(Organization.id)
+    return session.execute(stmt).scalar_one()
+
+def _upsert_user_id(session, name: str, email: str, organization_id: int) -> int:
+    """Insert or update a user by email in a single statement and return its id"""
+    stmt = _dialect_insert(session, User.__table__).values(
+        name=name,
+        email=email,
+        organization_id=organization_id,
+        role='user',
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[User.email],
+        set_={'name': stmt.excluded.name, 'updated_at': stmt.excluded.updated_at}
+    ).returning(User.id)
+    return session.execute(stmt).scalar_one()
+
+def _extract_raw_dimension_scores(dimension_scores: List) -> List[float]:
+    """Extract raw dimension scores from a list of floats or score dicts"""
+    raw_dimension_scores = []
+    for dim_score in dimension_scores:
+        if isinstance(dim_score, dict):
+            raw_dimension_scores.append(dim_score.get('score', 3.0))
+        else:
+            raw_dimension_scores.append(float(dim_score))
+    return raw_dimension_scores
+
 def save_assessment(
     company_name: str,
     scores_data: Dict,
@@ -55,35 +119,25 @@ def save_assessment(
     user_name: str = None,
     user_email: str = None
 ) -> Assessment:
-    """Save assessment results to database"""
+    """
+    Save assessment results to database.
+    The organization, user, assessment and benchmark update are written
+    in a single transaction with one commit.
+    """
     session = get_db_session()
     try:
-        # Get or create organization
-        org = session.query(Organization).filter_by(name=company_name).first()
-        if not org:
-            org = Organization(name=company_name)
-            session.add(org)
-            session.commit()
-            session.refresh(org)
+        org_id = _get_or_create_organization_id(session, company_name)
         
-        # Get or create user if provided (in same session)
+        # Upsert user if provided (in same transaction)
         user_id = None
         if user_name and user_email:
-            user = session.query(User).filter_by(email=user_email, organization_id=org.id).first()
-            if not user:
-                user = User(
-                    name=user_name,
-                    email=user_email,
-                    organization_id=org.id
-                )
-                session.add(user)
-                session.commit()
-                session.refresh(user)
-            user_id = user.id
+            user_id = _upsert_user_id(session, user_name, user_email, org_id)
+        
+        raw_dimension_scores = _extract_raw_dimension_scores(scores_data['dimension_scores'])
         
         # Create assessment
         assessment = Assessment(
-            organization_id=org.id,
+            organization_id=org_id,
             user_id=user_id,
             company_name=company_name,
             total_score=scores_data['total'],
@@ -91,26 +145,22 @@ def save_assessment(
             readiness_band=scores_data['readiness_band']['label'],
             dimension_scores=scores_data['dimension_scores'],
             answers=answers,
-            primary_color=primary_color
+            primary_color=primary_color,
+            **{
+                f'{dim_id}_score': raw_dimension_scores[i] if i < len(raw_dimension_scores) else None
+                for i, dim_id in enumerate(DIMENSION_IDS)
+            }
         )
-        
         session.add(assessment)
-        session.commit()
-        session.refresh(assessment)
         
         # Update the moving average benchmark if this is not an outlier
-        # Extract raw dimension scores from the dimension_scores list
-        raw_dimension_scores = []
-        for dim_score in scores_data['dimension_scores']:
-            if isinstance(dim_score, dict):
-                raw_dimension_scores.append(dim_score.get('score', 3.0))
-            else:
-                raw_dimension_scores.append(float(dim_score))
-        
-        # Only update benchmark if not an outlier
-        if not is_outlier_assessment(raw_dimension_scores):
-            update_benchmark(raw_dimension_scores)
+        benchmark_updated = not is_outlier_assessment(raw_dimension_scores)
+        if benchmark_updated:
+            _apply_benchmark_update(session, [raw_dimension_scores])
         
+        session.commit()
+        if benchmark_updated:
+            _invalidate_benchmark_cache()
         return assessment
     except Exception as e:
         session.rollback()
@@ -170,33 +220,46 @@ def get_assessment_history(company_name: str) -> List[Dict]:
     
     return history
 
+def _dimension_score_columns():
+    """Typed per-dimension score columns of Assessment, in DIMENSIONS order"""
+    return [getattr(Assessment, f'{dim_id}_score') for dim_id in DIMENSION_IDS]
+
 def get_dimension_trends(company_name: str) -> Dict:
     """Get dimension score trends over time"""
-    assessments = get_organization_assessments(company_name, limit=10)
+    session = get_db_session()
+    try:
+        rows = session.query(Assessment.completed_at, *_dimension_score_columns())\
+            .join(Organization, Organization.id == Assessment.organization_id)\
+            .filter(Organization.name == company_name)\
+            .order_by(desc(Assessment.completed_at))\
+            .limit(10)\
+            .all()
+    finally:
+        session.close()
     
-    if not assessments:
+    if not rows:
         return {}
     
     # Organize data by dimension
     trends = {}
-    dates = []
     
-    for assessment in reversed(assessments):  # Oldest first
-        date = assessment.completed_at.strftime('%Y-%m-%d')
-        dates.append(date)
+    for row in reversed(rows):  # Oldest first
+        date = row.completed_at.strftime('%Y-%m-%d')
         
-        for dim_score in assessment.dimension_scores:
-            dim_id = dim_score['id']
-            dim_title = dim_score['title']
+        for i, dimension in enumerate(DIMENSIONS):
+            score = row[i + 1]
+            if score is None:
+                continue
             
+            dim_id = dimension['id']
             if dim_id not in trends:
                 trends[dim_id] = {
-                    'title': dim_title,
+                    'title': dimension['title'],
                     'scores': [],
                     'dates': []
                 }
             
-            trends[dim_id]['scores'].append(dim_score['score'])
+            trends[dim_id]['scores'].append(score)
             trends[dim_id]['dates'].append(date)
     
     return trends
@@ -266,54 +329,91 @@ def delete_assessment(assessment_id: int) -> bool:
     finally:
         session.close()
 
+def _team_members_query(session, company_name: str):
+    """
+    Build a single query returning each user's latest assessment and count.
+    Window functions rank assessments per user, so no per-user lookups are needed.
+    """
+    org_id = session.query(Organization.id)\
+        .filter(Organization.name == company_name)\
+        .order_by(Organization.id)\
+        .limit(1)\
+        .scalar_subquery()
+    
+    ranked = session.query(
+        Assessment.user_id.label('user_id'),
+        Assessment.total_score.label('total_score'),
+        Assessment.percentage.label('percentage'),
+        Assessment.completed_at.label('completed_at'),
+        func.row_number().over(
+            partition_by=Assessment.user_id,
+            order_by=(desc(Assessment.completed_at), desc(Assessment.id))
+        ).label('rank'),
+        func.count().over(partition_by=Assessment.user_id).label('total_assessments')
+    ).filter(
+        Assessment.organization_id == org_id,
+        Assessment.user_id.isnot(None)
+    ).subquery()
+    
+    return session.query(
+        User.id,
+        User.name,
+        User.email,
+        ranked.c.total_score,
+        ranked.c.percentage,
+        ranked.c.completed_at,
+        ranked.c.total_assessments
+    ).join(ranked, ranked.c.user_id == User.id)\
+        .filter(ranked.c.rank == 1)\
+        .order_by(desc(ranked.c.completed_at), User.id)
+
+def _team_member_row_to_dict(row) -> Dict:
+    """Convert a team member query row into the team member dictionary format"""
+    return {
+        'id': row.id,
+        'name': row.name,
+        'email': row.email,
+        'latest_score': row.total_score,
+        'latest_percentage': row.percentage,
+        'latest_date': row.completed_at.strftime('%Y-%m-%d %H:%M') if row.completed_at else None,
+        'total_assessments': row.total_assessments
+    }
+
 def get_team_members(company_name: str) -> List[Dict]:
     """Get all team members who have completed assessments"""
     session = get_db_session()
     try:
-        org = session.query(Organization).filter_by(name=company_name).first()
-        if not org:
-            return []
-        
-        # Get all assessments with user info
-        assessments = session.query(Assessment).filter_by(organization_id=org.id).all()
-        
-        # Track users and their assessments
-        user_map = {}
-        
-        for assessment in assessments:
-            # Check if assessment has user_id attribute and it's not None
-            if hasattr(assessment, 'user_id') and assessment.user_id:
-                user = session.query(User).filter_by(id=assessment.user_id).first()
-                if user:
-                    if user.id not in user_map:
-                        user_map[user.id] = {
-                            'id': user.id,
-                            'name': user.name,
-                            'email': user.email,
-                            'assessments': [],
-                            'latest_score': 0,
-                            'latest_percentage': 0,
-                            'latest_date': None
-                        }
-                    
-                    user_map[user.id]['assessments'].append({
-                        'score': assessment.total_score,
-                        'percentage': assessment.percentage,
-                        'date': assessment.completed_at
-                    })
-        
-        # Get latest assessment for each user
-        team_members = []
-        for user_id, user_data in user_map.items():
-            latest = max(user_data['assessments'], key=lambda x: x['date'])
-            user_data['latest_score'] = latest['score']
-            user_data['latest_percentage'] = latest['percentage']
-            user_data['latest_date'] = latest['date'].strftime('%Y-%m-%d %H:%M')
-            user_data['total_assessments'] = len(user_data['assessments'])
-            del user_data['assessments']  # Remove detailed assessments
-            team_members.append(user_data)
+        rows = _team_members_query(session, company_name).all()
+        return [_team_member_row_to_dict(row) for row in rows]
+    finally:
+        session.close()
+
+def get_team_members_page(company_name: str, page: int = 1, page_size: int = 25) -> Dict:
+    """
+    Get one page of team members, most recently active first.
+    
+    Args:
+        company_name: Organization name
+        page: 1-based page number
+        page_size: Number of members per page
         
-        return sorted(team_members, key=lambda x: x['latest_date'], reverse=True)
+    Returns:
+        Dictionary with members, page, page_size, total_members and total_pages
+    """
+    page = max(page, 1)
+    page_size = max(page_size, 1)
+    session = get_db_session()
+    try:
+        query = _team_members_query(session, company_name)
+        total_members = query.order_by(None).count()
+        rows = query.offset((page - 1) * page_size).limit(page_size).all()
+        return {
+            'members': [_team_member_row_to_dict(row) for row in rows],
+            'page': page,
+            'page_size': page_size,
+            'total_members': total_members,
+            'total_pages': math.ceil(total_members / page_size) if total_members else 0
+        }
     finally:
         session.close()
 
@@ -321,45 +421,28 @@ def get_team_dimension_averages(company_name: str) -> Dict:
     """Get average dimension scores across all team assessments"""
     session = get_db_session()
     try:
-        org = session.query(Organization).filter_by(name=company_name).first()
-        if not org:
-            return {}
-        
-        assessments = session.query(Assessment).filter_by(organization_id=org.id).all()
-        
-        if not assessments:
-            return {}
-        
-        # Aggregate dimension scores
-        dimension_totals = {}
-        dimension_counts = {}
+        aggregates = []
+        for column in _dimension_score_columns():
+            aggregates.extend([func.avg(column), func.count(column)])
         
-        for assessment in assessments:
-            for dim_score in assessment.dimension_scores:
-                dim_id = dim_score['id']
-                dim_title = dim_score['title']
-                
-                if dim_id not in dimension_totals:
-                    dimension_totals[dim_id] = {
-                        'title': dim_title,
-                        'total': 0,
-                        'count': 0
-                    }
-                
-                dimension_totals[dim_id]['total'] += dim_score['score']
-                dimension_totals[dim_id]['count'] += 1
+        row = session.query(*aggregates)\
+            .join(Organization, Organization.id == Assessment.organization_id)\
+            .filter(Organization.name == company_name)\
+            .one()
         
-        # Calculate averages
         dimension_averages = []
-        for dim_id, data in dimension_totals.items():
+        for i, dimension in enumerate(DIMENSIONS):
+            average, count = row[2 * i], row[2 * i + 1]
+            if not count:
+                continue
             dimension_averages.append({
-                'id': dim_id,
-                'title': data['title'],
-                'average': round(data['total'] / data['count'], 2),
-                'assessments': data['count']
+                'id': dimension['id'],
+                'title': dimension['title'],
+                'average': round(float(average), 2),
+                'assessments': count
             })
         
-        return dimension_averages
+        return dimension_averages or {}
     finally:
         session.close()
 
@@ -367,20 +450,18 @@ def get_team_readiness_distribution(company_name: str) -> Dict:
     """Get distribution of readiness levels across team"""
     session = get_db_session()
     try:
-        org = session.query(Organization).filter_by(name=company_name).first()
-        if not org:
-            return {}
+        org_id = session.query(Organization.id)\
+            .filter(Organization.name == company_name)\
+            .order_by(Organization.id)\
+            .limit(1)\
+            .scalar_subquery()
         
-        assessments = session.query(Assessment).filter_by(organization_id=org.id).all()
-        
-        distribution = {}
-        for assessment in assessments:
-            band = assessment.readiness_band
-            if band not in distribution:
-                distribution[band] = 0
-            distribution[band] += 1
+        rows = session.query(Assessment.readiness_band, func.count(Assessment.id))\
+            .filter(Assessment.organization_id == org_id)\
+            .group_by(Assessment.readiness_band)\
+            .all()
         
-        return distribution
+        return {band: count for band, count in rows}
     finally:
         session.close()
 
@@ -402,6 +483,55 @@ def is_outlier_assessment(dimension_scores: List[float]) -> bool:
     
     return all_ones or all_fives
 
+def _benchmark_statistics(benchmark: Optional[Benchmark]) -> Dict:
+    """
+    Derive per-dimension average, variance and standard deviation from running sums.
+    Averages cover every assessment; variance only covers the dispersion samples
+    and is None until there are MIN_DISPERSION_SAMPLES of them.
+    """
+    count = (benchmark.assessment_count or 0) if benchmark else 0
+    dispersion_count = (benchmark.dispersion_count or 0) if benchmark else 0
+    dimensions = []
+    for i, dim_id in enumerate(DIMENSION_IDS):
+        if count > 0:
+            average = (getattr(benchmark, f'{dim_id}_sum') or 0.0) / count
+        else:
+            average = DEFAULT_BASELINE[i]
+        if dispersion_count >= MIN_DISPERSION_SAMPLES:
+            sample_mean = (getattr(benchmark, f'{dim_id}_dispersion_sum') or 0.0) / dispersion_count
+            total_sq = getattr(benchmark, f'{dim_id}_sum_sq') or 0.0
+            # Population variance; clamp tiny negative values from float error
+            variance = max(total_sq / dispersion_count - sample_mean * sample_mean, 0.0)
+            std_dev = math.sqrt(variance)
+        else:
+            variance = std_dev = None
+        dimensions.append({
+            'id': dim_id,
+            'average': average,
+            'variance': variance,
+            'std_dev': std_dev
+        })
+    return {
+        'assessment_count': count,
+        'dispersion_count': dispersion_count,
+        'dimensions': dimensions
+    }
+
+def get_benchmark_statistics() -> Dict:
+    """
+    Get the current benchmark with dispersion statistics.
+    
+    Returns:
+        Dictionary with assessment_count, dispersion_count and a list of per-dimension
+        dicts holding id, average, variance and std_dev (None without enough samples)
+    """
+    session = get_db_session()
+    try:
+        benchmark = session.query(Benchmark).order_by(desc(Benchmark.updated_at)).first()
+        return _benchmark_statistics(benchmark)
+    finally:
+        session.close()
+
 def get_current_benchmark() -> List[float]:
     """
     Get the current moving average benchmark.
@@ -410,61 +540,613 @@ def get_current_benchmark() -> List[float]:
     Returns:
         List of 6 dimension scores representing the current benchmark
     """
+    stats = get_benchmark_statistics()
+    return [dim['average'] for dim in stats['dimensions']]
+
+def _apply_benchmark_update(session, dimension_score_sets: List[List[float]]) -> None:
+    """
+    Add one or more assessments to the benchmark inside the caller's transaction.
+    Sums, sums of squares and the counts are incremented in a single UPDATE
+    statement, so concurrent writers never need to read the row first.
+    """
+    if not dimension_score_sets:
+        return
+    
+    benchmark_id = session.query(Benchmark.id)\
+        .order_by(desc(Benchmark.updated_at))\
+        .limit(1)\
+        .scalar()
+    
+    if benchmark_id is None:
+        # Every first writer inserts the same id; the losers' inserts are no-ops
+        # and all of them increment that one row below
+        stmt = _dialect_insert(session, Benchmark.__table__).values(
+            id=BENCHMARK_ROW_ID,
+            dimension_scores=DEFAULT_BASELINE.copy(),
+            assessment_count=0,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow()
+        ).on_conflict_do_nothing(index_elements=[Benchmark.id])
+        session.execute(stmt)
+        benchmark_id = BENCHMARK_ROW_ID
+    
+    values = {
+        'assessment_count': Benchmark.assessment_count + len(dimension_score_sets),
+        'dispersion_count': Benchmark.dispersion_count + len(dimension_score_sets),
+        'updated_at': datetime.utcnow()
+    }
+    for i, dim_id in enumerate(DIMENSION_IDS):
+        scores = [float(s[i]) if i < len(s) else 3.0 for s in dimension_score_sets]
+        sum_col = getattr(Benchmark, f'{dim_id}_sum')
+        sum_sq_col = getattr(Benchmark, f'{dim_id}_sum_sq')
+        dispersion_sum_col = getattr(Benchmark, f'{dim_id}_dispersion_sum')
+        values[sum_col.key] = sum_col + sum(scores)
+        values[sum_sq_col.key] = sum_sq_col + sum(score * score for score in scores)
+        values[dispersion_sum_col.key] = dispersion_sum_col + sum(scores)
+    
+    session.execute(
+        update(Benchmark)
+        .where(Benchmark.id == benchmark_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+    
+    # Postgres delivers NOTIFY on commit, so listeners only see committed updates
+    if session.get_bind().dialect.name == 'postgresql':
+        session.execute(text(f'NOTIFY {BENCHMARK_NOTIFY_CHANNEL}'))
+
+def _invalidate_benchmark_cache():
+    """Drop this process's cached moving average benchmark"""
+    from data.benchmarks import invalidate_moving_average_benchmark
+    invalidate_moving_average_benchmark()
+
+def start_benchmark_listener(on_update: Callable[[], None]) -> Optional[threading.Thread]:
+    """
+    Start a daemon thread that LISTENs for benchmark updates from other
+    processes and calls on_update for each notification.
+    Only supported on PostgreSQL; returns None for other databases.
+    """
+    from db.models import get_db_engine
+    
+    engine = get_db_engine()
+    if engine.dialect.name != 'postgresql':
+        return None
+    
+    def listen():
+        while True:
+            dbapi_conn = None
+            try:
+                # Dedicated connection detached from the pool for the thread's lifetime
+                conn = engine.raw_connection()
+                conn.detach()
+                dbapi_conn = conn.dbapi_connection
+                dbapi_conn.autocommit = True
+                with dbapi_conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN {BENCHMARK_NOTIFY_CHANNEL}')
+                # Notifications may have been missed while disconnected
+                on_update()
+                while True:
+                    if select.select([dbapi_conn], [], [], 60) == ([], [], []):
+                        continue
+                    dbapi_conn.poll()
+                    if dbapi_conn.notifies:
+                        dbapi_conn.notifies.clear()
+                        on_update()
+            except Exception as e:
+                print(f"Benchmark listener error, reconnecting: {e}")
+            finally:
+                # Detached connections are not returned to the pool, so close them here
+                if dbapi_conn is not None:
+                    try:
+                        dbapi_conn.close()
+                    except Exception:
+                        pass
+            time.sleep(5)
+    
+    thread = threading.Thread(target=listen, name='benchmark-listener', daemon=True)
+    thread.start()
+    return thread
+
+def update_benchmark_batch(dimension_score_sets: List[List[float]]) -> None:
+    """
+    Add several assessments to the benchmark with one increment statement.
+    Outliers are expected to be filtered by the caller.
+    
+    Args:
+        dimension_score_sets: List of 6-element dimension score lists
+    """
     session = get_db_session()
     try:
-        benchmark = session.query(Benchmark).order_by(desc(Benchmark.updated_at)).first()
-        
-        if benchmark:
-            return benchmark.dimension_scores
-        else:
-            return DEFAULT_BASELINE.copy()
+        _apply_benchmark_update(session, dimension_score_sets)
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        raise e
     finally:
         session.close()
+    _invalidate_benchmark_cache()
 
-def update_benchmark(new_dimension_scores: List[float]) -> Benchmark:
+def update_benchmark(new_dimension_scores: List[float]) -> None:
     """
     Update the moving average benchmark with new dimension scores.
-    Calculates the new benchmark as a moving average.
+    The running sums and count are incremented atomically; the average
+    is derived on read by get_current_benchmark().
     
     Args:
         new_dimension_scores: List of 6 dimension scores from the latest assessment
+    """
+    update_benchmark_batch([new_dimension_scores])
+
+# ------------------------
+# Email outbox
+# ------------------------
+def enqueue_outbox_email(to_email: str, subject: str, body_text: str,
+                         body_html: Optional[str] = None, from_email: str = 'me',
+                         digest: bool = False) -> int:
+    """
+    Store an email in the outbox for the background worker to deliver.
+    
+    Args:
+        digest: Hold the email to be summarized into a digest instead of sending it on its own
+    
+    Returns:
+        Id of the queued email
+    """
+    session = get_db_session()
+    try:
+        email = OutboxEmail(
+            to_email=to_email,
+            from_email=from_email,
+            subject=subject,
+            body_text=body_text,
+            body_html=body_html,
+            status='digest' if digest else 'pending',
+            attempts=0,
+            next_attempt_at=datetime.utcnow()
+        )
+        session.add(email)
+        session.commit()
+        return email.id
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+def claim_outbox_emails(limit: int, lease_seconds: int) -> List[Dict]:
+    """
+    Claim due outbox emails for delivery by this worker.
+    
+    Each row is claimed with a compare-and-set on its attempt count, so
+    concurrent workers in other processes never claim the same email. A
+    claim is a lease: if the worker dies before reporting back, the email
+    becomes due again once the lease expires.
+    
+    Args:
+        limit: Maximum number of emails to claim
+        lease_seconds: How long a claim is held before the email is retried
+    
+    Returns:
+        List of claimed emails as dictionaries (attempts already incremented)
+    """
+    session = get_db_session()
+    try:
+        now = datetime.utcnow()
+        candidates = session.query(OutboxEmail.id, OutboxEmail.attempts)\
+            .filter(OutboxEmail.status.in_(('pending', 'sending')))\
+            .filter(OutboxEmail.next_attempt_at <= now)\
+            .order_by(OutboxEmail.next_attempt_at)\
+            .limit(limit)\
+            .all()
+        
+        claimed_ids = []
+        for email_id, attempts in candidates:
+            result = session.execute(
+                update(OutboxEmail)
+                .where(OutboxEmail.id == email_id)
+                .where(OutboxEmail.attempts == attempts)
+                .where(OutboxEmail.status.in_(('pending', 'sending')))
+                .values(status='sending', attempts=attempts + 1,
+                        next_attempt_at=now + timedelta(seconds=lease_seconds))
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 1:
+                claimed_ids.append(email_id)
+        session.commit()
         
+        if not claimed_ids:
+            return []
+        emails = session.query(OutboxEmail).filter(OutboxEmail.id.in_(claimed_ids)).all()
+        return [
+            {
+                'id': email.id,
+                'to_email': email.to_email,
+                'from_email': email.from_email,
+                'subject': email.subject,
+                'body_text': email.body_text,
+                'body_html': email.body_html,
+                'attempts': email.attempts
+            }
+            for email in emails
+        ]
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+def _update_claimed_outbox_email(email_id: int, attempts: int, values: Dict) -> bool:
+    """
+    Update an email only while the caller still holds its claim: it is still
+    'sending' and nobody re-claimed it (which would have incremented attempts).
+    """
+    session = get_db_session()
+    try:
+        result = session.execute(
+            update(OutboxEmail)
+            .where(OutboxEmail.id == email_id)
+            .where(OutboxEmail.attempts == attempts)
+            .where(OutboxEmail.status == 'sending')
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        return result.rowcount == 1
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+def renew_outbox_lease(email_id: int, attempts: int, lease_seconds: int) -> bool:
+    """
+    Extend the lease on a claimed email right before sending it, so a slow
+    batch never sends an email whose earlier lease ran out.
+    
+    Args:
+        email_id: Outbox email id
+        attempts: Attempt count returned by claim_outbox_emails
+        lease_seconds: Seconds from now the claim is held
+    
+    Returns:
+        True if the claim is still held and now runs for another lease_seconds
+    """
+    return _update_claimed_outbox_email(
+        email_id, attempts, {'next_attempt_at': datetime.utcnow() + timedelta(seconds=lease_seconds)}
+    )
+
+def mark_outbox_email_sent(email_id: int, attempts: int) -> bool:
+    """
+    Record that an outbox email was delivered.
+    
+    Returns:
+        False if the claim was lost to another worker (its state is left untouched)
+    """
+    return _update_claimed_outbox_email(
+        email_id, attempts, {'status': 'sent', 'sent_at': datetime.utcnow(), 'last_error': None}
+    )
+
+def mark_outbox_email_failed(email_id: int, attempts: int, error: str, retry_at: Optional[datetime]) -> bool:
+    """
+    Record a failed delivery attempt.
+    
+    Args:
+        email_id: Outbox email id
+        attempts: Attempt count returned by claim_outbox_emails
+        error: Error message from the transport
+        retry_at: When to try again, or None to dead-letter the email
+    
     Returns:
-        Updated Benchmark object
+        False if the claim was lost to another worker (its state is left untouched)
+    """
+    values = {'last_error': error}
+    if retry_at is None:
+        values['status'] = 'dead'
+    else:
+        values['status'] = 'pending'
+        values['next_attempt_at'] = retry_at
+    return _update_claimed_outbox_email(email_id, attempts, values)
+
+def flush_outbox_digests(window_seconds: float, max_items: int,
+                         build_digest: Callable[[List[Dict]], Dict]) -> int:
+    """
+    Summarize held digest notifications into one pending email per recipient.
+    
+    A recipient's notifications are flushed once the oldest has waited
+    window_seconds. The summary is queued and its notifications are marked
+    'digested' in one transaction; if another process flushed some of
+    them first, the transaction is rolled back and nothing is sent twice.
+    
+    Args:
+        window_seconds: How long the oldest held notification waits before flushing
+        max_items: Maximum notifications summarized into one digest
+        build_digest: Callable taking the notifications (dicts with subject,
+                      body_text, body_html, created_at) and returning a dict
+                      with subject, body_text and body_html
+    
+    Returns:
+        Number of digest emails queued
     """
     session = get_db_session()
     try:
-        # Get the current benchmark
-        benchmark = session.query(Benchmark).order_by(desc(Benchmark.updated_at)).first()
+        now = datetime.utcnow()
+        due = session.query(OutboxEmail.to_email, OutboxEmail.from_email)\
+            .filter(OutboxEmail.status == 'digest')\
+            .group_by(OutboxEmail.to_email, OutboxEmail.from_email)\
+            .having(func.min(OutboxEmail.created_at) <= now - timedelta(seconds=window_seconds))\
+            .all()
         
-        if not benchmark:
-            # Create new benchmark with the default baseline
-            benchmark = Benchmark(
-                dimension_scores=DEFAULT_BASELINE.copy(),
-                assessment_count=0
+        queued = 0
+        for to_email, from_email in due:
+            held = session.query(OutboxEmail)\
+                .filter(OutboxEmail.status == 'digest')\
+                .filter(OutboxEmail.to_email == to_email)\
+                .filter(OutboxEmail.from_email == from_email)\
+                .order_by(OutboxEmail.created_at, OutboxEmail.id)\
+                .limit(max_items)\
+                .all()
+            if not held:
+                continue
+            
+            digest = build_digest([
+                {
+                    'subject': email.subject,
+                    'body_text': email.body_text,
+                    'body_html': email.body_html,
+                    'created_at': email.created_at
+                }
+                for email in held
+            ])
+            ids = [email.id for email in held]
+            result = session.execute(
+                update(OutboxEmail)
+                .where(OutboxEmail.id.in_(ids))
+                .where(OutboxEmail.status == 'digest')
+                .values(status='digested', sent_at=now)
+                .execution_options(synchronize_session=False)
             )
-            session.add(benchmark)
+            if result.rowcount != len(ids):
+                session.rollback()
+                continue
+            session.add(OutboxEmail(
+                to_email=to_email,
+                from_email=from_email,
+                subject=digest['subject'],
+                body_text=digest['body_text'],
+                body_html=digest.get('body_html'),
+                status='pending',
+                attempts=0,
+                next_attempt_at=now
+            ))
             session.commit()
-            session.refresh(benchmark)
-        
-        # Calculate moving average
-        current_scores = benchmark.dimension_scores
-        current_count = benchmark.assessment_count
+            queued += 1
+        return queued
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+def purge_sent_outbox_emails(older_than: datetime) -> int:
+    """
+    Delete delivered (or digested) emails sent before a cutoff. Dead-lettered emails are kept for inspection.
+    
+    Returns:
+        Number of rows deleted
+    """
+    session = get_db_session()
+    try:
+        deleted = session.query(OutboxEmail)\
+            .filter(OutboxEmail.status.in_(('sent', 'digested')))\
+            .filter(OutboxEmail.sent_at < older_than)\
+            .delete(synchronize_session=False)
+        session.commit()
+        return deleted
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+def get_outbox_status_counts() -> Dict[str, int]:
+    """Get the number of outbox emails per status (pending, sending, sent, dead, digest, digested)"""
+    session = get_db_session()
+    try:
+        rows = session.query(OutboxEmail.status, func.count(OutboxEmail.id))\
+            .group_by(OutboxEmail.status)\
+            .all()
+        return {status: count for status, count in rows}
+    finally:
+        session.close()
+
+# ------------------------
+# Verification codes
+# ------------------------
+def store_verification_code(email: str, code_hash: str, salt: str, ttl_seconds: float,
+                            resend_interval_seconds: float, max_sends: int, window_seconds: float) -> float:
+    """
+    Store a new verification code for an email unless sending one is throttled.
+    
+    A code may be sent at most once per resend interval and max_sends times per
+    window. The previous code is replaced and its attempt counter reset. Rows
+    are updated with a compare-and-set on last_sent_at, so concurrent requests
+    from several server processes cannot both pass the throttle.
+    
+    Args:
+        email: Normalized email address
+        code_hash: Hash of the code (the code itself is never stored)
+        salt: Salt used for the hash
+        ttl_seconds: Seconds the code stays valid
+        resend_interval_seconds: Minimum seconds between two codes for the same email
+        max_sends: Codes allowed per window
+        window_seconds: Length of the throttling window
+    
+    Returns:
+        0 if the code was stored, otherwise seconds until another code may be sent
+    """
+    session = get_db_session()
+    try:
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        row = session.query(VerificationCode.last_sent_at, VerificationCode.window_started_at,
+                            VerificationCode.sent_count)\
+            .filter(VerificationCode.email == email)\
+            .first()
         
-        # New moving average = (old_average * count + new_score) / (count + 1)
-        updated_scores = []
-        for i, new_score in enumerate(new_dimension_scores):
-            old_avg = current_scores[i] if i < len(current_scores) else 3.0
-            new_avg = (old_avg * current_count + new_score) / (current_count + 1)
-            updated_scores.append(round(new_avg, 2))
+        if row is None:
+            session.add(VerificationCode(
+                email=email, code_hash=code_hash, salt=salt, expires_at=expires_at, attempts=0,
+                sent_count=1, window_started_at=now, last_sent_at=now
+            ))
+            try:
+                session.commit()
+            except IntegrityError:
+                # Another process stored a code for this email at the same moment
+                session.rollback()
+                return float(resend_interval_seconds)
+            return 0.0
         
-        benchmark.dimension_scores = updated_scores
-        benchmark.assessment_count = current_count + 1
-        benchmark.updated_at = datetime.utcnow()
+        last_sent_at, window_started_at, sent_count = row
+        wait = (last_sent_at + timedelta(seconds=resend_interval_seconds) - now).total_seconds()
+        if window_started_at + timedelta(seconds=window_seconds) <= now:
+            window_started_at, sent_count = now, 0
+        elif sent_count >= max_sends:
+            wait = max(wait, (window_started_at + timedelta(seconds=window_seconds) - now).total_seconds())
+        if wait > 0:
+            return wait
         
+        result = session.execute(
+            update(VerificationCode)
+            .where(VerificationCode.email == email)
+            .where(VerificationCode.last_sent_at == last_sent_at)
+            .values(code_hash=code_hash, salt=salt, expires_at=expires_at, attempts=0,
+                    sent_count=sent_count + 1, window_started_at=window_started_at, last_sent_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        return 0.0 if result.rowcount == 1 else float(resend_interval_seconds)
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+def release_verification_send(email: str, code_hash: str, resend_interval_seconds: float) -> bool:
+    """
+    Give back the send slot taken by store_verification_code when the code could not be delivered.
+    
+    The undelivered code is expired, the send is no longer counted and the
+    resend interval no longer applies, so the user can retry right away.
+    Nothing is changed if a newer code has replaced this one in the meantime.
+    
+    Returns:
+        True if the slot was released
+    """
+    session = get_db_session()
+    try:
+        now = datetime.utcnow()
+        result = session.execute(
+            update(VerificationCode)
+            .where(VerificationCode.email == email)
+            .where(VerificationCode.code_hash == code_hash)
+            # store_verification_code counted this send, so sent_count is at least 1 here
+            .values(expires_at=now, sent_count=VerificationCode.sent_count - 1,
+                    last_sent_at=now - timedelta(seconds=resend_interval_seconds))
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        return result.rowcount == 1
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+def claim_verification_attempt(email: str, max_attempts: int) -> Dict:
+    """
+    Count one verification attempt against an email's current code.
+    
+    The attempt counter is incremented with a compare-and-set before the
+    caller compares the code, so concurrent guesses from several sessions
+    all count towards max_attempts.
+    
+    Returns:
+        Dictionary with 'status' ('ok', 'missing', 'expired' or 'locked');
+        for 'ok' also code_hash, salt and attempts (including this one)
+    """
+    session = get_db_session()
+    try:
+        while True:
+            now = datetime.utcnow()
+            row = session.query(VerificationCode.code_hash, VerificationCode.salt,
+                                VerificationCode.expires_at, VerificationCode.attempts)\
+                .filter(VerificationCode.email == email)\
+                .first()
+            if row is None:
+                return {'status': 'missing'}
+            code_hash, salt, expires_at, attempts = row
+            if expires_at <= now:
+                return {'status': 'expired'}
+            if attempts >= max_attempts:
+                return {'status': 'locked'}
+            
+            result = session.execute(
+                update(VerificationCode)
+                .where(VerificationCode.email == email)
+                .where(VerificationCode.code_hash == code_hash)
+                .where(VerificationCode.attempts == attempts)
+                .values(attempts=attempts + 1)
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+            if result.rowcount == 1:
+                return {'status': 'ok', 'code_hash': code_hash, 'salt': salt, 'attempts': attempts + 1}
+            # A concurrent attempt or a new code got there first; re-read the row
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+def consume_verification_code(email: str, code_hash: str) -> bool:
+    """
+    Invalidate a code after it was verified, keeping the row for send throttling.
+    
+    Returns:
+        True if this call consumed the code (False if it was already used or replaced)
+    """
+    session = get_db_session()
+    try:
+        result = session.execute(
+            update(VerificationCode)
+            .where(VerificationCode.email == email)
+            .where(VerificationCode.code_hash == code_hash)
+            .where(VerificationCode.expires_at > datetime.utcnow())
+            .values(expires_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        return result.rowcount == 1
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+def purge_expired_verification_codes(older_than: datetime) -> int:
+    """
+    Delete verification codes that expired before a cutoff.
+    
+    Returns:
+        Number of rows deleted
+    """
+    session = get_db_session()
+    try:
+        deleted = session.query(VerificationCode)\
+            .filter(VerificationCode.expires_at < older_than)\
+            .delete(synchronize_session=False)
         session.commit()
-        session.refresh(benchmark)
-        return benchmark
+        return deleted
     except Exception as e:
         session.rollback()
         raise e
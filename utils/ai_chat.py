@@ -1,11 +1,11 @@
 import os
-from openai import OpenAI
 
 # the newest OpenAI model is "gpt-5" which was released August 7, 2025.
 # do not change this unless explicitly requested by the user
 
 def get_openai_client():
     """Get OpenAI client instance"""
+    from openai import OpenAI  # loaded on first chat, not at app start
     OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
     if not OPENAI_API_KEY:
         raise ValueError("OPENAI_API_KEY environment variable is not set")
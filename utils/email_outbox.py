@@ -0,0 +1,235 @@
+"""
+Durable outbound email queue for AI Process Readiness Assessment
+
+UI actions store notification emails in the email_outbox table and return
+immediately. A daemon thread in each server process drains the table:
+failed sends are retried with exponential backoff and dead-lettered after
+OUTBOX_MAX_ATTEMPTS, so a slow or failing Gmail API never blocks a session
+and no email is lost when a process restarts.
+
+With ADMIN_NOTIFICATION_MODE=digest, admin notifications (registrations,
+completions, report downloads) are held and sent as one summary email per
+ADMIN_DIGEST_WINDOW_SECONDS instead of one email per user action.
+Verification codes and replies to user requests are always sent on their own.
+
+Drain the outbox once and show its status with:  python -m utils.email_outbox
+"""
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from html import escape
+
+# Set to false to send every email synchronously (the pre-outbox behavior)
+EMAIL_OUTBOX_ENABLED = os.environ.get('EMAIL_OUTBOX_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+# Seconds the worker sleeps between polls when it is not woken by a new email
+OUTBOX_POLL_SECONDS = float(os.environ.get('OUTBOX_POLL_SECONDS', '5'))
+# Emails claimed per poll
+OUTBOX_BATCH_SIZE = int(os.environ.get('OUTBOX_BATCH_SIZE', '10'))
+# Seconds a claimed email is reserved for this worker before another may retry it; renewed
+# right before each send, so it must exceed one send (transport timeout plus token fetch)
+OUTBOX_LEASE_SECONDS = int(os.environ.get('OUTBOX_LEASE_SECONDS', '120'))
+# Delivery attempts before an email is dead-lettered
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get('OUTBOX_MAX_ATTEMPTS', '6'))
+# Retry backoff: base * 2^(attempt - 1) seconds, capped at the maximum
+OUTBOX_BACKOFF_BASE_SECONDS = float(os.environ.get('OUTBOX_BACKOFF_BASE_SECONDS', '30'))
+OUTBOX_BACKOFF_MAX_SECONDS = float(os.environ.get('OUTBOX_BACKOFF_MAX_SECONDS', '3600'))
+# Days delivered emails are kept before being purged (dead letters are kept)
+OUTBOX_RETENTION_DAYS = float(os.environ.get('OUTBOX_RETENTION_DAYS', '7'))
+
+# 'immediate' sends one email per admin notification; 'digest' batches them into summaries
+ADMIN_NOTIFICATION_MODE = os.environ.get('ADMIN_NOTIFICATION_MODE', 'immediate').lower()
+# Seconds the oldest held notification waits before a digest is sent
+ADMIN_DIGEST_WINDOW_SECONDS = float(os.environ.get('ADMIN_DIGEST_WINDOW_SECONDS', '900'))
+# Maximum notifications summarized into one digest email
+ADMIN_DIGEST_MAX_ITEMS = int(os.environ.get('ADMIN_DIGEST_MAX_ITEMS', '100'))
+
+# Seconds between purges of old delivered emails
+_PURGE_INTERVAL_SECONDS = 3600
+
+_worker = None
+_worker_lock = threading.Lock()
+# Set when an email is queued so the worker delivers it without waiting for the next poll
+_wake = threading.Event()
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds to wait before the next delivery attempt after `attempts` failed ones"""
+    return min(OUTBOX_BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)), OUTBOX_BACKOFF_MAX_SECONDS)
+
+
+def _send_now(to_email, subject, body_text, body_html=None, from_email='me'):
+    """Deliver an email immediately through the configured mail transport"""
+    from utils.mail_transport import send_message
+    return send_message(to_email, subject, body_text, body_html, from_email)
+
+
+def queue_email(to_email, subject, body_text, body_html=None, from_email='me', digest=False):
+    """
+    Queue an email for background delivery.
+
+    Falls back to sending synchronously when the outbox is disabled or the
+    database is unavailable, so the email is never silently dropped.
+
+    Args:
+        digest: Hold the email for the next digest to this recipient instead of sending it alone
+
+    Returns:
+        Tuple of (success, message), like send_email
+    """
+    if not EMAIL_OUTBOX_ENABLED:
+        return _send_now(to_email, subject, body_text, body_html, from_email)
+
+    try:
+        from db.operations import enqueue_outbox_email
+        email_id = enqueue_outbox_email(to_email, subject, body_text, body_html, from_email, digest=digest)
+    except Exception as e:
+        print(f"Error queueing email, sending directly: {e}")
+        return _send_now(to_email, subject, body_text, body_html, from_email)
+
+    start_outbox_worker()
+    if digest:
+        return True, f"Notification held for the next digest (outbox id {email_id})"
+    _wake.set()
+    return True, f"Email queued for delivery (outbox id {email_id})"
+
+
+def queue_admin_notification(to_email, subject, body_text, body_html=None):
+    """Queue a T-Logic notification email, batched into digests when ADMIN_NOTIFICATION_MODE is 'digest'"""
+    return queue_email(to_email, subject, body_text, body_html, digest=ADMIN_NOTIFICATION_MODE == 'digest')
+
+
+def _html_body_fragment(body_html, body_text):
+    """Inner <body> markup of a notification, or its text body when it has no HTML part"""
+    if body_html:
+        match = re.search(r'<body[^>]*>(.*)</body>', body_html, re.S | re.I)
+        return match.group(1) if match else body_html
+    return f'<pre style="white-space: pre-wrap;">{escape(body_text)}</pre>'
+
+
+def build_digest(notifications):
+    """
+    Combine held notifications into one summary email.
+
+    Args:
+        notifications: List of dicts with subject, body_text, body_html and created_at
+
+    Returns:
+        Dictionary with subject, body_text and body_html
+    """
+    count = len(notifications)
+    subject = f"AI Readiness Assessment activity digest - {count} notification{'s' if count != 1 else ''}"
+
+    text_parts = [f"{count} notification(s) from AI Process Readiness Assessment\n"]
+    html_parts = [
+        '<html>\n<body style="font-family: Arial, sans-serif; color: #333;">',
+        f'<h2 style="color: #BF6A16;">Activity Digest ({count})</h2>',
+        '<ul>'
+    ]
+    html_parts += [
+        f"<li>{n['created_at']:%Y-%m-%d %H:%M} UTC - {escape(n['subject'])}</li>" for n in notifications
+    ]
+    html_parts.append('</ul>')
+
+    for i, n in enumerate(notifications, 1):
+        text_parts.append(f"{'=' * 60}\n[{i}/{count}] {n['subject']} ({n['created_at']:%Y-%m-%d %H:%M} UTC)\n{'=' * 60}")
+        text_parts.append(n['body_text'].strip() + "\n")
+        html_parts.append('<hr style="margin: 30px 0;">')
+        html_parts.append(f"<h3>[{i}/{count}] {escape(n['subject'])}</h3>")
+        html_parts.append(_html_body_fragment(n['body_html'], n['body_text']))
+
+    html_parts.append('</body>\n</html>')
+    return {'subject': subject, 'body_text': "\n".join(text_parts), 'body_html': "\n".join(html_parts)}
+
+
+def flush_due_digests() -> int:
+    """Queue a digest for every recipient whose oldest held notification has waited a full window"""
+    from db.operations import flush_outbox_digests
+    return flush_outbox_digests(ADMIN_DIGEST_WINDOW_SECONDS, ADMIN_DIGEST_MAX_ITEMS, build_digest)
+
+
+def deliver_due_emails(send=None) -> int:
+    """
+    Claim and deliver one batch of due outbox emails.
+
+    Args:
+        send: Transport callable (to, subject, text, html, from) -> (success, message);
+              defaults to the configured mail transport
+
+    Returns:
+        Number of emails attempted
+    """
+    from db.operations import (claim_outbox_emails, renew_outbox_lease, mark_outbox_email_sent,
+                               mark_outbox_email_failed)
+
+    send = send or _send_now
+    emails = claim_outbox_emails(OUTBOX_BATCH_SIZE, OUTBOX_LEASE_SECONDS)
+    for email in emails:
+        # Earlier sends in the batch may have been slow: restart the lease for this
+        # email, and skip it if it expired and another worker has claimed it since
+        if not renew_outbox_lease(email['id'], email['attempts'], OUTBOX_LEASE_SECONDS):
+            continue
+        try:
+            success, message = send(email['to_email'], email['subject'], email['body_text'],
+                                    email['body_html'], email['from_email'])
+        except Exception as e:
+            success, message = False, f"Error sending email: {e}"
+
+        if success:
+            recorded = mark_outbox_email_sent(email['id'], email['attempts'])
+        elif email['attempts'] >= OUTBOX_MAX_ATTEMPTS:
+            print(f"Dead-lettering outbox email {email['id']} after {email['attempts']} attempts: {message}")
+            recorded = mark_outbox_email_failed(email['id'], email['attempts'], message, retry_at=None)
+        else:
+            retry_at = datetime.utcnow() + timedelta(seconds=retry_delay(email['attempts']))
+            recorded = mark_outbox_email_failed(email['id'], email['attempts'], message, retry_at=retry_at)
+        if not recorded:
+            print(f"Outbox email {email['id']} was re-claimed by another worker; not recording this attempt")
+    return len(emails)
+
+
+def _purge_delivered():
+    """Delete delivered emails older than the retention period"""
+    from db.operations import purge_sent_outbox_emails
+    purge_sent_outbox_emails(datetime.utcnow() - timedelta(days=OUTBOX_RETENTION_DAYS))
+
+
+def _run_worker():
+    """Worker loop: flush due digests, deliver due emails until the batch comes back empty, then wait"""
+    last_purge = None
+    while True:
+        _wake.clear()
+        try:
+            # Always flushed, so notifications held before switching back to immediate mode still go out
+            flush_due_digests()
+            while deliver_due_emails() == OUTBOX_BATCH_SIZE:
+                pass
+            now = time.monotonic()
+            if last_purge is None or now - last_purge >= _PURGE_INTERVAL_SECONDS:
+                _purge_delivered()
+                last_purge = now
+        except Exception as e:
+            print(f"Email outbox worker error: {e}")
+        _wake.wait(OUTBOX_POLL_SECONDS)
+
+
+def start_outbox_worker():
+    """Start this process's outbox worker thread once"""
+    global _worker
+    if _worker is not None:
+        return _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_run_worker, name='email-outbox', daemon=True)
+            _worker.start()
+    return _worker
+
+
+if __name__ == '__main__':
+    from db.operations import ensure_tables_exist, get_outbox_status_counts
+
+    ensure_tables_exist()
+    print(f"Queued {flush_due_digests()} digest(s)")
+    print(f"Attempted {deliver_due_emails()} email(s)")
+    print(f"Outbox: {get_outbox_status_counts()}")
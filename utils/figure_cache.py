@@ -0,0 +1,51 @@
+"""
+Process-level cache of built Plotly figures for the results dashboard
+
+Charts are keyed on their inputs (scores, benchmark scores, brand color) and
+the fully built go.Figure is kept, so a cache hit skips building and
+validating the figure again. st.plotly_chart only serializes a figure, so
+one cached instance can be shared by every session; callers must not
+modify returned figures (copy.deepcopy one first if needed).
+"""
+import os
+import threading
+from collections import OrderedDict
+
+# Maximum number of figures kept; least recently used are evicted first
+FIGURE_CACHE_SIZE = int(os.environ.get('FIGURE_CACHE_SIZE', '256'))
+
+_figure_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_cached_figure(key, build_figure):
+    """
+    Get a figure from the cache, building and storing it on a miss.
+
+    Args:
+        key: Hashable tuple of everything the figure depends on
+        build_figure: Callable returning a go.Figure for this key
+
+    Returns:
+        Shared go.Figure for this key (treat as read-only)
+    """
+    with _cache_lock:
+        fig = _figure_cache.get(key)
+        if fig is not None:
+            _figure_cache.move_to_end(key)
+            return fig
+
+    fig = build_figure()
+
+    with _cache_lock:
+        fig = _figure_cache.setdefault(key, fig)
+        _figure_cache.move_to_end(key)
+        while len(_figure_cache) > FIGURE_CACHE_SIZE:
+            _figure_cache.popitem(last=False)
+    return fig
+
+
+def clear_figure_cache():
+    """Drop all cached figures"""
+    with _cache_lock:
+        _figure_cache.clear()
@@ -1,63 +1,164 @@
 import os
 import base64
 import json
-import requests
-import random
+import secrets
 import string
+import threading
+import time
+from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 
-def get_gmail_access_token():
-    """Get Gmail access token from Replit connection"""
-    try:
-        hostname = os.environ.get('REPLIT_CONNECTORS_HOSTNAME')
-        x_replit_token = None
-        
-        # Check for REPL_IDENTITY (repl token) or WEB_REPL_RENEWAL (deployment token)
-        repl_identity = os.environ.get('REPL_IDENTITY')
-        web_repl_renewal = os.environ.get('WEB_REPL_RENEWAL')
-        
-        if repl_identity:
-            x_replit_token = 'repl ' + repl_identity
-        elif web_repl_renewal:
-            x_replit_token = 'depl ' + web_repl_renewal
-        
-        if not hostname or not x_replit_token:
-            raise Exception('Replit connection environment variables not found')
-        
-        # Fetch connection settings from Replit
-        url = f'https://{hostname}/api/v2/connection?include_secrets=true&connector_names=google-mail'
-        headers = {
-            'Accept': 'application/json',
-            'X_REPLIT_TOKEN': x_replit_token
-        }
-        
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+from utils.email_outbox import queue_email, queue_admin_notification
+
+# Seconds to wait for the Replit connector when fetching a Gmail access token
+GMAIL_TOKEN_TIMEOUT_SECONDS = float(os.environ.get('GMAIL_TOKEN_TIMEOUT_SECONDS', '10'))
+# Fetch a new token this many seconds before the cached one expires
+GMAIL_TOKEN_REFRESH_MARGIN_SECONDS = float(os.environ.get('GMAIL_TOKEN_REFRESH_MARGIN_SECONDS', '300'))
+# Lifetime assumed for tokens whose expiry the connector does not report
+GMAIL_TOKEN_DEFAULT_TTL_SECONDS = float(os.environ.get('GMAIL_TOKEN_DEFAULT_TTL_SECONDS', '900'))
+# Socket timeout for Gmail API calls
+GMAIL_API_TIMEOUT_SECONDS = float(os.environ.get('GMAIL_API_TIMEOUT_SECONDS', '30'))
+
+# Process-wide access token cache: {'token': str, 'expires_at': epoch seconds}
+_token_cache = {'token': None, 'expires_at': 0.0}
+# Held while fetching, so concurrent senders share a single connector request
+_token_lock = threading.Lock()
+_connector_session = None
+
+# Gmail API service built once per process; its credentials get the current token before each send
+_gmail_service = None
+_gmail_credentials = None
+_service_lock = threading.Lock()
+# httplib2 connections are not thread-safe, so each sending thread keeps its own keep-alive connection
+_thread_http = threading.local()
+
+def _token_expiry(settings):
+    """Epoch seconds at which the connector's access token expires, or None if not reported"""
+    credentials = settings.get('oauth', {}).get('credentials', {})
+    expires_at = settings.get('expires_at') or credentials.get('expires_at')
+    if isinstance(expires_at, str):
+        try:
+            return datetime.fromisoformat(expires_at.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            pass
+    expires_in = credentials.get('expires_in')
+    if expires_in:
+        return time.time() + float(expires_in)
+    return None
+
+def _fetch_gmail_access_token():
+    """
+    Fetch a Gmail access token from the Replit connection.
+    
+    Returns:
+        Tuple of (access token, expiry as epoch seconds)
+    """
+    global _connector_session
+    
+    hostname = os.environ.get('REPLIT_CONNECTORS_HOSTNAME')
+    x_replit_token = None
+    
+    # Check for REPL_IDENTITY (repl token) or WEB_REPL_RENEWAL (deployment token)
+    repl_identity = os.environ.get('REPL_IDENTITY')
+    web_repl_renewal = os.environ.get('WEB_REPL_RENEWAL')
+    
+    if repl_identity:
+        x_replit_token = 'repl ' + repl_identity
+    elif web_repl_renewal:
+        x_replit_token = 'depl ' + web_repl_renewal
+    
+    if not hostname or not x_replit_token:
+        raise Exception('Replit connection environment variables not found')
+    
+    # Fetch connection settings from Replit
+    url = f'https://{hostname}/api/v2/connection?include_secrets=true&connector_names=google-mail'
+    headers = {
+        'Accept': 'application/json',
+        'X_REPLIT_TOKEN': x_replit_token
+    }
+    
+    if _connector_session is None:
+        import requests
+        _connector_session = requests.Session()
+    response = _connector_session.get(url, headers=headers, timeout=GMAIL_TOKEN_TIMEOUT_SECONDS)
+    response.raise_for_status()
+    
+    data = response.json()
+    connection_settings = data.get('items', [{}])[0]
+    settings = connection_settings.get('settings', {})
+    
+    # Get access token from connection settings
+    access_token = (
+        settings.get('access_token') or
+        settings.get('oauth', {}).get('credentials', {}).get('access_token')
+    )
+    
+    if not access_token:
+        raise Exception('Gmail access token not found in connection')
+    
+    expires_at = _token_expiry(settings) or time.time() + GMAIL_TOKEN_DEFAULT_TTL_SECONDS
+    return access_token, expires_at
+
+def get_gmail_access_token(force_refresh=False):
+    """
+    Get a Gmail access token from Replit connection, cached until shortly before it expires.
+    
+    Args:
+        force_refresh: Ignore the cached token (e.g. after the API rejected it)
+    
+    Returns:
+        Access token, or None if it could not be fetched
+    """
+    with _token_lock:
+        if (not force_refresh and _token_cache['token']
+                and time.time() < _token_cache['expires_at'] - GMAIL_TOKEN_REFRESH_MARGIN_SECONDS):
+            return _token_cache['token']
         
-        data = response.json()
-        connection_settings = data.get('items', [{}])[0]
-        
-        # Get access token from connection settings
-        access_token = (
-            connection_settings.get('settings', {}).get('access_token') or
-            connection_settings.get('settings', {}).get('oauth', {}).get('credentials', {}).get('access_token')
-        )
-        
-        if not access_token:
-            raise Exception('Gmail access token not found in connection')
+        try:
+            access_token, expires_at = _fetch_gmail_access_token()
+        except Exception as e:
+            print(f"Error getting Gmail access token: {e}")
+            _token_cache['token'] = None
+            return None
         
+        _token_cache['token'] = access_token
+        _token_cache['expires_at'] = expires_at
         return access_token
-    
-    except Exception as e:
-        print(f"Error getting Gmail access token: {e}")
-        return None
 
-def create_message(sender, to, subject, body_text, body_html=None):
-    """Create a message for an email"""
+def _get_gmail_service(access_token):
+    """Get the process-wide Gmail API service, building it (and parsing discovery) only once"""
+    global _gmail_service, _gmail_credentials
+    
+    with _service_lock:
+        if _gmail_service is None:
+            from google.oauth2.credentials import Credentials
+            from googleapiclient.discovery import build
+            
+            _gmail_credentials = Credentials(token=access_token)
+            # Bundled discovery document: no network fetch, no discovery cache lookups
+            _gmail_service = build('gmail', 'v1', credentials=_gmail_credentials,
+                                   static_discovery=True, cache_discovery=False)
+        _gmail_credentials.token = access_token
+        return _gmail_service
+
+def _get_thread_http():
+    """Get this thread's authorized HTTP connection to the Gmail API"""
+    http = getattr(_thread_http, 'http', None)
+    if http is None:
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+        
+        # The connector token has no refresh token, so AuthorizedHttp must not try to refresh it
+        # itself (that raises RefreshError); a 401 comes back as HttpError and
+        # send_gmail_message retries once with a freshly fetched token
+        http = AuthorizedHttp(_gmail_credentials, http=httplib2.Http(timeout=GMAIL_API_TIMEOUT_SECONDS),
+                              refresh_status_codes=())
+        _thread_http.http = http
+    return http
+
+def build_mime_message(sender, to, subject, body_text, body_html=None):
+    """Build the MIME message for an email (plain text, or text and HTML alternatives)"""
     if body_html:
         message = MIMEMultipart('alternative')
         part1 = MIMEText(body_text, 'plain')
@@ -70,30 +171,53 @@ def create_message(sender, to, subject, body_text, body_html=None):
     message['to'] = to
     message['from'] = sender
     message['subject'] = subject
+    return message
+
+def create_message(sender, to, subject, body_text, body_html=None):
+    """Create a message for an email"""
+    message = build_mime_message(sender, to, subject, body_text, body_html)
     
     # Encode as base64url
     raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
     return {'raw': raw}
 
 def send_email(to_email, subject, body_text, body_html=None, from_email='me'):
+    """
+    Send an email now through the configured mail transport (see utils.mail_transport).
+    
+    Returns:
+        Tuple of (success, message)
+    """
+    from utils.mail_transport import send_message
+    return send_message(to_email, subject, body_text, body_html, from_email)
+
+def send_gmail_message(to_email, subject, body_text, body_html=None, from_email='me'):
     """Send an email using Gmail API"""
+    # The Google API client is heavy; load it only when mail is actually sent
+    from googleapiclient.errors import HttpError
+    
     try:
         # Get access token
         access_token = get_gmail_access_token()
         if not access_token:
             return False, "Failed to get Gmail access token"
         
-        # Create credentials from access token
-        creds = Credentials(token=access_token)
-        
-        # Build Gmail API service
-        service = build('gmail', 'v1', credentials=creds)
-        
         # Create message
         message = create_message(from_email, to_email, subject, body_text, body_html)
         
         # Send message
-        result = service.users().messages().send(userId='me', body=message).execute()
+        try:
+            service = _get_gmail_service(access_token)
+            result = service.users().messages().send(userId='me', body=message).execute(http=_get_thread_http())
+        except HttpError as error:
+            if error.resp.status != 401:
+                raise
+            # Token was revoked or expired early: fetch a fresh one and retry once
+            access_token = get_gmail_access_token(force_refresh=True)
+            if not access_token:
+                return False, "Failed to get Gmail access token"
+            service = _get_gmail_service(access_token)
+            result = service.users().messages().send(userId='me', body=message).execute(http=_get_thread_http())
         
         return True, f"Email sent successfully! Message ID: {result['id']}"
     
@@ -139,7 +263,7 @@ Sent from AI Process Readiness Assessment Tool
 </html>
 """
     
-    return send_email('info@tlogic.consulting', subject, body_text, body_html)
+    return queue_email('info@tlogic.consulting', subject, body_text, body_html)
 
 def send_user_registration_email(user_name, user_email, user_title=None, user_company=None, user_phone=None, user_location=None):
     """Send user registration notification email to T-Logic"""
@@ -185,7 +309,7 @@ Sent from AI Process Readiness Assessment Tool
 </html>
 """
     
-    return send_email('info@tlogic.consulting', subject, body_text, body_html)
+    return queue_admin_notification('info@tlogic.consulting', subject, body_text, body_html)
 
 def send_assistance_request_email(user_name, user_email, query=None, assessment_results=None):
     """Send assistance request email to T-Logic"""
@@ -240,20 +364,20 @@ Sent from AI Process Readiness Assessment Tool
 </html>
 """
     
-    return send_email('tej@tlogic.consulting', subject, body_text, body_html)
+    return queue_email('tej@tlogic.consulting', subject, body_text, body_html)
 
 def generate_verification_code():
-    """Generate a 6-digit verification code"""
-    return ''.join(random.choices(string.digits, k=6))
+    """Generate a 6-digit verification code from a cryptographically secure source"""
+    return ''.join(secrets.choice(string.digits) for _ in range(6))
 
-def send_verification_code_email(user_email, verification_code):
+def send_verification_code_email(user_email, verification_code, valid_minutes=10):
     """Send verification code to user's email"""
     subject = "Your AI Readiness Assessment Report Verification Code"
     
     body_text = f"""
 Verification Code: {verification_code}
 
-This code is valid for 10 minutes. Please enter this code to download your AI Process Readiness Assessment Report.
+This code is valid for {valid_minutes} minutes. Please enter this code to download your AI Process Readiness Assessment Report.
 
 If you did not request this code, please ignore this email.
 
@@ -269,7 +393,7 @@ Sent from AI Process Readiness Assessment Tool
     <p>Your verification code is:</p>
     <h1 style="text-align: center; color: #BF6A16; letter-spacing: 2px; font-size: 2rem;">{verification_code}</h1>
     
-    <p>This code is valid for 10 minutes. Please enter this code in the dialog to download your AI Process Readiness Assessment Report.</p>
+    <p>This code is valid for {valid_minutes} minutes. Please enter this code in the dialog to download your AI Process Readiness Assessment Report.</p>
     
     <p style="color: #999; font-size: 0.9em; margin-top: 30px;">If you did not request this code, please ignore this email.</p>
     
@@ -323,7 +447,7 @@ Sent from AI Process Readiness Assessment Tool
 </html>
 """
     
-    return send_email('tej@tlogic.consulting', subject, body_text, body_html)
+    return queue_admin_notification('tej@tlogic.consulting', subject, body_text, body_html)
 
 def send_assessment_completion_email(user_name, user_email, user_title, user_company, user_phone, user_location, ai_stage, assessment_results):
     """Send complete assessment results to T-Logic after user completes assessment"""
@@ -420,4 +544,4 @@ Sent from AI Process Readiness Assessment Tool
 </html>
 """
     
-    return send_email('tej@tlogic.consulting', subject, body_text, body_html)
+    return queue_admin_notification('tej@tlogic.consulting', subject, body_text, body_html)
@@ -0,0 +1,79 @@
+"""
+Start-up import budget check for the Streamlit app
+
+Imports app.py in a fresh interpreter and fails when heavy optional
+dependencies get imported at start-up again, or when the app's own import
+time (on top of Streamlit itself) exceeds the budget.
+
+Run with:  python -m utils.import_budget
+"""
+import json
+import os
+import subprocess
+import sys
+
+# Milliseconds app.py may add on top of importing Streamlit
+IMPORT_BUDGET_MS = float(os.environ.get('IMPORT_BUDGET_MS', '750'))
+
+# Modules that must only be loaded on first use
+# (plotly itself is not listed: Streamlit imports it for st.plotly_chart)
+LAZY_MODULES = (
+    'pandas',
+    'reportlab',
+    'matplotlib',
+    'googleapiclient',
+    'google.oauth2',
+    'openai',
+    'requests',
+    'PIL.Image',
+)
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+# Streamlit loads its element modules on first st.* call; count them as Streamlit's cost
+import streamlit, streamlit.delta_generator, streamlit.emojis
+t1 = time.perf_counter()
+import app
+t2 = time.perf_counter()
+print(json.dumps({
+    'streamlit_ms': (t1 - t0) * 1000,
+    'app_ms': (t2 - t1) * 1000,
+    'loaded': sorted(m for m in %r if m in sys.modules),
+}))
+""" % (LAZY_MODULES,)
+
+
+def measure_import():
+    """
+    Import app.py in a fresh interpreter.
+
+    Returns:
+        Dictionary with streamlit_ms, app_ms and loaded (lazy modules that were imported)
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, '-c', _PROBE],
+        cwd=root, capture_output=True, text=True, check=True
+    )
+    # Streamlit may log warnings when imported outside `streamlit run`; the probe prints JSON last
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    stats = measure_import()
+    print(f"streamlit: {stats['streamlit_ms']:.0f} ms, app: {stats['app_ms']:.0f} ms "
+          f"(budget {IMPORT_BUDGET_MS:.0f} ms)")
+
+    failed = False
+    if stats['loaded']:
+        print(f"Loaded at start-up but should be lazy: {', '.join(stats['loaded'])}")
+        failed = True
+    if stats['app_ms'] > IMPORT_BUDGET_MS:
+        print("App import time is over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
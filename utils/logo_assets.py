@@ -0,0 +1,241 @@
+"""
+Logo asset store for AI Process Readiness Assessment
+
+Logos are decoded once and identified by the SHA-256 of their file bytes.
+Resized PNG and base64 variants are kept per (logo, target height), so the
+UI headers, the HTML report and the PDF report reuse the same encoded bytes
+instead of resizing and re-encoding the image on every rerun.
+
+Uploaded logo bytes are also written to LOGO_STORE_DIR under their id, so a
+logo evicted from memory is transparently decoded again on its next use.
+"""
+import base64
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+# Maximum number of distinct logos kept in memory (least recently used are dropped)
+LOGO_CACHE_SIZE = int(os.environ.get('LOGO_CACHE_SIZE', '64'))
+
+# Directory keeping uploaded logo bytes by id, so logos evicted from memory can be reloaded
+LOGO_STORE_DIR = os.environ.get('LOGO_STORE_DIR', 'logo_store')
+# Maximum total size of LOGO_STORE_DIR; least recently used logos are deleted first
+LOGO_STORE_MAX_BYTES = int(float(os.environ.get('LOGO_STORE_MAX_MB', '64')) * 1024 * 1024)
+
+# logo id -> {'image': decoded PIL image, 'png': {height: bytes}, 'b64': {height: str}}
+_logos = OrderedDict()
+# file path -> (mtime, logo id)
+_logo_files = {}
+# logo id -> file path, for logos registered from disk
+_logo_paths = {}
+_cache_lock = threading.Lock()
+# Serializes writes and evictions in LOGO_STORE_DIR
+_store_lock = threading.Lock()
+
+
+def _store_path(logo_id):
+    return os.path.join(LOGO_STORE_DIR, f"{logo_id}.img")
+
+
+def _evict_store(keep):
+    """Delete least recently used stored logos until the store fits LOGO_STORE_MAX_BYTES"""
+    files = []
+    total = 0
+    with os.scandir(LOGO_STORE_DIR) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith('.img'):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+    for _, size, path in sorted(files):
+        if total <= LOGO_STORE_MAX_BYTES:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def _save_logo_bytes(logo_id, data):
+    """Keep an uploaded logo on disk (written atomically) so it survives memory eviction"""
+    path = _store_path(logo_id)
+    try:
+        with _store_lock:
+            if os.path.exists(path):
+                os.utime(path)
+                return
+            os.makedirs(LOGO_STORE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            _evict_store(keep=path)
+    except OSError as e:
+        print(f"Error storing logo {logo_id}: {e}")
+
+
+def _reload_logo(logo_id):
+    """
+    Decode a logo that was evicted from memory again from its file or stored upload.
+
+    Returns:
+        True if the logo is registered again
+    """
+    if not logo_id:
+        return False
+    with _cache_lock:
+        path = _logo_paths.get(logo_id)
+    if path is not None:
+        return register_logo_file(path) == logo_id
+    try:
+        with open(_store_path(logo_id), 'rb') as f:
+            data = f.read()
+    except OSError:
+        return False
+    return register_logo_bytes(data) == logo_id
+
+
+def _get_entry(logo_id):
+    """Get a logo's cache entry (marking it recently used), reloading it if it was evicted"""
+    with _cache_lock:
+        entry = _logos.get(logo_id)
+        if entry is not None:
+            _logos.move_to_end(logo_id)
+            return entry
+    if not _reload_logo(logo_id):
+        return None
+    with _cache_lock:
+        return _logos.get(logo_id)
+
+
+def register_logo_bytes(data: bytes):
+    """
+    Add a logo to the store, decoding it only if it has not been seen before.
+
+    Args:
+        data: Raw image file bytes (PNG, JPG)
+
+    Returns:
+        Logo id (content hash) used to fetch variants
+    """
+    logo_id = hashlib.sha256(data).hexdigest()
+    with _cache_lock:
+        if logo_id in _logos:
+            _logos.move_to_end(logo_id)
+            return logo_id
+
+    from PIL import Image
+
+    image = Image.open(BytesIO(data))
+    image.load()
+
+    with _cache_lock:
+        _logos.setdefault(logo_id, {'image': image, 'png': {}, 'b64': {}})
+        _logos.move_to_end(logo_id)
+        while len(_logos) > LOGO_CACHE_SIZE:
+            _logos.popitem(last=False)
+    return logo_id
+
+
+def register_upload(data: bytes):
+    """
+    Add an uploaded logo, keeping its bytes on disk so it can be reloaded after eviction.
+
+    Returns:
+        Logo id (content hash) used to fetch variants
+    """
+    logo_id = register_logo_bytes(data)
+    _save_logo_bytes(logo_id, data)
+    return logo_id
+
+
+def register_logo_file(path: str):
+    """
+    Add a logo from disk; the file is only re-read when it changes.
+
+    Returns:
+        Logo id, or None if the file cannot be read
+    """
+    try:
+        mtime = os.path.getmtime(path)
+        with _cache_lock:
+            cached = _logo_files.get(path)
+            if cached and cached[0] == mtime and cached[1] in _logos:
+                return cached[1]
+        with open(path, 'rb') as f:
+            logo_id = register_logo_bytes(f.read())
+        with _cache_lock:
+            _logo_files[path] = (mtime, logo_id)
+            _logo_paths[logo_id] = path
+        return logo_id
+    except Exception as e:
+        print(f"Error loading logo {path}: {e}")
+        return None
+
+
+def _render_png(image, height):
+    """Encode a logo as PNG, optionally resized to a target height keeping its aspect ratio"""
+    from PIL import Image
+
+    if height:
+        aspect_ratio = image.width / image.height
+        new_width = int(height * aspect_ratio)
+        image = image.resize((new_width, height), Image.Resampling.LANCZOS)
+
+    buffered = BytesIO()
+    image.save(buffered, format="PNG")
+    return buffered.getvalue()
+
+
+def get_logo_png(logo_id, height=None):
+    """
+    Get PNG bytes for a registered logo.
+
+    Args:
+        logo_id: Id returned by register_logo_bytes / register_logo_file
+        height: Target height in pixels, or None for the original size
+
+    Returns:
+        PNG bytes, or None if the logo is unknown
+    """
+    entry = _get_entry(logo_id)
+    if entry is None:
+        return None
+    with _cache_lock:
+        png = entry['png'].get(height)
+    if png is not None:
+        return png
+
+    png = _render_png(entry['image'], height)
+    with _cache_lock:
+        entry['png'][height] = png
+    return png
+
+
+def get_logo_base64(logo_id, height=None):
+    """
+    Get a base64 encoded PNG for a registered logo (for data: URIs).
+
+    Returns:
+        Base64 string, or None if the logo is unknown
+    """
+    entry = _get_entry(logo_id)
+    if entry is None:
+        return None
+    with _cache_lock:
+        b64 = entry['b64'].get(height)
+    if b64 is not None:
+        return b64
+
+    png = get_logo_png(logo_id, height)
+    if png is None:
+        return None
+    b64 = base64.b64encode(png).decode()
+    with _cache_lock:
+        entry['b64'][height] = b64
+    return b64
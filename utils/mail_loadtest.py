@@ -0,0 +1,151 @@
+"""
+End-to-end load test for the assessment email path
+
+Sends synthetic assessment completion emails the way the app does (queued
+in the outbox, then delivered by the outbox worker through the configured
+mail transport) and reports what a user waits for (enqueue latency) and
+what the mail backend sees (per-send latency and throughput).
+
+Run against a local SMTP stand-in:
+    python -m aiosmtpd -n -l localhost:8025
+    MAIL_TRANSPORT=smtp SMTP_PORT=8025 python -m utils.mail_loadtest --emails 500 --threads 8
+
+or let the tool start aiosmtpd in process (pip install aiosmtpd):
+    MAIL_TRANSPORT=smtp SMTP_PORT=8025 python -m utils.mail_loadtest --smtpd
+
+Without DATABASE_URL the outbox is unavailable and emails are sent inline,
+which measures the synchronous path instead.
+
+With DATABASE_URL the test emails (including admin notifications addressed to
+the real admin mailbox) are written to that database's email_outbox, where
+any running app's outbox worker may claim and deliver them through its own
+transport. The tool therefore refuses to run unless --isolated-db confirms
+the database is a throwaway one that no app process uses.
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _start_smtpd(host, port):
+    """Start an in-process aiosmtpd server that accepts and discards every message"""
+    try:
+        from aiosmtpd.controller import Controller
+    except ImportError:
+        print("aiosmtpd is not installed (pip install aiosmtpd); start an SMTP server yourself instead")
+        sys.exit(1)
+
+    class DiscardHandler:
+        async def handle_DATA(self, server, session, envelope):
+            return '250 Message accepted'
+
+    controller = Controller(DiscardHandler(), hostname=host, port=port)
+    controller.start()
+    return controller
+
+
+def _summary_ms(samples):
+    """Format p50 / p95 / max of latency samples given in seconds"""
+    if not samples:
+        return "n/a"
+    samples = sorted(samples)
+    p50 = samples[len(samples) // 2]
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return f"p50 {p50 * 1000:.1f} ms, p95 {p95 * 1000:.1f} ms, max {samples[-1] * 1000:.1f} ms"
+
+
+def _synthetic_scores(rng):
+    from data.dimensions import QUESTION_IDS
+    from utils.scoring import compute_scores
+    return compute_scores({q: rng.randint(1, 5) for q in QUESTION_IDS})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--emails', type=int, default=200, help='completion emails to send')
+    parser.add_argument('--threads', type=int, default=8, help='concurrent simulated users')
+    parser.add_argument('--timeout', type=float, default=300, help='seconds to wait for delivery')
+    parser.add_argument('--smtpd', action='store_true', help='start an aiosmtpd sink on SMTP_HOST:SMTP_PORT')
+    parser.add_argument('--allow-gmail', action='store_true', help='allow load testing the real Gmail transport')
+    parser.add_argument('--isolated-db', action='store_true',
+                        help='confirm DATABASE_URL is a test database no app outbox worker reads from')
+    args = parser.parse_args(argv)
+
+    from utils import email_outbox, mail_transport
+    from utils.gmail_sender import send_assessment_completion_email
+
+    if mail_transport.MAIL_TRANSPORT == 'gmail' and not args.allow_gmail:
+        print("MAIL_TRANSPORT is gmail; set MAIL_TRANSPORT=smtp|file|memory (or pass --allow-gmail)")
+        return 1
+    if os.environ.get('DATABASE_URL') and not args.isolated_db:
+        print("DATABASE_URL is set: app outbox workers on that database would deliver the test emails "
+              "for real. Point it at a throwaway database and pass --isolated-db, or unset it to test "
+              "the inline path.")
+        return 1
+
+    controller = _start_smtpd(mail_transport.SMTP_HOST, mail_transport.SMTP_PORT) if args.smtpd else None
+    try:
+        if os.environ.get('DATABASE_URL'):
+            from db.operations import ensure_tables_exist
+            ensure_tables_exist()
+        else:
+            print("DATABASE_URL not set: sending inline without the outbox")
+            email_outbox.EMAIL_OUTBOX_ENABLED = False
+        # Measure per-email delivery, not digest batching
+        email_outbox.ADMIN_NOTIFICATION_MODE = 'immediate'
+        mail_transport.reset_send_metrics()
+
+        rng = random.Random(0)
+        scores = [_synthetic_scores(rng) for _ in range(min(args.emails, 50))]
+        enqueue_latencies = []
+        latency_lock = threading.Lock()
+
+        def simulate_user(i):
+            start = time.perf_counter()
+            send_assessment_completion_email(
+                user_name=f"Load Test {i}",
+                user_email=f"loadtest{i}@example.com",
+                user_title="Tester",
+                user_company="Load Test Co",
+                user_phone="",
+                user_location="",
+                ai_stage="Exploring",
+                assessment_results=scores[i % len(scores)]
+            )
+            with latency_lock:
+                enqueue_latencies.append(time.perf_counter() - start)
+
+        print(f"Transport: {mail_transport.MAIL_TRANSPORT}, emails: {args.emails}, threads: {args.threads}")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            list(pool.map(simulate_user, range(args.emails)))
+        enqueue_seconds = time.perf_counter() - start
+        print(f"User-facing call: {_summary_ms(enqueue_latencies)} ({enqueue_seconds:.2f} s total)")
+
+        # Wait for the outbox worker to hand every email to the transport
+        deadline = time.perf_counter() + args.timeout
+        while True:
+            stats = mail_transport.get_send_metrics().get(mail_transport.get_transport().name, {})
+            done = stats.get('sent', 0) + stats.get('failed', 0)
+            if done >= args.emails or time.perf_counter() > deadline:
+                break
+            time.sleep(0.05)
+        delivery_seconds = time.perf_counter() - start
+
+        print(f"Delivered: {stats.get('sent', 0)} sent, {stats.get('failed', 0)} failed "
+              f"in {delivery_seconds:.2f} s ({done / delivery_seconds:.1f} emails/s)")
+        if stats:
+            print(f"Per-send latency: mean {stats['mean_ms']:.1f} ms, p50 {stats['p50_ms']:.1f} ms, "
+                  f"p95 {stats['p95_ms']:.1f} ms, p99 {stats['p99_ms']:.1f} ms, max {stats['max_ms']:.1f} ms")
+        return 0 if done >= args.emails and not stats.get('failed') else 1
+    finally:
+        if controller is not None:
+            controller.stop()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""
+Pluggable mail transports for AI Process Readiness Assessment
+
+Every email leaves through send_message(), which hands it to the transport
+selected by MAIL_TRANSPORT and records per-send latency:
+
+    gmail   Gmail API through the Replit connector (default)
+    smtp    Any SMTP server, e.g. a local aiosmtpd stand-in for load tests
+    file    Writes each message as an .eml file to MAIL_SINK_DIR
+    memory  Keeps the most recent messages in process (tests, offline runs)
+
+Load-test the email path end to end with:  python -m utils.mail_loadtest
+"""
+import os
+import smtplib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime
+
+# gmail, smtp, file or memory
+MAIL_TRANSPORT = os.environ.get('MAIL_TRANSPORT', 'gmail').lower()
+
+# SMTP transport settings
+SMTP_HOST = os.environ.get('SMTP_HOST', 'localhost')
+SMTP_PORT = int(os.environ.get('SMTP_PORT', '25'))
+SMTP_USERNAME = os.environ.get('SMTP_USERNAME')
+SMTP_PASSWORD = os.environ.get('SMTP_PASSWORD')
+SMTP_STARTTLS = os.environ.get('SMTP_STARTTLS', 'false').lower() in ('1', 'true', 'yes')
+SMTP_TIMEOUT_SECONDS = float(os.environ.get('SMTP_TIMEOUT_SECONDS', '30'))
+# Sender address used when callers pass 'me' (the Gmail API's authenticated user)
+MAIL_FROM_ADDRESS = os.environ.get('MAIL_FROM_ADDRESS', 'assessment@tlogic.consulting')
+
+# Directory for the file transport
+MAIL_SINK_DIR = os.environ.get('MAIL_SINK_DIR', 'mail_sink')
+# Messages kept by the memory transport
+MAIL_MEMORY_SINK_SIZE = int(os.environ.get('MAIL_MEMORY_SINK_SIZE', '1000'))
+
+# Latency samples kept per transport for percentiles
+MAIL_METRICS_WINDOW = int(os.environ.get('MAIL_METRICS_WINDOW', '1000'))
+
+
+class MailTransport(ABC):
+    """Base class: deliver one email and report (success, message) like send_email"""
+
+    name = 'base'
+
+    @abstractmethod
+    def send(self, to_email, subject, body_text, body_html=None, from_email='me'):
+        """Deliver one email; returns (success, message)"""
+
+    @staticmethod
+    def sender_address(from_email):
+        """Resolve the Gmail-style 'me' sender to a real address for non-Gmail transports"""
+        return MAIL_FROM_ADDRESS if from_email == 'me' else from_email
+
+
+class GmailTransport(MailTransport):
+    """Gmail API through the Replit connector"""
+
+    name = 'gmail'
+
+    def send(self, to_email, subject, body_text, body_html=None, from_email='me'):
+        from utils.gmail_sender import send_gmail_message
+        return send_gmail_message(to_email, subject, body_text, body_html, from_email)
+
+
+class SmtpTransport(MailTransport):
+    """SMTP with one reusable connection per sending thread"""
+
+    name = 'smtp'
+
+    def __init__(self, host=SMTP_HOST, port=SMTP_PORT, username=SMTP_USERNAME, password=SMTP_PASSWORD,
+                 starttls=SMTP_STARTTLS, timeout=SMTP_TIMEOUT_SECONDS):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            smtp.starttls()
+        if self.username:
+            smtp.login(self.username, self.password or '')
+        return smtp
+
+    def _close(self):
+        smtp = getattr(self._local, 'smtp', None)
+        self._local.smtp = None
+        if smtp is not None:
+            try:
+                smtp.close()
+            except Exception:
+                pass
+
+    def send(self, to_email, subject, body_text, body_html=None, from_email='me'):
+        from utils.gmail_sender import build_mime_message
+
+        sender = self.sender_address(from_email)
+        message = build_mime_message(sender, to_email, subject, body_text, body_html)
+        # One retry on a fresh connection: the server may have closed an idle one
+        for attempt in range(2):
+            try:
+                smtp = getattr(self._local, 'smtp', None)
+                if smtp is None:
+                    smtp = self._local.smtp = self._connect()
+                smtp.send_message(message, from_addr=sender, to_addrs=[to_email])
+                return True, f"Email sent via SMTP {self.host}:{self.port}"
+            except smtplib.SMTPServerDisconnected as e:
+                self._close()
+                if attempt:
+                    return False, f"SMTP error: {e}"
+            except (smtplib.SMTPException, OSError) as e:
+                self._close()
+                return False, f"SMTP error: {e}"
+
+
+class FileTransport(MailTransport):
+    """Writes each message to MAIL_SINK_DIR as an .eml file"""
+
+    name = 'file'
+
+    def __init__(self, directory=MAIL_SINK_DIR):
+        self.directory = directory
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def send(self, to_email, subject, body_text, body_html=None, from_email='me'):
+        from utils.gmail_sender import build_mime_message
+
+        message = build_mime_message(self.sender_address(from_email), to_email, subject, body_text, body_html)
+        with self._lock:
+            self._counter += 1
+            counter = self._counter
+        file_name = f"{datetime.utcnow():%Y%m%dT%H%M%S%f}-{os.getpid()}-{counter}.eml"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, file_name), 'wb') as f:
+                f.write(message.as_bytes())
+        except OSError as e:
+            return False, f"Error writing email file: {e}"
+        return True, f"Email written to {os.path.join(self.directory, file_name)}"
+
+
+class MemoryTransport(MailTransport):
+    """Keeps the most recent messages in memory"""
+
+    name = 'memory'
+
+    def __init__(self, size=MAIL_MEMORY_SINK_SIZE):
+        self.messages = deque(maxlen=size)
+
+    def send(self, to_email, subject, body_text, body_html=None, from_email='me'):
+        self.messages.append({
+            'to_email': to_email,
+            'from_email': self.sender_address(from_email),
+            'subject': subject,
+            'body_text': body_text,
+            'body_html': body_html,
+            'sent_at': datetime.utcnow()
+        })
+        return True, "Email stored in memory sink"
+
+
+TRANSPORTS = {
+    'gmail': GmailTransport,
+    'smtp': SmtpTransport,
+    'file': FileTransport,
+    'memory': MemoryTransport,
+}
+
+_transport = None
+_transport_lock = threading.Lock()
+
+# transport name -> {'sent', 'failed', 'total_seconds', 'max_seconds', 'latencies' (recent samples)}
+_metrics = {}
+_metrics_lock = threading.Lock()
+
+
+def get_transport():
+    """Get the process-wide transport selected by MAIL_TRANSPORT"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                transport_class = TRANSPORTS.get(MAIL_TRANSPORT)
+                if transport_class is None:
+                    raise ValueError(f"Unknown MAIL_TRANSPORT: {MAIL_TRANSPORT} "
+                                     f"(expected one of {', '.join(TRANSPORTS)})")
+                _transport = transport_class()
+    return _transport
+
+
+def set_transport(transport):
+    """Replace the process-wide transport (e.g. a MemoryTransport for a load test)"""
+    global _transport
+    with _transport_lock:
+        _transport = transport
+
+
+def _record_send(name, seconds, success):
+    with _metrics_lock:
+        stats = _metrics.get(name)
+        if stats is None:
+            stats = _metrics[name] = {
+                'sent': 0, 'failed': 0, 'total_seconds': 0.0, 'max_seconds': 0.0,
+                'latencies': deque(maxlen=MAIL_METRICS_WINDOW)
+            }
+        stats['sent' if success else 'failed'] += 1
+        stats['total_seconds'] += seconds
+        stats['max_seconds'] = max(stats['max_seconds'], seconds)
+        stats['latencies'].append(seconds)
+
+
+def send_message(to_email, subject, body_text, body_html=None, from_email='me'):
+    """
+    Send an email through the configured transport, recording its latency.
+
+    Returns:
+        Tuple of (success, message)
+    """
+    transport = get_transport()
+    start = time.perf_counter()
+    try:
+        success, message = transport.send(to_email, subject, body_text, body_html, from_email)
+    except Exception as e:
+        success, message = False, f"Error sending email: {e}"
+    _record_send(transport.name, time.perf_counter() - start, success)
+    return success, message
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def get_send_metrics():
+    """
+    Get per-transport send metrics for this process.
+
+    Returns:
+        Dictionary of transport name -> {sent, failed, mean_ms, p50_ms, p95_ms, p99_ms, max_ms};
+        percentiles cover the last MAIL_METRICS_WINDOW sends
+    """
+    with _metrics_lock:
+        snapshot = {name: dict(stats, latencies=sorted(stats['latencies'])) for name, stats in _metrics.items()}
+
+    metrics = {}
+    for name, stats in snapshot.items():
+        count = stats['sent'] + stats['failed']
+        latencies = stats['latencies']
+        metrics[name] = {
+            'sent': stats['sent'],
+            'failed': stats['failed'],
+            'mean_ms': stats['total_seconds'] / count * 1000 if count else 0.0,
+            'p50_ms': _percentile(latencies, 0.50) * 1000 if latencies else 0.0,
+            'p95_ms': _percentile(latencies, 0.95) * 1000 if latencies else 0.0,
+            'p99_ms': _percentile(latencies, 0.99) * 1000 if latencies else 0.0,
+            'max_ms': stats['max_seconds'] * 1000,
+        }
+    return metrics
+
+
+def reset_send_metrics():
+    """Clear the recorded send metrics"""
+    with _metrics_lock:
+        _metrics.clear()
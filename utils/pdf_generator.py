@@ -2,7 +2,7 @@
 """
 PDF generator for T-Logic AI-Enabled Process Readiness reports.
 
-Call generate_pdf_report(results: dict, logo_path: str = "/static/TLogic_Logo4.png")
+Call generate_pdf_report(results: dict, logo_path: str = "/static/TLogic_Logo4.png", logo_png: bytes = None)
 It returns bytes which can be written to a file or streamed to a web frontend.
 
 Expected `results` structure (example):
@@ -28,15 +28,12 @@ from __future__ import annotations
 import io
 import os
 import math
-import tempfile
 from typing import Dict, Any, List, Optional
 
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.lib import colors
 from reportlab.lib.utils import ImageReader
-import matplotlib.pyplot as plt
-import numpy as np
 
 # ------------------------
 # Color and baseline config
@@ -74,7 +71,20 @@ COMPANY_COPY = "T-Logic Consulting Pvt. Ltd."
 # ------------------------
 # Helper drawing functions
 # ------------------------
-def _draw_header_footer(c: canvas.Canvas, title: str, logo_path: Optional[str], page_num: int) -> None:
+def _load_logo(logo_path: Optional[str], logo_png: Optional[bytes]) -> Optional[ImageReader]:
+    """Decode the report logo once (pre-encoded PNG bytes take precedence over a file path)."""
+    try:
+        if logo_png:
+            return ImageReader(io.BytesIO(logo_png))
+        if logo_path and os.path.isfile(logo_path):
+            return ImageReader(logo_path)
+    except Exception:
+        # silently continue without a logo
+        pass
+    return None
+
+
+def _draw_header_footer(c: canvas.Canvas, title: str, logo: Optional[ImageReader], page_num: int) -> None:
     """Draw top header band + logo and bottom footer (site, company centered, page number right)."""
     width, height = A4
     # header band (dark blue)
@@ -87,10 +97,9 @@ def _draw_header_footer(c: canvas.Canvas, title: str, logo_path: Optional[str],
     c.drawString(36, height - 44, title)
 
     # logo at top-right (fit to 90x60)
-    if logo_path and os.path.isfile(logo_path):
+    if logo is not None:
         try:
-            img = ImageReader(logo_path)
-            c.drawImage(img, width - 140, height - 66, width=100, height=48, preserveAspectRatio=True, mask="auto")
+            c.drawImage(logo, width - 140, height - 66, width=100, height=48, preserveAspectRatio=True, mask="auto")
         except Exception:
             # silently continue if image fails
             pass
@@ -190,40 +199,111 @@ def _draw_dimension_bars(c: canvas.Canvas, scores: Dict[str, float], start_x: in
     return int(y)
 
 
-def _plot_difference_chart(dimension_scores: Dict[str, float], baseline: Dict[str, float]) -> str:
+def _difference_percentages(dimension_scores: Dict[str, float], baseline: Dict[str, float]) -> List[float]:
     """
-    Create a difference chart (bars showing user score vs baseline as difference % or absolute).
-    Returns a path to a PNG file.
-    We'll draw a bar showing difference in percent (user - baseline) / baseline * 100.
+    Differences in percent relative to baseline: (user - baseline) / baseline * 100.
+    Dimensions without a baseline get 0.0 (avoid divide by zero).
     """
-    dims = list(dimension_scores.keys())
-    user_vals = [float(dimension_scores[d]) for d in dims]
-    base_vals = [float(baseline.get(d, 0.0)) for d in dims]
-
-    # differences in percentage points relative to baseline (avoid divide by zero)
     diffs = []
-    for u, b in zip(user_vals, base_vals):
+    for d, score in dimension_scores.items():
+        b = float(baseline.get(d, 0.0))
         if b == 0:
             diffs.append(0.0)
         else:
-            diffs.append((u - b) / b * 100.0)
-
-    # plot
-    fig, ax = plt.subplots(figsize=(7.2, 2.2))  # wide, short
-    indices = np.arange(len(dims))
-    bar_colors = [PASTEL_COLORS.get(d, "#888888") for d in dims]
-    ax.bar(indices, diffs, color=bar_colors, edgecolor="#333333")
-    ax.axhline(0, color="#222222", linewidth=0.6)
-    ax.set_xticks(indices)
-    ax.set_xticklabels(dims, rotation=30, ha="right", fontsize=9)
-    ax.set_ylabel("Difference vs baseline (%)", fontsize=9)
-    ax.grid(axis="y", linestyle=":", linewidth=0.6, alpha=0.6)
-
-    plt.tight_layout()
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    fig.savefig(tmp.name, dpi=150)
-    plt.close(fig)
-    return tmp.name
+            diffs.append((float(score) - b) / b * 100.0)
+    return diffs
+
+
+def _nice_step(span: float, target_ticks: int = 5) -> float:
+    """Round a raw tick step up to 1, 2 or 5 times a power of ten."""
+    raw = span / max(1, target_ticks)
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for m in (1, 2, 5, 10):
+        if raw <= m * magnitude:
+            return m * magnitude
+    return 10 * magnitude
+
+
+def _draw_difference_chart(
+    c: canvas.Canvas,
+    dimension_scores: Dict[str, float],
+    baseline: Dict[str, float],
+    x: float,
+    y: float,
+    w: float,
+    h: float,
+) -> None:
+    """
+    Draw the benchmark difference bar chart (user score vs baseline, in %) as vector
+    graphics directly on the canvas. (x, y) is the bottom-left corner of the chart area.
+    """
+    dims = list(dimension_scores.keys())
+    diffs = _difference_percentages(dimension_scores, baseline)
+
+    # plot area inside the chart box (room for y tick labels and rotated x labels)
+    left, bottom = x + 48, y + 58
+    plot_w, plot_h = w - 56, h - 64
+
+    lo, hi = min(diffs + [0.0]), max(diffs + [0.0])
+    if hi - lo == 0:
+        lo, hi = -10.0, 10.0
+    step = _nice_step(hi - lo)
+    lo = math.floor(lo / step) * step
+    hi = math.ceil(hi / step) * step
+
+    def to_y(value: float) -> float:
+        return bottom + (value - lo) / (hi - lo) * plot_h
+
+    # horizontal grid + y tick labels
+    c.setFont("Helvetica", 7)
+    c.setLineWidth(0.5)
+    c.setDash(1, 2)
+    tick = lo
+    while tick <= hi + step / 2:
+        ty = to_y(tick)
+        c.setStrokeColor(colors.HexColor("#BBBBBB"))
+        c.line(left, ty, left + plot_w, ty)
+        c.setFillColor(colors.HexColor("#333333"))
+        c.drawRightString(left - 4, ty - 2.5, f"{tick:g}")
+        tick += step
+    c.setDash()
+
+    # y axis label
+    c.saveState()
+    c.translate(x + 10, bottom + plot_h / 2.0)
+    c.rotate(90)
+    c.setFont("Helvetica", 8)
+    c.drawCentredString(0, 0, "Difference vs baseline (%)")
+    c.restoreState()
+
+    # bars
+    slot = plot_w / max(1, len(dims))
+    bar_w = slot * 0.8
+    zero_y = to_y(0.0)
+    c.setStrokeColor(colors.HexColor("#333333"))
+    c.setLineWidth(0.5)
+    for i, (dim, diff) in enumerate(zip(dims, diffs)):
+        bx = left + i * slot + (slot - bar_w) / 2.0
+        c.setFillColor(colors.HexColor(PASTEL_COLORS.get(dim, "#888888")))
+        c.rect(bx, min(zero_y, to_y(diff)), bar_w, abs(to_y(diff) - zero_y), fill=1, stroke=1)
+
+        # x label, rotated and right-aligned under the bar centre
+        c.saveState()
+        c.translate(bx + bar_w / 2.0, bottom - 6)
+        c.rotate(30)
+        c.setFillColor(colors.HexColor("#222222"))
+        c.setFont("Helvetica", 8)
+        c.drawRightString(0, 0, dim)
+        c.restoreState()
+
+    # zero line
+    c.setStrokeColor(colors.HexColor("#222222"))
+    c.setLineWidth(0.6)
+    c.line(left, zero_y, left + plot_w, zero_y)
+
+    # reset stroke defaults for later drawing
+    c.setStrokeColor(colors.black)
+    c.setLineWidth(1)
 
 
 def _draw_recommendations(c: canvas.Canvas, recommendations: Dict[str, List[str]], start_x: int, start_y: int) -> int:
@@ -263,9 +343,12 @@ def _draw_recommendations(c: canvas.Canvas, recommendations: Dict[str, List[str]
 def generate_pdf_report(
     results: Dict[str, Any],
     logo_path: str = "/static/TLogic_Logo4.png",
+    logo_png: Optional[bytes] = None,
 ) -> bytes:
     """
     Main entrypoint. Returns PDF as bytes.
+
+    logo_png: pre-encoded logo PNG (e.g. from utils.logo_assets); used instead of logo_path when given.
     """
     # Validate minimal structure
     if not isinstance(results, dict):
@@ -304,6 +387,9 @@ def generate_pdf_report(
     company_name = results.get("company_name", results.get("company", "[Your Company]"))
     page_title = f"AI-Enabled Process Readiness Assessment — {company_name}"
 
+    # Logo is decoded once and drawn on every page
+    logo = _load_logo(logo_path, logo_png)
+
     # Canvas
     buffer = io.BytesIO()
     c = canvas.Canvas(buffer, pagesize=A4)
@@ -312,7 +398,7 @@ def generate_pdf_report(
     try:
         page = 1
         # ----- PAGE 1: TITLE + EXEC SUMMARY + SCORING MODEL -----
-        _draw_header_footer(c, page_title, logo_path, page)
+        _draw_header_footer(c, page_title, logo, page)
         c.setFont("Helvetica-Bold", 16)
         c.setFillColor(colors.HexColor("#111111"))
         c.drawString(36, height - 110, "Executive Summary")
@@ -379,16 +465,14 @@ def generate_pdf_report(
         page += 1
 
         # ----- PAGE 2: DIMENSION BREAKDOWN + BENCHMARK DIFF -----
-        _draw_header_footer(c, page_title, logo_path, page)
+        _draw_header_footer(c, page_title, logo, page)
         # draw dimension bars
         y_after = _draw_dimension_bars(c, dimension_scores, 36, int(height - 120))
 
-        # Add industry benchmark difference chart
-        chart_path = _plot_difference_chart(dimension_scores, BASELINE_DIMENSION_AVG)
-        # place chart below bars
+        # Add industry benchmark difference chart (vector, drawn below bars)
         img_w = width - 72
         img_h = 160
-        c.drawImage(chart_path, 36, y_after - img_h - 12, width=img_w, height=img_h, preserveAspectRatio=True, mask="auto")
+        _draw_difference_chart(c, dimension_scores, BASELINE_DIMENSION_AVG, 36, y_after - img_h - 12, img_w, img_h)
 
         # small footnote about benchmark derivation
         footnote = "Industry baseline derived from initial sample (20 participants) and will update as sample grows."
@@ -400,19 +484,12 @@ def generate_pdf_report(
         page += 1
 
         # ----- PAGE 3: RECOMMENDATIONS -----
-        _draw_header_footer(c, page_title, logo_path, page)
+        _draw_header_footer(c, page_title, logo, page)
         _draw_recommendations(c, recommendations, 36, int(height - 120))
 
         c.showPage()
         c.save()
 
-        # cleanup temporary files (chart)
-        try:
-            if os.path.exists(chart_path):
-                os.remove(chart_path)
-        except Exception:
-            pass
-
         pdf_bytes = buffer.getvalue()
         buffer.close()
         return pdf_bytes
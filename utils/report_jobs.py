@@ -0,0 +1,234 @@
+"""
+Background report generation for AI Process Readiness Assessment
+
+PDF and HTML reports are rendered in a process pool so a slow render never
+blocks a Streamlit session. Jobs are identified by a hash of their inputs,
+so identical requests are rendered once and later submissions return
+immediately.
+
+Finished reports are written by the worker to a size-bounded cache
+directory under static/, named by the hash of their bytes. Streamlit's
+static file endpoint (server.enableStaticServing) serves them in chunks
+with ETag and Range support, so report bytes never sit in the server's
+memory or in a session - a session only keeps the job id / URL.
+
+Usage:
+    job_id = submit_report_job('html', scores_data=..., company_name=...)
+    job = get_report_job(job_id)   # poll until job['status'] != 'pending'
+    job['url']                     # relative download URL once done
+"""
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Number of worker processes rendering reports
+REPORT_WORKERS = int(os.environ.get('REPORT_WORKERS', '2'))
+# Directory served by Streamlit's static file endpoint (next to app.py)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+# Finished reports live in this subdirectory of static/ so they can be served from there
+REPORT_CACHE_SUBDIR = 'reports'
+REPORT_CACHE_DIR = os.path.join(STATIC_DIR, REPORT_CACHE_SUBDIR)
+# Maximum total size of cached report files; least recently used are deleted first
+REPORT_CACHE_MAX_BYTES = int(float(os.environ.get('REPORT_CACHE_MAX_MB', '256')) * 1024 * 1024)
+
+# Report kind -> file extension
+REPORT_KINDS = {'html': '.html', 'pdf': '.pdf'}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# job id -> file name of the rendered report in REPORT_CACHE_DIR
+_artifacts = {}
+# job id -> Future for jobs still rendering
+_pending = {}
+# job id -> error message for jobs that failed
+_failures = {}
+_store_lock = threading.Lock()
+
+
+def _render_report(kind, kwargs, cache_dir):
+    """
+    Render one report inside a worker process and write it to the cache directory.
+
+    Returns:
+        File name of the report inside cache_dir (hash of its bytes plus extension)
+    """
+    if kind == 'html':
+        from utils.html_report_generator import generate_html_report
+        data = generate_html_report(**kwargs).encode('utf-8')
+    elif kind == 'pdf':
+        from utils.pdf_generator import generate_pdf_report
+        data = generate_pdf_report(**kwargs)
+    else:
+        raise ValueError(f"Unknown report kind: {kind}")
+
+    file_name = hashlib.sha256(data).hexdigest() + REPORT_KINDS[kind]
+    path = os.path.join(cache_dir, file_name)
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write under a temporary name so the endpoint never serves a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return file_name
+
+
+def _get_executor():
+    """Get the process pool, starting it on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # spawn: the Streamlit server is multi-threaded, so forking it is unsafe
+            _executor = ProcessPoolExecutor(
+                max_workers=REPORT_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _executor
+
+
+def _reset_executor():
+    """Drop a broken process pool so the next job starts a fresh one"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def report_job_id(kind, kwargs):
+    """Content address of a report: hash of its kind and rendering inputs"""
+    payload = json.dumps([kind, kwargs], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _evict_reports(keep):
+    """
+    Delete least recently used report files until the cache fits REPORT_CACHE_MAX_BYTES.
+    Call with _store_lock held.
+    """
+    try:
+        entries = []
+        with os.scandir(REPORT_CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.name))
+    except FileNotFoundError:
+        return
+
+    total = sum(size for _, size, _ in entries)
+    removed = set()
+    for _, size, name in sorted(entries):
+        if total <= REPORT_CACHE_MAX_BYTES:
+            break
+        if name == keep:
+            continue
+        try:
+            os.remove(os.path.join(REPORT_CACHE_DIR, name))
+        except FileNotFoundError:
+            pass
+        removed.add(name)
+        total -= size
+
+    if removed:
+        for job_id, file_name in list(_artifacts.items()):
+            if file_name in removed:
+                del _artifacts[job_id]
+
+
+def _on_job_done(job_id, future):
+    """Record a finished job's report file (runs in the pool's callback thread)"""
+    try:
+        file_name = future.result()
+    except Exception as e:
+        print(f"Error rendering report {job_id[:12]}: {e}")
+        if isinstance(e, BrokenProcessPool):
+            _reset_executor()
+        with _store_lock:
+            _pending.pop(job_id, None)
+            _failures[job_id] = str(e)
+        return
+
+    with _store_lock:
+        _pending.pop(job_id, None)
+        _artifacts[job_id] = file_name
+        _evict_reports(keep=file_name)
+
+
+def submit_report_job(kind, **kwargs):
+    """
+    Queue a report for rendering, reusing a finished or in-flight identical job.
+
+    Args:
+        kind: 'html' (generate_html_report) or 'pdf' (generate_pdf_report)
+        **kwargs: Arguments for the generator; must be picklable
+
+    Returns:
+        Job id to poll with get_report_job
+    """
+    if kind not in REPORT_KINDS:
+        raise ValueError(f"Unknown report kind: {kind}")
+
+    job_id = report_job_id(kind, kwargs)
+    with _store_lock:
+        if job_id in _pending or _report_path(job_id):
+            return job_id
+        _failures.pop(job_id, None)
+
+        try:
+            future = _get_executor().submit(_render_report, kind, kwargs, REPORT_CACHE_DIR)
+        except BrokenProcessPool:
+            _reset_executor()
+            future = _get_executor().submit(_render_report, kind, kwargs, REPORT_CACHE_DIR)
+        _pending[job_id] = future
+
+    future.add_done_callback(lambda f: _on_job_done(job_id, f))
+    return job_id
+
+
+def _report_path(job_id):
+    """Path of a finished job's report file, or None if unknown or evicted (call with _store_lock held)"""
+    file_name = _artifacts.get(job_id)
+    if file_name is None:
+        return None
+    path = os.path.join(REPORT_CACHE_DIR, file_name)
+    if not os.path.exists(path):
+        # Evicted from the disk cache (possibly by another app process)
+        del _artifacts[job_id]
+        return None
+    return path
+
+
+def get_report_job(job_id):
+    """
+    Get the state of a report job.
+
+    Returns:
+        Dictionary with status ('pending', 'done', 'failed' or 'unknown'),
+        path (report file) and url (relative static URL) when done,
+        size in bytes when done, and error (message) when failed
+    """
+    job = {'status': 'unknown', 'path': None, 'url': None, 'size': None, 'error': None}
+    with _store_lock:
+        path = _report_path(job_id)
+        if path is not None:
+            try:
+                # Mark as recently used so eviction keeps reports sessions still link to
+                os.utime(path)
+                size = os.path.getsize(path)
+            except FileNotFoundError:
+                _artifacts.pop(job_id, None)
+                return job
+            file_name = _artifacts[job_id]
+            job.update(status='done', path=path, size=size,
+                       url=f"app/static/{REPORT_CACHE_SUBDIR}/{file_name}")
+        elif job_id in _pending:
+            job['status'] = 'pending'
+        elif job_id in _failures:
+            job.update(status='failed', error=_failures[job_id])
+    return job
@@ -3,7 +3,11 @@ Scoring utilities for the AI Process Readiness Assessment
 Simplified approach: Direct sum of raw scores with critical dimension warnings
 """
 
-from data.dimensions import DIMENSIONS
+from data.dimensions import (QUESTIONS_BY_DIMENSION, QUESTION_IDS, QUESTION_COLUMNS,
+                             QUESTION_INDEX, DIMENSION_QUESTION_STARTS)
+
+# Readiness band thresholds on the total score, highest first (mirrors get_readiness_band)
+_READINESS_THRESHOLDS = (70, 56, 42)
 
 
 def compute_scores(answers):
@@ -24,11 +28,11 @@ def compute_scores(answers):
     raw_dimension_scores = []
     
     # Calculate raw scores for each dimension
-    for dimension in DIMENSIONS:
+    for questions in QUESTIONS_BY_DIMENSION:
         dim_total = 0
         question_count = 0
         
-        for question in dimension['questions']:
+        for question in questions:
             question_id = question['id']
             if question_id in answers:
                 dim_total += answers[question_id]
@@ -238,3 +242,212 @@ def generate_executive_summary(scores_data):
     summary += " For detailed recommendations on improving each dimension, see below. We're here to help—please reach out if you'd like to discuss your results or need guidance."
     
     return summary
+
+
+def _answers_matrix(answer_sets):
+    """
+    Convert answer sets into an (N, Q) float matrix in QUESTION_IDS column order.
+    Unanswered questions are NaN.
+    """
+    import numpy as np
+
+    if isinstance(answer_sets, np.ndarray):
+        matrix = np.asarray(answer_sets, dtype=float)
+        if matrix.ndim != 2 or matrix.shape[1] != len(QUESTION_IDS):
+            raise ValueError(f"answers matrix must have shape (N, {len(QUESTION_IDS)})")
+        return matrix
+
+    if hasattr(answer_sets, 'columns'):
+        # pandas DataFrame with question ids as columns
+        matrix = np.full((len(answer_sets), len(QUESTION_IDS)), np.nan)
+        for question_id in answer_sets.columns:
+            col = QUESTION_COLUMNS.get(question_id)
+            if col is not None:
+                matrix[:, col] = answer_sets[question_id].to_numpy(dtype=float, na_value=np.nan)
+        return matrix
+
+    answer_sets = list(answer_sets)
+    matrix = np.full((len(answer_sets), len(QUESTION_IDS)), np.nan)
+    for row, answers in enumerate(answer_sets):
+        for question_id, value in answers.items():
+            col = QUESTION_COLUMNS.get(question_id)
+            if col is not None:
+                matrix[row, col] = value
+    return matrix
+
+
+def compute_scores_batch(answer_sets):
+    """
+    Score many answer sets at once with vectorized NumPy operations.
+    
+    Args:
+        answer_sets: List of answers dicts, a pandas DataFrame with question IDs
+            as columns, or an (N, Q) NumPy matrix in QUESTION_IDS order (NaN = unanswered)
+    
+    Returns:
+        Dictionary of arrays with one entry per answer set: raw_dimension_scores (N, 6),
+        total, percentage, readiness_band (labels), critical_status ('stop', 'warning'
+        or 'ready'), data_readiness and leadership. Use batch_scores_to_dicts() to get
+        the exact compute_scores() output for each row.
+    """
+    import numpy as np  # only needed for batch scoring
+
+    matrix = _answers_matrix(answer_sets)
+    
+    # Dimension raw scores: sum of answered questions (unanswered count as 0).
+    # Columns follow QUESTION_IDS, so each dimension's questions are contiguous.
+    answered = np.nan_to_num(matrix, nan=0.0)
+    dimension_sums = np.add.reduceat(answered, list(DIMENSION_QUESTION_STARTS), axis=1)
+    if np.array_equal(answered, np.round(answered)):
+        # Whole-number ratings: keep integer scores, as compute_scores() does for int answers
+        raw_dimension_scores = dimension_sums.astype(int)
+        total = raw_dimension_scores.sum(axis=1)
+    else:
+        raw_dimension_scores = np.round(dimension_sums, 1)
+        total = np.round(raw_dimension_scores.sum(axis=1), 1)
+    percentage = np.round((total / 90) * 100).astype(int)
+    
+    band_index = (total[:, None] < np.array(_READINESS_THRESHOLDS)).sum(axis=1)
+    readiness_band = np.array(_READINESS_LABELS, dtype=object)[band_index]
+    
+    data_readiness = raw_dimension_scores[:, 2]
+    leadership = raw_dimension_scores[:, 4]
+    data_low = data_readiness < 9
+    leadership_low = leadership < 9
+    critical_status = np.where(
+        data_low & leadership_low, 'stop',
+        np.where(data_low | leadership_low, 'warning', 'ready')
+    )
+    
+    return {
+        'raw_dimension_scores': raw_dimension_scores,
+        'total': total,
+        'percentage': percentage,
+        'readiness_band': readiness_band,
+        'critical_status': critical_status,
+        'data_readiness': data_readiness,
+        'leadership': leadership
+    }
+
+
+def batch_scores_to_dicts(batch):
+    """
+    Expand compute_scores_batch() output into per-row dictionaries
+    identical to compute_scores() output.
+    
+    Args:
+        batch: Dictionary returned by compute_scores_batch
+    
+    Returns:
+        List of score dictionaries
+    """
+    results = []
+    for raw, total, percentage in zip(batch['raw_dimension_scores'].tolist(),
+                                      batch['total'].tolist(),
+                                      batch['percentage'].tolist()):
+        results.append({
+            'raw_dimension_scores': raw,
+            'dimension_scores': raw,  # Same as raw (no weighting)
+            'total': total,
+            'percentage': percentage,
+            'readiness_band': get_readiness_band(total),
+            'critical_status': get_critical_dimension_status(raw[2], raw[4]),
+            'data_readiness': raw[2],
+            'leadership': raw[4]
+        })
+    return results
+
+
+# Band labels in threshold order (AI-Ready, Building Blocks, Foundational Gaps, Not Ready)
+_READINESS_LABELS = tuple(
+    get_readiness_band(threshold)['label'] for threshold in _READINESS_THRESHOLDS + (0,)
+)
+
+
+class ScoreTracker:
+    """
+    Incremental score accumulator for a live assessment.
+    
+    Keeps per-dimension sums and answer counts up to date as individual
+    answers change, so the current scores never need a full re-aggregation.
+    snapshot() returns the same dictionary compute_scores() would for the
+    answers recorded so far.
+    """
+    
+    def __init__(self, answers=None):
+        self.answers = {}
+        self.dimension_totals = [0] * len(QUESTIONS_BY_DIMENSION)
+        self.dimension_counts = [0] * len(QUESTIONS_BY_DIMENSION)
+        self._snapshot = None
+        for question_id, rating in (answers or {}).items():
+            self.set_answer(question_id, rating)
+    
+    @property
+    def answered_count(self):
+        """Number of assessment questions answered"""
+        return len(self.answers)
+    
+    def set_answer(self, question_id, rating):
+        """Record or change the rating for one question (ignores unknown question IDs)"""
+        location = QUESTION_INDEX.get(question_id)
+        if location is None:
+            return
+        dim_idx = location[0]
+        previous = self.answers.get(question_id)
+        if previous is None:
+            self.dimension_counts[dim_idx] += 1
+        elif previous == rating:
+            return
+        else:
+            self.dimension_totals[dim_idx] -= previous
+        self.dimension_totals[dim_idx] += rating
+        self.answers[question_id] = rating
+        self._snapshot = None
+    
+    def remove_answer(self, question_id):
+        """Forget the rating for one question"""
+        rating = self.answers.pop(question_id, None)
+        if rating is None:
+            return
+        dim_idx = QUESTION_INDEX[question_id][0]
+        self.dimension_totals[dim_idx] -= rating
+        self.dimension_counts[dim_idx] -= 1
+        self._snapshot = None
+    
+    def dimension_averages(self):
+        """Average rating (1-5) per dimension, None where nothing is answered yet"""
+        return [
+            total / count if count else None
+            for total, count in zip(self.dimension_totals, self.dimension_counts)
+        ]
+    
+    def snapshot(self):
+        """
+        Get the current scores.
+        
+        Returns:
+            Dictionary identical to compute_scores() output for the recorded answers
+        """
+        if self._snapshot is None:
+            raw_dimension_scores = [
+                round(total if count > 0 else 0, 1)
+                for total, count in zip(self.dimension_totals, self.dimension_counts)
+            ]
+            total_score_rounded = round(sum(raw_dimension_scores), 1)
+            self._snapshot = {
+                'raw_dimension_scores': raw_dimension_scores,
+                'total': total_score_rounded,
+                'percentage': round((total_score_rounded / 90) * 100),
+                'readiness_band': get_readiness_band(total_score_rounded),
+                'critical_status': get_critical_dimension_status(raw_dimension_scores[2], raw_dimension_scores[4]),
+                'data_readiness': raw_dimension_scores[2],
+                'leadership': raw_dimension_scores[4]
+            }
+        
+        # Fresh containers so callers can modify the result without touching the cache
+        scores = dict(self._snapshot)
+        scores['raw_dimension_scores'] = list(scores['raw_dimension_scores'])
+        scores['dimension_scores'] = scores['raw_dimension_scores']  # Same as raw (no weighting)
+        scores['readiness_band'] = dict(scores['readiness_band'])
+        scores['critical_status'] = dict(scores['critical_status'])
+        return scores
@@ -0,0 +1,42 @@
+"""
+Check that a Gmail API 401 triggers exactly one token refresh and one retry.
+
+No network access or Replit connector is needed: the token fetch and the
+HTTP transport are faked.  Run with:  python -m utils.test_gmail_sender
+"""
+import json
+import time
+
+import httplib2
+
+from utils import gmail_sender
+
+token_fetches = []
+requests_seen = []
+
+
+def fake_fetch_token():
+    token_fetches.append(time.time())
+    return f"token-{len(token_fetches)}", time.time() + 3600
+
+
+def fake_request(self, uri, method='GET', body=None, headers=None, *args, **kwargs):
+    authorization = (headers or {}).get('authorization') or (headers or {}).get('Authorization')
+    requests_seen.append(authorization)
+    # The first token is "revoked": the API rejects it
+    if authorization == 'Bearer token-1':
+        return httplib2.Response({'status': '401'}), b'{"error": {"code": 401, "message": "Invalid Credentials"}}'
+    return httplib2.Response({'status': '200'}), json.dumps({'id': 'message-1'}).encode()
+
+
+gmail_sender._fetch_gmail_access_token = fake_fetch_token
+httplib2.Http.request = fake_request
+
+success, message = gmail_sender.send_gmail_message('user@example.com', 'Subject', 'Body')
+print(success, message)
+
+assert success, message
+assert len(token_fetches) == 2, f"expected one initial fetch and one refresh, got {len(token_fetches)} fetches"
+assert requests_seen == ['Bearer token-1', 'Bearer token-2'], f"expected one retry, got {requests_seen}"
+assert gmail_sender.get_gmail_access_token() == 'token-2', "refreshed token should be cached"
+print("401 handling OK: 1 refresh, 1 retry")
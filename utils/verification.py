@@ -0,0 +1,263 @@
+"""
+Server-side email verification codes for AI Process Readiness Assessment
+
+Codes are kept in the verification_codes table instead of the Streamlit
+session, so a code sent by one server process can be checked by another
+(e.g. after a reconnect lands the user on a different worker). Only a
+salted SHA-256 hash of each code is stored. Each email may receive one code
+per VERIFICATION_RESEND_INTERVAL_SECONDS and VERIFICATION_MAX_SENDS per
+VERIFICATION_SEND_WINDOW_SECONDS, and a code is locked after
+VERIFICATION_MAX_ATTEMPTS wrong guesses.
+
+Without a database (or with VERIFICATION_STORE=memory) the same rules are
+applied by an in-process LRU store, which only works within one process.
+"""
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+# Seconds a verification code stays valid
+VERIFICATION_CODE_TTL_SECONDS = int(os.environ.get('VERIFICATION_CODE_TTL_SECONDS', '600'))
+# Wrong guesses allowed per code before the user must request a new one
+VERIFICATION_MAX_ATTEMPTS = int(os.environ.get('VERIFICATION_MAX_ATTEMPTS', '5'))
+# Minimum seconds between two codes sent to the same email
+VERIFICATION_RESEND_INTERVAL_SECONDS = float(os.environ.get('VERIFICATION_RESEND_INTERVAL_SECONDS', '30'))
+# Codes sent to the same email per throttling window
+VERIFICATION_MAX_SENDS = int(os.environ.get('VERIFICATION_MAX_SENDS', '5'))
+VERIFICATION_SEND_WINDOW_SECONDS = float(os.environ.get('VERIFICATION_SEND_WINDOW_SECONDS', '3600'))
+# 'auto' (database when DATABASE_URL is set, else memory), 'database' or 'memory'
+VERIFICATION_STORE = os.environ.get('VERIFICATION_STORE', 'auto').lower()
+# Emails tracked by the in-process store (least recently used are dropped)
+VERIFICATION_MEMORY_STORE_SIZE = int(os.environ.get('VERIFICATION_MEMORY_STORE_SIZE', '10000'))
+
+# Seconds between purges of expired codes from the database
+_PURGE_INTERVAL_SECONDS = 3600
+
+
+def normalize_email(email: str) -> str:
+    """Normalize an email address so each mailbox has one code and one throttle"""
+    return (email or '').strip().lower()
+
+
+def hash_code(email: str, code: str, salt: str) -> str:
+    """Salted SHA-256 of a verification code, bound to the email it was sent to"""
+    return hashlib.sha256(f"{salt}:{email}:{code}".encode()).hexdigest()
+
+
+class _DatabaseStore:
+    """Codes in the verification_codes table, shared by every server process"""
+
+    name = 'database'
+
+    def __init__(self):
+        self._last_purge = None
+        self._lock = threading.Lock()
+
+    def store(self, email, code_hash, salt):
+        from db.operations import store_verification_code
+        self._purge_expired()
+        return store_verification_code(
+            email, code_hash, salt, VERIFICATION_CODE_TTL_SECONDS, VERIFICATION_RESEND_INTERVAL_SECONDS,
+            VERIFICATION_MAX_SENDS, VERIFICATION_SEND_WINDOW_SECONDS
+        )
+
+    def release(self, email, code_hash):
+        from db.operations import release_verification_send
+        return release_verification_send(email, code_hash, VERIFICATION_RESEND_INTERVAL_SECONDS)
+
+    def claim_attempt(self, email):
+        from db.operations import claim_verification_attempt
+        return claim_verification_attempt(email, VERIFICATION_MAX_ATTEMPTS)
+
+    def consume(self, email, code_hash):
+        from db.operations import consume_verification_code
+        return consume_verification_code(email, code_hash)
+
+    def _purge_expired(self):
+        """Delete codes whose throttling window has also passed, at most once per interval"""
+        now = time.monotonic()
+        with self._lock:
+            if self._last_purge is not None and now - self._last_purge < _PURGE_INTERVAL_SECONDS:
+                return
+            self._last_purge = now
+        try:
+            from db.operations import purge_expired_verification_codes
+            purge_expired_verification_codes(
+                datetime.utcnow() - timedelta(seconds=VERIFICATION_SEND_WINDOW_SECONDS)
+            )
+        except Exception as e:
+            print(f"Error purging expired verification codes: {e}")
+
+
+class _MemoryStore:
+    """Codes in a process-local LRU, with the same rules as the database store"""
+
+    name = 'memory'
+
+    def __init__(self, size=VERIFICATION_MEMORY_STORE_SIZE):
+        self.size = size
+        # email -> {'code_hash', 'salt', 'expires_at', 'attempts', 'sent_count', 'window_started_at', 'last_sent_at'}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def store(self, email, code_hash, salt):
+        now = datetime.utcnow()
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None:
+                entry = self._entries[email] = {'sent_count': 0, 'window_started_at': now}
+            else:
+                wait = (entry['last_sent_at'] + timedelta(seconds=VERIFICATION_RESEND_INTERVAL_SECONDS) - now)\
+                    .total_seconds()
+                window_end = entry['window_started_at'] + timedelta(seconds=VERIFICATION_SEND_WINDOW_SECONDS)
+                if window_end <= now:
+                    entry['window_started_at'], entry['sent_count'] = now, 0
+                elif entry['sent_count'] >= VERIFICATION_MAX_SENDS:
+                    wait = max(wait, (window_end - now).total_seconds())
+                if wait > 0:
+                    return wait
+            entry.update(code_hash=code_hash, salt=salt, attempts=0, last_sent_at=now,
+                         expires_at=now + timedelta(seconds=VERIFICATION_CODE_TTL_SECONDS),
+                         sent_count=entry['sent_count'] + 1)
+            self._entries.move_to_end(email)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+        return 0.0
+
+    def release(self, email, code_hash):
+        now = datetime.utcnow()
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None or entry.get('code_hash') != code_hash:
+                return False
+            entry.update(expires_at=now, sent_count=entry['sent_count'] - 1,
+                         last_sent_at=now - timedelta(seconds=VERIFICATION_RESEND_INTERVAL_SECONDS))
+        return True
+
+    def claim_attempt(self, email):
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None:
+                return {'status': 'missing'}
+            if entry['expires_at'] <= datetime.utcnow():
+                return {'status': 'expired'}
+            if entry['attempts'] >= VERIFICATION_MAX_ATTEMPTS:
+                return {'status': 'locked'}
+            entry['attempts'] += 1
+            return {'status': 'ok', 'code_hash': entry['code_hash'], 'salt': entry['salt'],
+                    'attempts': entry['attempts']}
+
+    def consume(self, email, code_hash):
+        now = datetime.utcnow()
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None or entry['code_hash'] != code_hash or entry['expires_at'] <= now:
+                return False
+            entry['expires_at'] = now
+        return True
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Get the process-wide verification code store selected by VERIFICATION_STORE"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                use_database = VERIFICATION_STORE == 'database' or (
+                    VERIFICATION_STORE == 'auto' and bool(os.environ.get('DATABASE_URL'))
+                )
+                _store = _DatabaseStore() if use_database else _MemoryStore()
+    return _store
+
+
+def _format_wait(seconds: float) -> str:
+    seconds = int(seconds + 0.999)
+    if seconds < 60:
+        return f"{seconds} second{'s' if seconds != 1 else ''}"
+    minutes = (seconds + 59) // 60
+    return f"{minutes} minute{'s' if minutes != 1 else ''}"
+
+
+def send_verification_code(email: str):
+    """
+    Issue a new verification code for an email and send it.
+
+    The previous code for the email is replaced. Requests beyond the
+    per-email send limits are refused without sending anything, and a send
+    that fails is not counted against those limits.
+
+    Args:
+        email: Address to verify
+
+    Returns:
+        Tuple of (success, message)
+    """
+    from utils.gmail_sender import generate_verification_code, send_verification_code_email
+
+    email = normalize_email(email)
+    if not email:
+        return False, "Please enter your email address."
+
+    code = generate_verification_code()
+    salt = secrets.token_hex(16)
+    code_hash = hash_code(email, code, salt)
+    try:
+        store = get_store()
+        wait = store.store(email, code_hash, salt)
+    except Exception as e:
+        print(f"Error storing verification code: {e}")
+        return False, "Verification is temporarily unavailable. Please try again shortly."
+    if wait > 0:
+        return False, f"A code was sent to this address recently. Please wait {_format_wait(wait)} before requesting another."
+
+    success, message = send_verification_code_email(
+        email, code, valid_minutes=max(1, VERIFICATION_CODE_TTL_SECONDS // 60))
+    if not success:
+        # Nothing reached the user: don't count this send against their limits
+        try:
+            store.release(email, code_hash)
+        except Exception as e:
+            print(f"Error releasing verification send for {email}: {e}")
+    return success, message
+
+
+def check_verification_code(email: str, code: str):
+    """
+    Check a code entered by the user. A correct code can only be used once.
+
+    Returns:
+        Tuple of (success, message)
+    """
+    email = normalize_email(email)
+    code = (code or '').strip()
+    try:
+        store = get_store()
+        attempt = store.claim_attempt(email)
+        if attempt['status'] == 'missing':
+            return False, "No verification code was requested for this email. Please request a new code."
+        if attempt['status'] == 'expired':
+            return False, "This verification code has expired or was already used. Please request a new code."
+        if attempt['status'] == 'locked':
+            return False, "Too many incorrect attempts. Please request a new code."
+
+        if not hmac.compare_digest(hash_code(email, code, attempt['salt']), attempt['code_hash']):
+            remaining = VERIFICATION_MAX_ATTEMPTS - attempt['attempts']
+            if remaining <= 0:
+                return False, "Too many incorrect attempts. Please request a new code."
+            return False, f"Invalid verification code. {remaining} attempt{'s' if remaining != 1 else ''} left."
+
+        if not store.consume(email, attempt['code_hash']):
+            return False, "This verification code has already been used. Please request a new code."
+        return True, "Email verified"
+    except Exception as e:
+        print(f"Error checking verification code: {e}")
+        return False, "Verification is temporarily unavailable. Please try again shortly."